@@ -0,0 +1,67 @@
+"""Benchmark the FMI bridge by driving built FMUs through the C driver in `driver/`.
+
+Build the driver first:
+
+    cmake -S benchmarks/driver -B build-bench -DCMAKE_BUILD_TYPE=Release
+    cmake --build build-bench --config Release
+
+Usage: python benchmarks/bench_fmi.py --driver build-bench/bench_fmi [-o results.json] [--quick]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+from common import MODELS, write_report
+
+from pythonfmu3 import FmuBuilder
+from pythonfmu3.builder import get_model_description
+
+MODEL_TYPES = {"cs": "benchslave.py", "me": "benchme.py"}
+
+
+def extract_fmu(script: Path, dest: Path):
+    """Build and extract the FMU of `script`; return the path to its shared library and resources."""
+    fmu = FmuBuilder.build_FMU(script, dest=dest)
+    folder = dest / fmu.stem
+    with zipfile.ZipFile(fmu) as files:
+        files.extractall(folder)
+    model_identifier, _ = get_model_description(script, script.stem)
+    library = next(f for f in (folder / "binaries").rglob(f"{model_identifier}.*"))
+    return library, folder / "resources"
+
+
+def run(driver: Path, scale: float = 1.0):
+    # The embedded interpreter must find the same packages as the current one
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for model_type, script in MODEL_TYPES.items():
+            library, resources = extract_fmu(MODELS / script, Path(tmp))
+            output = subprocess.run(
+                [str(driver), model_type, str(library), str(resources), str(scale)],
+                env=env, check=True, stdout=subprocess.PIPE, universal_newlines=True
+            ).stdout
+            for result in json.loads(output):
+                result["params"]["interface"] = model_type
+                results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--driver", required=True, help="Path to the bench_fmi executable")
+    parser.add_argument("-o", "--output", help="JSON file to write the results to (default stdout)", default=None)
+    parser.add_argument("--quick", action="store_true", help="Run 100x fewer iterations, e.g. for smoke testing")
+    options = parser.parse_args()
+    write_report("fmi", run(Path(options.driver).absolute(), 0.01 if options.quick else 1.0), options.output)
+
+
+if __name__ == "__main__":
+    main()
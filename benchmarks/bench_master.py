@@ -0,0 +1,107 @@
+"""Benchmark the throughput of the asyncio co-simulation master of pythonfmu3.
+
+Chains (each model feeds the next one) and independent groups of `BenchGain` models are stepped by a
+hand-written sequential loop (the reference), by the master with in-process models and by the master
+with one worker process per model, which overlaps the steps of the independent models.
+
+Usage: python benchmarks/bench_master.py [-o results.json] [--quick]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import Any, Callable, Dict
+
+from common import MODELS, write_report
+
+from pythonfmu3.builder import instantiate_slave
+from pythonfmu3.master import CoSimulationMaster
+
+sys.path.insert(0, str(MODELS))
+
+from benchgain import BenchGain  # noqa: E402
+
+SCRIPT = MODELS / "benchgain.py"
+STEP_SIZE = 1e-3
+# (topology, number of models, work per step) combinations
+CASES = (("chain", 1, 0), ("chain", 8, 0), ("chain", 32, 0), ("chain", 8, 20000), ("parallel", 8, 20000))
+
+
+def sequential(topology: str, n_models: int, work: int, n_steps: int) -> float:
+    slaves = [BenchGain(instance_name=f"m{i}") for i in range(n_models)]
+    for slave in slaves:
+        slave.work = work
+    t = 0.0
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        for upstream, slave in zip([None] + slaves, slaves):
+            if upstream is not None and topology == "chain":
+                slave.set_float64([0], upstream.get_float64([1]))
+            slave.do_step(t, STEP_SIZE)
+        t += STEP_SIZE
+    return time.perf_counter() - start
+
+
+async def master(topology: str, n_models: int, work: int, n_steps: int, processes: bool) -> float:
+    m = CoSimulationMaster()
+    for i in range(n_models):
+        if processes:
+            m.add_process_slave(f"m{i}", SCRIPT)
+        else:
+            m.add_slave(f"m{i}", instantiate_slave(SCRIPT, SCRIPT.stem, instance_name=f"m{i}"))
+        m.set_start_value(f"m{i}", "work", work)
+        if i > 0 and topology == "chain":
+            m.connect(f"m{i - 1}", "y", f"m{i}", "u")
+
+    # Only the communication steps are timed, not the start of the worker processes
+    await m.start(0.0)
+    try:
+        t = 0.0
+        start = time.perf_counter()
+        for _ in range(n_steps):
+            await m.step(t, STEP_SIZE)
+            t += STEP_SIZE
+        return time.perf_counter() - start
+    finally:
+        await m.stop()
+
+
+def measure_throughput(name: str, func: Callable[[int], float], n_steps: int, repeat: int = 3, **params) -> Dict[str, Any]:
+    """Run `func(n_steps)`, which returns the time spent stepping, and report the communication steps per second."""
+    samples = sorted(n_steps / func(n_steps) for _ in range(repeat))
+    return {
+        "name": name,
+        "params": params,
+        "steps": n_steps,
+        "repeat": repeat,
+        "min": samples[0],
+        "median": samples[len(samples) // 2],
+        "max": samples[-1],
+        "unit": "steps/s",
+    }
+
+
+def run(scale: float = 1.0):
+    def n(number: int) -> int:
+        return max(1, int(number * scale))
+
+    results = []
+    for topology, n_models, work in CASES:
+        steps = n(20000 // n_models) if work == 0 else n(200)
+        params = dict(topology=topology, models=n_models, work=work)
+        results.append(measure_throughput("sequential", lambda n_steps: sequential(topology, n_models, work, n_steps), steps, **params))
+        results.append(measure_throughput("master_local", lambda n_steps: asyncio.run(master(topology, n_models, work, n_steps, False)), steps, **params))
+        results.append(measure_throughput("master_processes", lambda n_steps: asyncio.run(master(topology, n_models, work, n_steps, True)), steps, **params))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="JSON file to write the results to (default stdout)", default=None)
+    parser.add_argument("--quick", action="store_true", help="Run 100x fewer iterations, e.g. for smoke testing")
+    options = parser.parse_args()
+    write_report("master", run(0.01 if options.quick else 1.0), options.output)
+
+
+if __name__ == "__main__":
+    main()
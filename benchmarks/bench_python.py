@@ -0,0 +1,72 @@
+"""Benchmark the Python facade of pythonfmu3 without going through the FMI bridge.
+
+These timings are the reference the FMI bridge overhead (see `bench_fmi.py`) is measured against.
+
+Usage: python benchmarks/bench_python.py [-o results.json] [--quick]
+"""
+import argparse
+import sys
+
+from common import MODELS, measure, write_report
+
+sys.path.insert(0, str(MODELS))
+
+from benchme import BenchME, N_STATES  # noqa: E402
+from benchslave import ARRAY_SIZES, N_SCALARS, BenchSlave  # noqa: E402
+
+SCALAR_COUNTS = (1, 8, N_SCALARS)
+
+
+def run(scale: float = 1.0):
+    def n(number: int) -> int:
+        return max(1, int(number * scale))
+
+    results = []
+    results.append(measure("instantiate", lambda: BenchSlave(instance_name="bench"), n(100)))
+
+    slave = BenchSlave(instance_name="bench")
+    slave.enter_initialization_mode()
+    slave.exit_initialization_mode()
+
+    for count in SCALAR_COUNTS:
+        vrs = list(range(count))
+        values = [1.0] * count
+        results.append(measure("get_float64", lambda: slave.get_float64(vrs), n(10000), nvr=count))
+        results.append(measure("set_float64", lambda: slave.set_float64(vrs, values), n(10000), nvr=count))
+
+    for i, size in enumerate(ARRAY_SIZES):
+        vrs = [N_SCALARS + i]
+        values = [1.0] * size
+        results.append(measure("get_float64_array", lambda: slave.get_float64(vrs), n(1000), size=size))
+        results.append(measure("set_float64_array", lambda: slave.set_float64(vrs, values), n(1000), size=size))
+
+    results.append(measure("do_step", lambda: slave.do_step(0.0, 1e-3), n(100000)))
+
+    state = slave._get_fmu_state()
+    serialized = slave._fmu_state_to_bytes(state)
+    results.append(measure("get_fmu_state", slave._get_fmu_state, n(1000)))
+    results.append(measure("set_fmu_state", lambda: slave._set_fmu_state(state), n(1000)))
+    results.append(measure("serialize_fmu_state", lambda: slave._fmu_state_to_bytes(slave._get_fmu_state()), n(1000), bytes=len(serialized)))
+    results.append(measure("deserialize_fmu_state", lambda: slave._set_fmu_state(slave._fmu_state_from_bytes(serialized)), n(1000), bytes=len(serialized)))
+
+    model = BenchME(instance_name="bench")
+    states = [1.0] * N_STATES
+
+    def rhs():
+        model.set_continuous_states(states)
+        return model.get_continuous_state_derivatives()
+
+    results.append(measure("me_rhs", rhs, n(10000), n_states=N_STATES))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="JSON file to write the results to (default stdout)", default=None)
+    parser.add_argument("--quick", action="store_true", help="Run 100x fewer iterations, e.g. for smoke testing")
+    options = parser.parse_args()
+    write_report("python", run(0.01 if options.quick else 1.0), options.output)
+
+
+if __name__ == "__main__":
+    main()
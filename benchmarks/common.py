@@ -0,0 +1,56 @@
+"""Helpers shared by the benchmark scripts."""
+import datetime
+import json
+import platform
+import statistics
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pythonfmu3
+
+MODELS = Path(__file__).parent / "models"
+
+
+def metadata() -> Dict[str, Any]:
+    return {
+        "pythonfmu3": pythonfmu3.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def measure(name: str, func: Callable[[], Any], number: int, repeat: int = 5, **params) -> Dict[str, Any]:
+    """Time `func` and return a result entry; times are per call, in seconds.
+
+    Args:
+        name (str) : Benchmark name
+        func (Callable) : Function to time, called without arguments
+        number (int) : Number of calls per sample
+        repeat (int) : Number of samples
+        **params : Benchmark parameters recorded with the result
+    """
+    samples = [t / number for t in timeit.Timer(func).repeat(repeat=repeat, number=number)]
+    return {
+        "name": name,
+        "params": params,
+        "number": number,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "max": max(samples),
+    }
+
+
+def write_report(suite: str, results: List[Dict[str, Any]], output: Optional[str] = None):
+    """Write the results as JSON to `output`, or to the standard output if None."""
+    report = {"suite": suite, "metadata": metadata(), "results": results}
+    text = json.dumps(report, indent=2)
+    if output is None:
+        sys.stdout.write(text + "\n")
+    else:
+        Path(output).write_text(text + "\n")
@@ -0,0 +1,350 @@
+/*
+ * Benchmark driver calling the FMI functions of a pythonfmu3 shared library directly.
+ *
+ * Usage: bench_fmi cs|me LIBRARY RESOURCES [SCALE]
+ *
+ * LIBRARY is the shared library of an extracted FMU built from models/benchslave.py (cs)
+ * or models/benchme.py (me), RESOURCES its resources folder. SCALE multiplies the number
+ * of iterations (default 1). The results are written to the standard output as a JSON array.
+ */
+#include "fmi3FunctionTypes.h"
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#ifdef _WIN32
+#    include <windows.h>
+#    define LOAD_LIBRARY(path) LoadLibraryA(path)
+#    define GET_SYMBOL(lib, name) ((void*)GetProcAddress((HMODULE)(lib), name))
+#else
+#    include <dlfcn.h>
+#    include <time.h>
+#    define LOAD_LIBRARY(path) dlopen(path, RTLD_NOW | RTLD_LOCAL)
+#    define GET_SYMBOL(lib, name) dlsym(lib, name)
+#endif
+
+/* Layout of the benchmark models, see models/benchslave.py and models/benchme.py */
+#define N_SCALARS 64
+#define N_ARRAYS 3
+static const size_t ARRAY_SIZES[N_ARRAYS] = {16, 256, 4096};
+#define N_STATES 32
+
+#define REPEAT 5
+
+static double now(void)
+{
+#ifdef _WIN32
+    LARGE_INTEGER frequency, counter;
+    QueryPerformanceFrequency(&frequency);
+    QueryPerformanceCounter(&counter);
+    return (double)counter.QuadPart / (double)frequency.QuadPart;
+#else
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + 1e-9 * (double)ts.tv_nsec;
+#endif
+}
+
+static struct {
+    fmi3InstantiateCoSimulationTYPE* instantiateCoSimulation;
+    fmi3InstantiateModelExchangeTYPE* instantiateModelExchange;
+    fmi3FreeInstanceTYPE* freeInstance;
+    fmi3EnterInitializationModeTYPE* enterInitializationMode;
+    fmi3ExitInitializationModeTYPE* exitInitializationMode;
+    fmi3EnterContinuousTimeModeTYPE* enterContinuousTimeMode;
+    fmi3TerminateTYPE* terminate;
+    fmi3GetFloat64TYPE* getFloat64;
+    fmi3SetFloat64TYPE* setFloat64;
+    fmi3DoStepTYPE* doStep;
+    fmi3GetFMUStateTYPE* getFMUState;
+    fmi3SetFMUStateTYPE* setFMUState;
+    fmi3FreeFMUStateTYPE* freeFMUState;
+    fmi3SerializedFMUStateSizeTYPE* serializedFMUStateSize;
+    fmi3SerializeFMUStateTYPE* serializeFMUState;
+    fmi3DeserializeFMUStateTYPE* deserializeFMUState;
+    fmi3SetTimeTYPE* setTime;
+    fmi3SetContinuousStatesTYPE* setContinuousStates;
+    fmi3GetContinuousStateDerivativesTYPE* getContinuousStateDerivatives;
+} fmi;
+
+static const char* library_path;
+static const char* resources;
+static fmi3Instance instance;
+static int first_result = 1;
+
+static void fail(const char* what)
+{
+    fprintf(stderr, "bench_fmi: %s\n", what);
+    exit(1);
+}
+
+static void check(fmi3Status status, const char* what)
+{
+    if (status > fmi3Warning) fail(what);
+}
+
+static void log_message(fmi3InstanceEnvironment env, fmi3Status status, fmi3String category, fmi3String message)
+{
+    (void)env;
+    (void)category;
+    if (status > fmi3Warning) fprintf(stderr, "bench_fmi: [%d] %s\n", (int)status, message);
+}
+
+static void* load_symbol(void* lib, const char* name)
+{
+    void* symbol = GET_SYMBOL(lib, name);
+    if (symbol == NULL) {
+        fprintf(stderr, "bench_fmi: missing symbol %s\n", name);
+        exit(1);
+    }
+    return symbol;
+}
+
+static void load(const char* path)
+{
+    void* lib = LOAD_LIBRARY(path);
+    if (lib == NULL) {
+#ifdef _WIN32
+        fail("cannot load the shared library");
+#else
+        fail(dlerror());
+#endif
+    }
+    fmi.instantiateCoSimulation = load_symbol(lib, "fmi3InstantiateCoSimulation");
+    fmi.instantiateModelExchange = load_symbol(lib, "fmi3InstantiateModelExchange");
+    fmi.freeInstance = load_symbol(lib, "fmi3FreeInstance");
+    fmi.enterInitializationMode = load_symbol(lib, "fmi3EnterInitializationMode");
+    fmi.exitInitializationMode = load_symbol(lib, "fmi3ExitInitializationMode");
+    fmi.enterContinuousTimeMode = load_symbol(lib, "fmi3EnterContinuousTimeMode");
+    fmi.terminate = load_symbol(lib, "fmi3Terminate");
+    fmi.getFloat64 = load_symbol(lib, "fmi3GetFloat64");
+    fmi.setFloat64 = load_symbol(lib, "fmi3SetFloat64");
+    fmi.doStep = load_symbol(lib, "fmi3DoStep");
+    fmi.getFMUState = load_symbol(lib, "fmi3GetFMUState");
+    fmi.setFMUState = load_symbol(lib, "fmi3SetFMUState");
+    fmi.freeFMUState = load_symbol(lib, "fmi3FreeFMUState");
+    fmi.serializedFMUStateSize = load_symbol(lib, "fmi3SerializedFMUStateSize");
+    fmi.serializeFMUState = load_symbol(lib, "fmi3SerializeFMUState");
+    fmi.deserializeFMUState = load_symbol(lib, "fmi3DeserializeFMUState");
+    fmi.setTime = load_symbol(lib, "fmi3SetTime");
+    fmi.setContinuousStates = load_symbol(lib, "fmi3SetContinuousStates");
+    fmi.getContinuousStateDerivatives = load_symbol(lib, "fmi3GetContinuousStateDerivatives");
+}
+
+static fmi3Instance instantiate_cs(void)
+{
+    return fmi.instantiateCoSimulation("bench", "", resources, fmi3False, fmi3False, fmi3False, fmi3False,
+        NULL, 0, NULL, log_message, NULL);
+}
+
+static fmi3Instance instantiate_me(void)
+{
+    return fmi.instantiateModelExchange("bench", "", resources, fmi3False, fmi3False, NULL, log_message);
+}
+
+static int compare(const void* a, const void* b)
+{
+    double x = *(const double*)a, y = *(const double*)b;
+    return (x > y) - (x < y);
+}
+
+/* Time `number` calls of `func` REPEAT times and print a result entry; times are per call, in seconds. */
+static void measure(const char* name, const char* params, void (*func)(void*), void* context, long number)
+{
+    double samples[REPEAT];
+    for (int r = 0; r < REPEAT; r++) {
+        double start = now();
+        for (long i = 0; i < number; i++) func(context);
+        samples[r] = (now() - start) / (double)number;
+    }
+    qsort(samples, REPEAT, sizeof(double), compare);
+
+    printf("%s\n  {\"name\": \"%s\", \"params\": {%s}, \"number\": %ld, \"repeat\": %d, "
+           "\"min\": %.9e, \"median\": %.9e, \"max\": %.9e}",
+        first_result ? "" : ",", name, params, number, REPEAT, samples[0], samples[REPEAT / 2], samples[REPEAT - 1]);
+    first_result = 0;
+}
+
+typedef struct {
+    fmi3ValueReference vrs[N_SCALARS];
+    size_t nvr;
+    fmi3Float64* values;
+    size_t nValues;
+} Float64Call;
+
+static void get_float64(void* context)
+{
+    Float64Call* call = context;
+    check(fmi.getFloat64(instance, call->vrs, call->nvr, call->values, call->nValues), "fmi3GetFloat64");
+}
+
+static void set_float64(void* context)
+{
+    Float64Call* call = context;
+    check(fmi.setFloat64(instance, call->vrs, call->nvr, call->values, call->nValues), "fmi3SetFloat64");
+}
+
+static void do_step(void* context)
+{
+    fmi3Float64* time = context;
+    fmi3Boolean eventHandlingNeeded, terminateSimulation, earlyReturn;
+    fmi3Float64 lastSuccessfulTime;
+    check(fmi.doStep(instance, *time, 1e-3, fmi3True, &eventHandlingNeeded, &terminateSimulation, &earlyReturn,
+              &lastSuccessfulTime),
+        "fmi3DoStep");
+    *time += 1e-3;
+}
+
+static void instantiate_free(void* context)
+{
+    fmi3Instance (*instantiate)(void) = (fmi3Instance (*)(void))context;
+    fmi3Instance other = instantiate();
+    if (other == NULL) fail("instantiation failed");
+    fmi.freeInstance(other);
+}
+
+static void get_fmu_state(void* context)
+{
+    (void)context;
+    fmi3FMUState state = NULL;
+    check(fmi.getFMUState(instance, &state), "fmi3GetFMUState");
+    check(fmi.freeFMUState(instance, &state), "fmi3FreeFMUState");
+}
+
+static void set_fmu_state(void* context)
+{
+    check(fmi.setFMUState(instance, *(fmi3FMUState*)context), "fmi3SetFMUState");
+}
+
+typedef struct {
+    fmi3FMUState state;
+    fmi3Byte* bytes;
+    size_t size;
+} Serialized;
+
+static void serialize_fmu_state(void* context)
+{
+    Serialized* s = context;
+    size_t size;
+    check(fmi.serializedFMUStateSize(instance, s->state, &size), "fmi3SerializedFMUStateSize");
+    check(fmi.serializeFMUState(instance, s->state, s->bytes, size), "fmi3SerializeFMUState");
+}
+
+static void deserialize_fmu_state(void* context)
+{
+    Serialized* s = context;
+    fmi3FMUState state = NULL;
+    check(fmi.deserializeFMUState(instance, s->bytes, s->size, &state), "fmi3DeserializeFMUState");
+    check(fmi.freeFMUState(instance, &state), "fmi3FreeFMUState");
+}
+
+static void me_rhs(void* context)
+{
+    fmi3Float64* states = context;
+    fmi3Float64 derivatives[N_STATES];
+    check(fmi.setContinuousStates(instance, states, N_STATES), "fmi3SetContinuousStates");
+    check(fmi.getContinuousStateDerivatives(instance, derivatives, N_STATES), "fmi3GetContinuousStateDerivatives");
+}
+
+static long scaled(double scale, long number)
+{
+    long n = (long)(scale * (double)number);
+    return n > 0 ? n : 1;
+}
+
+static void run_cs(double scale)
+{
+    char params[64];
+
+    measure("instantiate", "", instantiate_free, (void*)instantiate_cs, scaled(scale, 100));
+
+    instance = instantiate_cs();
+    if (instance == NULL) fail("instantiation failed");
+    check(fmi.enterInitializationMode(instance, fmi3False, 0.0, 0.0, fmi3False, 0.0), "fmi3EnterInitializationMode");
+    check(fmi.exitInitializationMode(instance), "fmi3ExitInitializationMode");
+
+    static const size_t counts[] = {1, 8, N_SCALARS};
+    fmi3Float64 scalars[N_SCALARS] = {0};
+    for (size_t c = 0; c < sizeof(counts) / sizeof(counts[0]); c++) {
+        Float64Call call = {.nvr = counts[c], .values = scalars, .nValues = counts[c]};
+        for (size_t i = 0; i < counts[c]; i++) call.vrs[i] = (fmi3ValueReference)i;
+        snprintf(params, sizeof(params), "\"nvr\": %zu", counts[c]);
+        measure("get_float64", params, get_float64, &call, scaled(scale, 10000));
+        measure("set_float64", params, set_float64, &call, scaled(scale, 10000));
+    }
+
+    for (size_t a = 0; a < N_ARRAYS; a++) {
+        Float64Call call = {.nvr = 1, .nValues = ARRAY_SIZES[a]};
+        call.vrs[0] = (fmi3ValueReference)(N_SCALARS + a);
+        call.values = calloc(ARRAY_SIZES[a], sizeof(fmi3Float64));
+        snprintf(params, sizeof(params), "\"size\": %zu", ARRAY_SIZES[a]);
+        measure("get_float64_array", params, get_float64, &call, scaled(scale, 1000));
+        measure("set_float64_array", params, set_float64, &call, scaled(scale, 1000));
+        free(call.values);
+    }
+
+    fmi3Float64 time = 0.0;
+    measure("do_step", "", do_step, &time, scaled(scale, 10000));
+
+    Serialized s = {NULL, NULL, 0};
+    check(fmi.getFMUState(instance, &s.state), "fmi3GetFMUState");
+    check(fmi.serializedFMUStateSize(instance, s.state, &s.size), "fmi3SerializedFMUStateSize");
+    s.bytes = malloc(s.size);
+    check(fmi.serializeFMUState(instance, s.state, s.bytes, s.size), "fmi3SerializeFMUState");
+    snprintf(params, sizeof(params), "\"bytes\": %zu", s.size);
+
+    measure("get_fmu_state", "", get_fmu_state, NULL, scaled(scale, 1000));
+    measure("set_fmu_state", "", set_fmu_state, &s.state, scaled(scale, 1000));
+    measure("serialize_fmu_state", params, serialize_fmu_state, &s, scaled(scale, 1000));
+    measure("deserialize_fmu_state", params, deserialize_fmu_state, &s, scaled(scale, 1000));
+
+    check(fmi.freeFMUState(instance, &s.state), "fmi3FreeFMUState");
+    free(s.bytes);
+    check(fmi.terminate(instance), "fmi3Terminate");
+    fmi.freeInstance(instance);
+}
+
+static void run_me(double scale)
+{
+    char params[64];
+
+    measure("instantiate", "", instantiate_free, (void*)instantiate_me, scaled(scale, 100));
+
+    instance = instantiate_me();
+    if (instance == NULL) fail("instantiation failed");
+    check(fmi.enterInitializationMode(instance, fmi3False, 0.0, 0.0, fmi3False, 0.0), "fmi3EnterInitializationMode");
+    check(fmi.exitInitializationMode(instance), "fmi3ExitInitializationMode");
+    check(fmi.enterContinuousTimeMode(instance), "fmi3EnterContinuousTimeMode");
+    check(fmi.setTime(instance, 0.0), "fmi3SetTime");
+
+    fmi3Float64 states[N_STATES];
+    for (size_t i = 0; i < N_STATES; i++) states[i] = 1.0;
+    snprintf(params, sizeof(params), "\"n_states\": %d", N_STATES);
+    measure("me_rhs", params, me_rhs, states, scaled(scale, 10000));
+
+    check(fmi.terminate(instance), "fmi3Terminate");
+    fmi.freeInstance(instance);
+}
+
+int main(int argc, char** argv)
+{
+    if (argc < 4 || (strcmp(argv[1], "cs") != 0 && strcmp(argv[1], "me") != 0)) {
+        fprintf(stderr, "usage: %s cs|me LIBRARY RESOURCES [SCALE]\n", argv[0]);
+        return 2;
+    }
+    library_path = argv[2];
+    resources = argv[3];
+    double scale = argc > 4 ? atof(argv[4]) : 1.0;
+
+    load(library_path);
+
+    printf("[");
+    if (strcmp(argv[1], "cs") == 0) {
+        run_cs(scale);
+    } else {
+        run_me(scale);
+    }
+    printf("\n]\n");
+    return 0;
+}
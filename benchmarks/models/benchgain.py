@@ -0,0 +1,26 @@
+from pythonfmu3 import Fmi3Causality, Fmi3Slave, Fmi3Variability, Float64, Int32
+
+
+class BenchGain(Fmi3Slave):
+
+    author = "pythonfmu3"
+    description = "Co-simulation model with one input and one output, used to benchmark the co-simulation master"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.u = 0.0
+        self.y = 0.0
+        # Number of loop iterations emulating the computations of a step
+        self.work = 0
+
+        self.register_variable(Float64("u", causality=Fmi3Causality.input, variability=Fmi3Variability.discrete, start=0.0))
+        self.register_variable(Float64("y", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete))
+        self.register_variable(Int32("work", causality=Fmi3Causality.parameter, variability=Fmi3Variability.fixed, start=0))
+
+    def do_step(self, current_time, step_size):
+        y = self.u
+        for _ in range(self.work):
+            y = 0.5 * y + 0.5 * self.u
+        self.y = y + 1.0
+        return True
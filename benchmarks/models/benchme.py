@@ -0,0 +1,31 @@
+from pythonfmu3 import Fmi3Causality, Fmi3Initial, Fmi3SlaveBase, Fmi3Variability, Float64, ModelExchange
+
+# Layout shared with the C driver (driver/bench_fmi.c)
+N_STATES = 32
+
+
+class BenchME(Fmi3SlaveBase, ModelExchange):
+
+    author = "pythonfmu3"
+    description = "Model exchange model with N_STATES decoupled linear states, used to benchmark RHS evaluation"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.time = 0.0
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        for i in range(N_STATES):
+            setattr(self, f"x{i}", 1.0)
+            setattr(self, f"der_x{i}", 0.0)
+            self.register_variable(
+                Float64(f"x{i}", causality=Fmi3Causality.output, variability=Fmi3Variability.continuous, initial=Fmi3Initial.exact, start=1.0)
+            )
+            self.register_variable(
+                Float64(f"der_x{i}", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=2 * i + 1)
+            )
+
+    def get_continuous_state_derivatives(self):
+        derivatives = [-getattr(self, f"x{i}") for i in range(N_STATES)]
+        for i, dx in enumerate(derivatives):
+            setattr(self, f"der_x{i}", dx)
+        return derivatives
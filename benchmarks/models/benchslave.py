@@ -0,0 +1,30 @@
+from pythonfmu3 import Dimension, Fmi3Causality, Fmi3Slave, Fmi3Variability, Float64
+
+import numpy as np
+
+# Layout shared with the C driver (driver/bench_fmi.c): the scalar inputs take the
+# value references [0, N_SCALARS), then one array input per ARRAY_SIZES entry.
+N_SCALARS = 64
+ARRAY_SIZES = (16, 256, 4096)
+
+
+class BenchSlave(Fmi3Slave):
+
+    author = "pythonfmu3"
+    description = "Co-simulation model with an empty do_step, used to benchmark the FMI bridge"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        for i in range(N_SCALARS):
+            setattr(self, f"x{i}", 0.0)
+            self.register_variable(Float64(f"x{i}", causality=Fmi3Causality.input, variability=Fmi3Variability.continuous, start=0.0))
+
+        for size in ARRAY_SIZES:
+            setattr(self, f"a{size}", np.zeros(size))
+            self.register_variable(
+                Float64(f"a{size}", causality=Fmi3Causality.input, variability=Fmi3Variability.continuous, dimensions=[Dimension(start=str(size))])
+            )
+
+    def do_step(self, current_time, step_size):
+        return True
@@ -1,9 +1,12 @@
-from pythonfmu3 import Fmi3Causality, Fmi3Variability, Fmi3Slave, Float64, UInt64, Fmi3Initial, Dimension
+from pythonfmu3 import Fmi3Causality, Fmi3Variability, Fmi3Slave, Float64, UInt64, Fmi3Initial, Dimension, skip_if_inputs_unchanged
 import numpy as np
 
 
 class LinearTransformFixed(Fmi3Slave):
 
+    # y only depends on the inputs and parameters: the steps with unchanged inputs are skipped
+    time_invariant = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -31,6 +34,7 @@ class LinearTransformFixed(Fmi3Slave):
         self.register_variable(Float64("y", causality=Fmi3Causality.output, dimensions=[Dimension(start="2")]))
     
 
+    @skip_if_inputs_unchanged
     def do_step(self, current_time, step_size):
         self.y = self.scalar*self.A.dot(self.u) + self.offset
         return True
@@ -2,9 +2,11 @@ from ._version import __version__
 from .builder import FmuBuilder
 from .cosimulation import CoSimulation
 from .modelexchange import ModelExchange, Fmi3UpdateDiscreteStatesResult
-from .enums import Fmi3Causality, Fmi3Initial, Fmi3Status, Fmi3Variability
-from .fmi3slave import Fmi3Slave, Fmi3SlaveBase, Fmi3StepResult
-from .variables import Boolean, Enumeration, Int32, Int64, UInt64, Float64, String, Dimension
+from .scheduledexecution import ScheduledExecution
+from .enums import Fmi3Causality, Fmi3DependencyKind, Fmi3Initial, Fmi3IntervalQualifier, Fmi3IntervalVariability, Fmi3Status, Fmi3Variability
+from .fmi3slave import Fmi3Slave, Fmi3SlaveBase, Fmi3StepResult, skip_if_inputs_unchanged
+from .integrator import IntegratedCoSimulation
+from .variables import Binary, Boolean, Clock, Enumeration, Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64, Float32, Float64, String, Dimension
 from .default_experiment import DefaultExperiment
 from .variable_types import Float64Type, EnumerationType
 from .unit import BaseUnit, Unit
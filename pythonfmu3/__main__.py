@@ -1,6 +1,6 @@
 import argparse
 
-from pythonfmu3 import builder, deploy
+from pythonfmu3 import builder, deploy, simulate
 from ._version import __version__
 
 
@@ -43,6 +43,18 @@ def cli_main():
     )
     deploy.create_command_parser(deploy_parser)
 
+    simulate_parser = subparsers.add_parser(
+        "simulate",
+        description="""Simulate a Python script in-process, without building nor importing an FMU.
+
+        Co-simulation models are stepped at fixed communication steps; model exchange
+        models are integrated with the forward Euler method. The outputs are recorded
+        in a CSV file.
+        """,
+        help="Simulate a Python script without building an FMU."
+    )
+    simulate.create_command_parser(simulate_parser)
+
     options = vars(parser.parse_args())
     execute = options.pop("execute")
     execute(**options)
@@ -5,19 +5,25 @@ import itertools
 import logging
 import re
 import shutil
+import subprocess
 import sys
 import tempfile
 import zipfile
+from io import BytesIO
 from pathlib import Path
 from typing import Iterable, Optional, Tuple, Union
 from xml.dom.minidom import parseString
 from xml.etree.ElementTree import Element, SubElement, tostring
+from .deploy import WHEELHOUSE
 from .osutil import get_lib_extension, get_platform
 from .fmi3slave import FMI3_MODEL_OPTIONS_COMMON, FMI3_MODEL_OPTIONS_COSIM, FMI3_MODEL_OPTIONS_MX, Fmi3Slave, Fmi3SlaveBase
 
 FilePath = Union[str, Path]
 HERE = Path(__file__).parent
 
+# Archive within the FMU `resources` holding the Python sources when bundled
+PYTHON_BUNDLE = "python.zip"
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,15 +33,16 @@ def get_class_name(file_name: Path) -> str:
         return re.search(r'class (\w+)\(([^)]*\bFmi3Slave(?:Base)?\b[^)]*)\)\s*:', data).group(1)
 
 
-def get_model_description(filepath: Path, module_name: str) -> Tuple[str, Element]:
-    """Extract the FMU model description as XML.
+def instantiate_slave(filepath: Path, module_name: str, instance_name: str = "dummyInstance") -> Fmi3SlaveBase:
+    """Import the user interface from a script and instantiate it.
 
     Args:
         filepath (pathlib.Path) : script file path
         module_name (str) : python module to load
+        instance_name (str) : optional, name of the instance
 
     Returns:
-        Tuple[str, xml.etree.TreeElement.Element] : FMU model name, model description
+        Fmi3SlaveBase : the model instance, using the script folder as resources
     """
     # Add current folder to handle local dependencies
     sys.path.insert(0, str(filepath.parent))
@@ -46,7 +53,7 @@ def get_model_description(filepath: Path, module_name: str) -> Tuple[str, Elemen
         spec.loader.exec_module(fmu_interface)
         # Instantiate the interface
         class_name = get_class_name(filepath)
-        instance = getattr(fmu_interface, class_name)(instance_name="dummyInstance", resources=str(filepath.parent))
+        instance = getattr(fmu_interface, class_name)(instance_name=instance_name, resources=str(filepath.parent))
     finally:
         sys.path.remove(str(filepath.parent))  # remove inserted temporary path
 
@@ -54,6 +61,20 @@ def get_model_description(filepath: Path, module_name: str) -> Tuple[str, Elemen
         raise TypeError(
             f"The provided class '{class_name}' does not inherit from {Fmi3SlaveBase.__qualname__}"
         )
+    return instance
+
+
+def get_model_description(filepath: Path, module_name: str) -> Tuple[str, Element]:
+    """Extract the FMU model description as XML.
+
+    Args:
+        filepath (pathlib.Path) : script file path
+        module_name (str) : python module to load
+
+    Returns:
+        Tuple[str, xml.etree.TreeElement.Element] : FMU model name, model description
+    """
+    instance = instantiate_slave(filepath, module_name)
     # Produce the xml
     return instance.modelName, instance.to_xml()
 
@@ -67,6 +88,8 @@ class FmuBuilder:
         project_files: Iterable[FilePath] = set(),
         documentation_folder: Optional[FilePath] = None,
         terminals : Optional[FilePath] = None,
+        vendor_dependencies: bool = False,
+        bundle_python: bool = False,
         **options,
     ) -> Path:
         script_file = Path(script_file)
@@ -130,6 +153,25 @@ class FmuBuilder:
                     else:
                         shutil.copy2(file_, temp_dir)
 
+            if vendor_dependencies:
+                # Resolve the requirements into wheels so `pythonfmu3 deploy` can install them offline
+                requirements = temp_dir / "requirements.txt"
+                if not requirements.exists():
+                    raise ValueError(
+                        "Vendoring dependencies requires a requirements.txt project file."
+                    )
+                subprocess.run(
+                    [
+                        sys.executable, "-m", "pip", "wheel",
+                        "-r", f"{requirements!s}",
+                        "--wheel-dir", f"{temp_dir / WHEELHOUSE!s}",
+                        "--progress-bar", "off"
+                    ],
+                    stdout=sys.stdout,
+                    stderr=sys.stderr,
+                    check=True
+                )
+
             model_identifier, xml = get_model_description(
                 temp_dir.absolute() / script_file.name, module_name
             )
@@ -153,18 +195,36 @@ class FmuBuilder:
                     if option in mx_option_names:
                         type_node.set(option, str(value).lower())
 
+            type_node = xml.find("ScheduledExecution")
+            if type_node is not None:
+                for option, value in options.items():
+                    if option in option_names:
+                        type_node.set(option, str(value).lower())
+
             with zipfile.ZipFile(dest_file, "w") as zip_fmu:
 
                 resource = Path("resources")
 
-                # Add files copied in temporary directory
-                for f in temp_dir.rglob("*"):
-                    if f.is_file() and f.parent.name != "__pycache__":
-                        relative_f = f.relative_to(temp_dir)
-                        zip_fmu.write(f, arcname=(resource / relative_f))
+                # Python sources are either extracted with the other resources or bundled in
+                # a single archive imported through zipimport
+                bundle_buffer = BytesIO()
+                with zipfile.ZipFile(bundle_buffer, "w") as bundle:
+                    # Add files copied in temporary directory
+                    for f in temp_dir.rglob("*"):
+                        if f.is_file() and f.parent.name != "__pycache__":
+                            relative_f = f.relative_to(temp_dir)
+                            if bundle_python and f.suffix == ".py":
+                                bundle.write(f, arcname=relative_f)
+                            else:
+                                zip_fmu.write(f, arcname=(resource / relative_f))
 
                 # Add information for the Python loader
-                zip_fmu.writestr(str(resource.joinpath("slavemodule.txt")), module_name)
+                slave_module = module_name
+                if bundle_python:
+                    zip_fmu.writestr(str(resource.joinpath(PYTHON_BUNDLE)), bundle_buffer.getvalue())
+                    # The loader cannot parse the script out of the bundle to find the class
+                    slave_module += "\n" + get_class_name(script_file)
+                zip_fmu.writestr(str(resource.joinpath("slavemodule.txt")), slave_module)
 
                 # Add FMI API wrapping Python class source
                 sources = Path("sources")
@@ -251,6 +311,20 @@ def create_command_parser(parser: argparse.ArgumentParser):
         default=None
     )
 
+    parser.add_argument(
+        "--vendor-dependencies",
+        dest="vendor_dependencies",
+        help="Embed wheels resolved from the requirements.txt project file for offline deployment.",
+        action="store_true"
+    )
+
+    parser.add_argument(
+        "--bundle-python",
+        dest="bundle_python",
+        help="Bundle the Python sources in a single archive imported without extraction.",
+        action="store_true"
+    )
+
     for option in FMI3_MODEL_OPTIONS_COMMON:
         action = "store_false" if option.value else "store_true"
         parser.add_argument(
@@ -1,8 +1,30 @@
 from abc import ABC, abstractmethod
 
+from .modelexchange import Fmi3UpdateDiscreteStatesResult
+
 # co-simulation mixin
 class CoSimulation(ABC):
+    """
+    Required methods to override:
+    - `do_step`: Advance the model by one communication step.
+
+    Optional methods, used when the importer instantiates the model with `eventModeUsed`:
+    - `update_discrete_states`: Handle the event signalled by `eventHandlingNeeded` in the step result.
+
+    Optional methods, used by importers extrapolating the outputs between communication points:
+    - `get_output_derivatives(vrs, orders)`: Return the time derivatives of the given orders of the
+      outputs at the end of the last step, flattened for array outputs, up to the order declared with
+      the `max_output_derivative_order` class attribute. Without it, fmi3GetOutputDerivatives fails
+      as not supported.
+    """
+
+    # Declared as maxOutputDerivativeOrder, no output derivatives are provided by default
+    max_output_derivative_order: int = 0
 
     @abstractmethod
     def do_step(self, current_time: float, step_size: float):
-        pass
\ No newline at end of file
+        pass
+
+    def update_discrete_states(self):
+        """Update the discrete states of the model in Event Mode."""
+        return Fmi3UpdateDiscreteStatesResult()
\ No newline at end of file
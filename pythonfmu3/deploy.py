@@ -1,15 +1,25 @@
 """CLI command to deploy a FMU."""
 import argparse
+import hashlib
+import logging
 import os
+import re
 import subprocess
 import sys
 import zipfile
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Union
+from typing import Iterable, List, Tuple, Union
+
+try:
+    from importlib import metadata
+except ImportError:  # Python < 3.8
+    metadata = None
 
 from .enums import PackageManager
 
+logger = logging.getLogger(__name__)
+
 
 # Dictionary of ("default file name", "associated package manager")
 ENVIRONMENT_FILES = {
@@ -18,18 +28,33 @@ ENVIRONMENT_FILES = {
     "environment.yml": PackageManager.conda
 }
 
+# Folder within the FMU `resources` holding the vendored wheels
+WHEELHOUSE = "wheels"
+
+# Folder recording the requirement sets already deployed in the current environment
+DEPLOY_CACHE = Path(sys.prefix) / ".pythonfmu3" / "deployed"
+
+# Requirement pinned to an exact version, e.g. `numpy==1.26.4`
+PINNED_REQUIREMENT = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)(?:\[[^\]]*\])?\s*==\s*([^\s;]+)$")
+
 
 def deploy(
     fmu: Union[str, Path],
     environment: Union[str, Path, None] = None,
-    package_manager: Union[str, PackageManager, None] = None
+    package_manager: Union[str, PackageManager, None] = None,
+    force: bool = False
 ) -> None:
     """Install Python dependency packages from requirement file shipped within the FMU.
+
+    If the FMU embeds a wheelhouse (see `pythonfmu3 build --vendor-dependencies`), pip
+    installs from it without accessing the network. The deployment is skipped if the
+    same requirement set was already deployed in the current environment.
     
     Args:
         fmu (str or pathlib.Path) : FMU file path
         environment (str or pathlib.Path) : optional, requirements file within the `resources` folder of the FMU
         package_manager (str) : optional, Python package manager
+        force (bool) : optional, deploy even if the requirement set is already deployed (default False)
     """
     fmu = Path(fmu)
     manager = None
@@ -67,28 +92,97 @@ def deploy(
         with files.open(environment_file.as_posix(), mode="r") as env_file:
             env_content = env_file.read()
 
-    with TemporaryDirectory() as tmp:
-        tempd = Path(tmp)
-
-        copy_env = tempd / environment_file.name
-        copy_env.write_bytes(env_content)
-
+        wheels = []
         if manager == PackageManager.pip:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "-r", f"{copy_env!s}", "--progress-bar", "off"],
-                stdout=sys.stdout,
-                stderr=sys.stderr,
-                check=True
-            )
-        elif manager == PackageManager.conda:
-            conda_exe = os.environ.get("CONDA_EXE", "conda")
-            subprocess.run(
-                [conda_exe, "env", "update", f"--file={copy_env!s}", "--quiet"],
-                stdout=sys.stdout,
-                stderr=sys.stderr,
-                check=True
+            wheelhouse = (Path("resources") / WHEELHOUSE).as_posix() + "/"
+            wheels = sorted(
+                (info for info in files.infolist() if info.filename.startswith(wheelhouse) and info.filename.endswith(".whl")),
+                key=lambda info: info.filename
             )
 
+        digest = hashlib.sha256()
+        digest.update(manager.value.encode("utf-8"))
+        digest.update(env_content)
+        for info in wheels:
+            digest.update(f"{info.filename}:{info.CRC}".encode("utf-8"))
+        stamp = DEPLOY_CACHE / digest.hexdigest()
+
+        if stamp.exists() and not force:
+            pins = _pinned_requirements(manager, env_content, (Path(info.filename).name for info in wheels))
+            if _installed(pins):
+                logger.info(f"Requirement set of {fmu!s} is already deployed, skipping.")
+                return
+            logger.info(f"Requirement set of {fmu!s} was deployed but is no longer installed, deploying again.")
+
+        with TemporaryDirectory() as tmp:
+            tempd = Path(tmp)
+
+            copy_env = tempd / environment_file.name
+            copy_env.write_bytes(env_content)
+
+            wheel_dir = tempd / WHEELHOUSE
+            wheel_dir.mkdir()
+            for info in wheels:
+                (wheel_dir / Path(info.filename).name).write_bytes(files.read(info))
+
+            _install(manager, copy_env, wheel_dir if wheels else None)
+
+    try:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(f"{fmu.name}\n")
+    except OSError as e:
+        # The packages are installed, only the next deployment will not be skipped
+        logger.warning(f"Unable to record the deployment of {fmu!s} in {DEPLOY_CACHE!s}: {e}")
+
+
+def _pinned_requirements(manager: PackageManager, env_content: bytes, wheels: Iterable[str]) -> List[Tuple[str, str]]:
+    # (distribution, version) of the vendored wheels and of the requirements pinned with `==`
+    if manager != PackageManager.pip:
+        return []
+    pins = []
+    for wheel in wheels:
+        name, version = wheel.split("-")[:2]
+        pins.append((name, version))
+    for line in env_content.decode("utf-8", errors="replace").splitlines():
+        match = PINNED_REQUIREMENT.match(line.split("#", 1)[0].strip())
+        if match is not None:
+            pins.append(match.groups())
+    return pins
+
+
+def _installed(pins: Iterable[Tuple[str, str]]) -> bool:
+    # Unpinned requirements and conda environments cannot be checked, the deployment record is trusted
+    if metadata is None:
+        return True
+    for name, version in pins:
+        try:
+            if metadata.version(name) != version:
+                return False
+        except metadata.PackageNotFoundError:
+            return False
+    return True
+
+
+def _install(manager: PackageManager, copy_env: Path, wheel_dir: Union[Path, None]) -> None:
+    if manager == PackageManager.pip:
+        cmd = [sys.executable, "-m", "pip", "install", "-r", f"{copy_env!s}", "--progress-bar", "off"]
+        if wheel_dir is not None:
+            cmd.extend(["--no-index", "--find-links", f"{wheel_dir!s}"])
+        subprocess.run(
+            cmd,
+            stdout=sys.stdout,
+            stderr=sys.stderr,
+            check=True
+        )
+    elif manager == PackageManager.conda:
+        conda_exe = os.environ.get("CONDA_EXE", "conda")
+        subprocess.run(
+            [conda_exe, "env", "update", f"--file={copy_env!s}", "--quiet"],
+            stdout=sys.stdout,
+            stderr=sys.stderr,
+            check=True
+        )
+
 
 def create_command_parser(parser: argparse.ArgumentParser):
 
@@ -108,6 +202,13 @@ def create_command_parser(parser: argparse.ArgumentParser):
         default=None
     )
 
+    parser.add_argument(
+        "--force",
+        dest="force",
+        help="Deploy even if the requirement set is already deployed in the current environment.",
+        action="store_true"
+    )
+
     parser.add_argument(
         choices=["pip", "conda"],
         dest="package_manager",
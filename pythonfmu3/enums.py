@@ -34,6 +34,30 @@ class Fmi3Variability(Enum):
     continuous = 4
 
 
+class Fmi3IntervalVariability(Enum):
+    constant = 0
+    fixed = 1
+    tunable = 2
+    changing = 3
+    countdown = 4
+    triggered = 5
+
+
+class Fmi3IntervalQualifier(IntEnum):
+    intervalNotYetKnown = 0
+    intervalUnchanged = 1
+    intervalChanged = 2
+
+
+class Fmi3DependencyKind(IntEnum):
+    independent = 0
+    constant = 1
+    fixed = 2
+    tunable = 3
+    discrete = 4
+    dependent = 5
+
+
 class Fmi3Status(IntEnum):
     ok = 0
     warning = 1
@@ -2,20 +2,24 @@
 import json
 import ctypes
 import datetime
+import functools
 from abc import ABC, abstractmethod
 from collections import OrderedDict, namedtuple
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List, NamedTuple, Optional
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 from uuid import uuid1
 from xml.etree.ElementTree import Element, SubElement
 
 from .logmsg import LogMsg
+from .names import NameIndex, VariableSelection, _type_name
 from .default_experiment import DefaultExperiment
 from .cosimulation import CoSimulation
 from .modelexchange import ModelExchange
+from .scheduledexecution import ScheduledExecution
 from ._version import __version__ as VERSION
-from .enums import Fmi3Type, Fmi3Status, Fmi3Causality, Fmi3Initial, Fmi3Variability
-from .variables import Boolean, Enumeration, Int32, Int64, UInt64, Float64, ModelVariable, String
+from .enums import Fmi3Type, Fmi3Status, Fmi3Causality, Fmi3DependencyKind, Fmi3Initial, Fmi3IntervalQualifier, Fmi3Variability
+from .variables import Arrayable, Binary, Boolean, Clock, ClockState, Enumeration, Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64, Float32, Float64, ModelVariable, String, VariableBlock
 from .variable_types import VariableType
 from .unit import Unit
 
@@ -30,6 +34,8 @@ FMI3_MODEL_OPTIONS_COMMON: List[ModelOptions] = [
 
 FMI3_MODEL_OPTIONS_COSIM: List[ModelOptions] = [
     ModelOptions("canHandleVariableCommunicationStepSize", True, "no-variable-step"),
+    ModelOptions("hasEventMode", False, "event-mode"),
+    ModelOptions("mightReturnEarlyFromDoStep", False, "early-return"),
 ]
 
 FMI3_MODEL_OPTIONS_MX: List[ModelOptions] = [
@@ -37,11 +43,93 @@ FMI3_MODEL_OPTIONS_MX: List[ModelOptions] = [
 ]
 
 
+def _encode_binary(value: Any) -> Dict[str, str]:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"__binary__": bytes(value).hex()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_binary(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and "__binary__" in obj:
+        return bytes.fromhex(obj["__binary__"])
+    return obj
+
+
+# Causalities of the variables whose changes are tracked by the setters, see `Fmi3SlaveBase.changed_inputs`
+TRACKED_CAUSALITIES = (Fmi3Causality.input, Fmi3Causality.parameter, Fmi3Causality.structuralParameter)
+
+
+def _bind_class_variable(var: ModelVariable):
+    # Accessors of a class level variable, resolving the (nested) attribute on the instance
+    path = var.name.split(".")[:-1]
+    name = var.local_name
+    tracked = var.causality in TRACKED_CAUSALITIES
+
+    def owner(instance):
+        for attribute in path:
+            instance = getattr(instance, attribute)
+        return instance
+
+    if len(getattr(var, "dimensions", [])) > 0:
+        import numpy as np
+        var.instance_getter = lambda instance: getattr(owner(instance), name).ravel()
+
+        def array_setter(instance, v):
+            # Write into the model array, keeping its dtype (e.g. float32 or uint8) and the views on it
+            current = getattr(owner(instance), name)
+            values = (v if isinstance(v, np.ndarray) else np.asarray(v, dtype=current.dtype)).reshape(current.shape)
+            if tracked and not np.array_equal(current, values):
+                instance._input_changed(var.name)
+            np.copyto(current, values, casting="unsafe")
+        setter = array_setter
+    else:
+        var.instance_getter = (lambda instance: getattr(owner(instance), name)) if path else attrgetter(name)
+
+        def setter(instance, v):
+            o = owner(instance)
+            if tracked and v != getattr(o, name):
+                instance._input_changed(var.name)
+            setattr(o, name, v)
+    if var.variability != Fmi3Variability.constant:
+        var.instance_setter = setter
+
+
+def _as_list(values: Any) -> List[Any]:
+    # The default getters of the array variables return a flat NumPy array
+    return values.tolist() if hasattr(values, "tolist") else values
+
+
+def _sized_by_parameters(var: ModelVariable) -> bool:
+    return any(dim.value_reference for dim in getattr(var, "dimensions", []))
+
+
 class Fmi3StepResult(NamedTuple):
     status: Fmi3Status = Fmi3Status.ok
     eventHandlingNeeded: bool = False
     terminateSimulation: bool = False
     earlyReturn: bool = False
+    # Time reached when returning early, ignored otherwise
+    lastSuccessfulTime: Optional[float] = None
+
+
+def skip_if_inputs_unchanged(do_step: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorate `do_step` to skip the steps that would recompute the same outputs.
+
+    When the model declares itself time-invariant (`time_invariant` is True) and no input or parameter
+    was set to a new value since the previous successful step, the step is skipped and the result of
+    that step is returned again.
+    """
+    @functools.wraps(do_step)
+    def wrapper(self, current_time: float, step_size: float) -> Any:
+        previous = getattr(self, "_unchanged_step_result", None)
+        if previous is not None and self.time_invariant and not self._changed_inputs:
+            return previous
+        result = do_step(self, current_time, step_size)
+        status = result.status if hasattr(result, "status") else (Fmi3Status.ok if result else Fmi3Status.discard)
+        self._unchanged_step_result = result if status == Fmi3Status.ok else None
+        self._changed_inputs.clear()
+        return result
+    return wrapper
 
 
 class Fmi3SlaveBase(object):
@@ -56,12 +144,47 @@ class Fmi3SlaveBase(object):
         "logAll": "Log all messages."
     }
 
+    # Variables declared once per class and shared by all the instances; their values are the
+    # (nested) instance attributes named after them. Variables registered in __init__ come after them.
+    model_variables: ClassVar[Sequence[ModelVariable]] = ()
+    # Names of the class level variables that are event indicators
+    model_event_indicators: ClassVar[Sequence[str]] = ()
+    # Do the outputs only depend on the inputs and parameters? See `skip_if_inputs_unchanged`
+    time_invariant: bool = False
+
     def __init__(self, **kwargs):
-        self.vars = OrderedDict()
-        self.event_indicators: List[int] = []
+        schema_vars, schema_indicators = self._class_schema()
+        self.vars = OrderedDict(schema_vars)
+        # Arrays registered with `register_block`, in value reference order
+        self.blocks: List[VariableBlock] = []
+        self._blocks_by_name: Dict[str, VariableBlock] = {}
+        # Index of the structured names, built on first name-based access, see `select`
+        self._name_index: Optional[NameIndex] = None
+        self.event_indicators: List[int] = list(schema_indicators)
+        # Names of the inputs and parameters set to a new value since the last step
+        self._changed_inputs: Set[str] = set()
+        # Functions of the outputs computed on demand and their values, by value reference
+        self._compute_functions: Dict[int, Callable[[], Any]] = {}
+        self._computed: Dict[int, Any] = {}
+        # Sizes of the variables by value reference, resolved once and cleared when the structure changes
+        self._sizes: Dict[int, int] = {}
+        self._structural_parameters: Set[str] = {v.name for v in schema_vars.values() if v.causality == Fmi3Causality.structuralParameter}
+        # Structural parameters set to a new value since the last exit of configuration mode
+        self._changed_structure: Set[str] = set()
+        # Owners of the arrays sized by structural parameters, by value reference
+        self._resizable: Dict[int, Callable[[], Any]] = {
+            v.value_reference: functools.partial(functools.reduce, getattr, v.name.split(".")[:-1], self)
+            for v in schema_vars.values() if _sized_by_parameters(v)
+        }
+        self.partitions: Dict[int, Callable[[float], Any]] = {}
+        # Intervals and shifts of the clocks, by value reference - the Clock variables may be shared with other instances
+        self._clock_states: Dict[int, ClockState] = {}
         self.instance_name = kwargs["instance_name"]
         self.resources = kwargs.get("resources", None)
         self.visible = kwargs.get("visible", False)
+        # Co-simulation options requested by the importer at instantiation
+        self.event_mode_used = kwargs.get("event_mode_used", False)
+        self.early_return_allowed = kwargs.get("early_return_allowed", False)
         self.log_queue = []
 
         self.guid = uuid1()
@@ -76,6 +199,32 @@ class Fmi3SlaveBase(object):
         self.type_definitions: Dict[str, VariableType] = {}
         self.units: Dict[str, Unit] = {}
 
+    @classmethod
+    def _class_schema(cls) -> Tuple[Dict[int, ModelVariable], List[int]]:
+        """Return the class level variables by value reference and the event indicators, built on first use."""
+        owner = next(klass for klass in cls.__mro__ if "model_variables" in klass.__dict__)
+        schema = owner.__dict__.get("_schema")
+        if schema is None:
+            variables = OrderedDict()
+            for var in owner.model_variables:
+                if var.getter is not None or var.setter is not None:
+                    raise ValueError(f"Class level variable {var.name} cannot have a getter or a setter, register it in __init__")
+                value_reference = len(variables)
+                if var.value_reference is None:
+                    var.value_reference = value_reference
+                    _bind_class_variable(var)
+                elif var.value_reference != value_reference:
+                    # Reused from the schema of another class (e.g. a base class) at another position
+                    raise ValueError(
+                        f"Class level variable {var.name} has valueReference={var.value_reference} in another class, "
+                        "it can only be reused at the same position"
+                    )
+                variables[value_reference] = var
+            by_name = {v.name: v.value_reference for v in variables.values()}
+            schema = (variables, [by_name[name] for name in owner.model_event_indicators])
+            owner._schema = schema
+        return schema
+
     def to_xml(self, model_options: Dict[str, str] = dict()) -> Element:
         """Build the XML representation of the model.
         
@@ -119,10 +268,14 @@ class Fmi3SlaveBase(object):
 
         options_cs = options.copy()
         for option in FMI3_MODEL_OPTIONS_COSIM:
+            value = model_options.get(option.name, option.value)
             options_cs[option.name] = str(value).lower()
+        if isinstance(self, CoSimulation) and self.max_output_derivative_order > 0:
+            options_cs["maxOutputDerivativeOrder"] = str(self.max_output_derivative_order)
         
         options_me = options.copy()
         for option in FMI3_MODEL_OPTIONS_MX:
+            value = model_options.get(option.name, option.value)
             options_me[option.name] = str(value).lower()
 
         # check if we have cosim mixin or model exchange mixin
@@ -132,6 +285,9 @@ class Fmi3SlaveBase(object):
         if isinstance(self, CoSimulation):
             SubElement(root, "CoSimulation", attrib=options_cs)
 
+        if isinstance(self, ScheduledExecution):
+            SubElement(root, "ScheduledExecution", attrib=options)
+
         if self.units:
             unit_defs = SubElement(root, "UnitDefinitions")
             for _, unit in self.units.items():
@@ -164,88 +320,163 @@ class Fmi3SlaveBase(object):
                 attrib["tolerance"] = str(self.default_experiment.tolerance)
             SubElement(root, "DefaultExperiment", attrib)
             
+        model_variables = self._variables_with_blocks()
+        schema_vars = self._class_schema()[0]
         variables = SubElement(root, "ModelVariables")
-        for v in self.vars.values():
-            if ModelVariable.requires_start(v):
-                self.__apply_start_value(v)
-            variables.append(v.to_xml())
+        for v in model_variables:
+            # The block elements are created with their start values
+            start = None
+            if ModelVariable.requires_start(v) and self.vars.get(v.value_reference) is v:
+                start = self.__start_value(v)
+                # The class level variables are shared, only the current value of this instance is written
+                if start is not None and schema_vars.get(v.value_reference) is not v:
+                    v.start = start
+            variables.append(v.to_xml() if start is None else v.to_xml(start=start))
 
         structure = SubElement(root, "ModelStructure")
         outputs = list(
-            filter(lambda v: v.causality == Fmi3Causality.output, self.vars.values())
+            filter(lambda v: v.causality == Fmi3Causality.output, model_variables)
         )
 
         continuous_state_derivatives = list(
-            filter(lambda v: v.variability == Fmi3Variability.continuous and (isinstance(v, Float64) and v.derivative is not None), self.vars.values())
+            filter(lambda v: v.variability == Fmi3Variability.continuous and (isinstance(v, Float64) and v.derivative is not None), model_variables)
         )
 
         allowed_variability = [None, Fmi3Initial.approx, Fmi3Initial.calculated]
         initial_unknown = list(
             filter(lambda v: (v.causality == Fmi3Causality.output and (v.initial in allowed_variability))
                               or v.causality == Fmi3Causality.calculatedParameter
-                              or v in continuous_state_derivatives and v.initial in allowed_variability, self.vars.values())
+                              or v in continuous_state_derivatives and v.initial in allowed_variability, model_variables)
         )
 
         for v in outputs:
-            SubElement(structure, "Output", attrib=dict(valueReference=str(v.value_reference)))
+            SubElement(structure, "Output", attrib=self.__unknown_attrib(v))
 
         for v in continuous_state_derivatives:
-            SubElement(structure, "ContinuousStateDerivative", attrib=dict(valueReference=str(v.value_reference)))
+            SubElement(structure, "ContinuousStateDerivative", attrib=self.__unknown_attrib(v))
 
         for v in initial_unknown:
-            SubElement(structure, "InitialUnknown", attrib=dict(valueReference=str(v.value_reference)))
+            # The declared dependencies hold during initialization too, without them the importer assumes all the knowns
+            SubElement(structure, "InitialUnknown", attrib=self.__unknown_attrib(v))
         
         for v in self.event_indicators:
-            SubElement(structure, "EventIndicator", attrib=dict(valueReference=str(v)))
+            SubElement(structure, "EventIndicator", attrib=self.__unknown_attrib(self.vars[v]))
 
         return root
 
-    def __apply_start_value(self, var: ModelVariable):
+    @staticmethod
+    def __unknown_attrib(var: ModelVariable) -> Dict[str, str]:
+        attrib = dict(valueReference=str(var.value_reference))
+        if var.dependencies is not None:
+            attrib["dependencies"] = " ".join(str(d.value_reference) for d in var.dependencies)
+            if var.dependencies_kind is not None:
+                attrib["dependenciesKind"] = " ".join(kind.name for kind in var.dependencies_kind)
+        return attrib
+
+    def __start_value(self, var: ModelVariable) -> Any:
         vrs = [var.value_reference]
-        if isinstance(var, Int32):
+        if isinstance(var, Clock):
+            # Clocks have no start value
+            return None
+        elif isinstance(var, Int8):
+            refs = self.get_int8(vrs)
+        elif isinstance(var, Int16):
+            refs = self.get_int16(vrs)
+        elif isinstance(var, Int32):
             refs = self.get_int32(vrs)
         elif isinstance(var, (Enumeration, Int64)):
             refs = self.get_int64(vrs)
+        elif isinstance(var, UInt8):
+            refs = self.get_uint8(vrs)
+        elif isinstance(var, UInt16):
+            refs = self.get_uint16(vrs)
+        elif isinstance(var, UInt32):
+            refs = self.get_uint32(vrs)
         elif isinstance(var, UInt64):
-            refs = [val.value for val in self.get_uint64(vrs)]
+            refs = self.get_uint64(vrs)
+        elif isinstance(var, Float32):
+            refs = self.get_float32(vrs)
         elif isinstance(var, Float64):
             refs = self.get_float64(vrs)
         elif isinstance(var, Boolean):
             refs = self.get_boolean(vrs)
         elif isinstance(var, String):
             refs = self.get_string(vrs)
+        elif isinstance(var, Binary):
+            refs = self.get_binary(vrs)
         else:
             raise Exception(f"Unsupported type {type(var)}!")
-        var.start = refs if len(getattr(var, "dimensions", [])) > 0 else refs[0]
+        return refs if len(getattr(var, "dimensions", [])) > 0 else refs[0]
 
-    def register_variable(self, var: ModelVariable, nested: bool = True, var_type: Any = None, has_event_indicator: bool = False):
+    def register_variable(
+        self,
+        var: ModelVariable,
+        nested: bool = True,
+        var_type: Any = None,
+        has_event_indicator: bool = False,
+        compute: Optional[Callable[[], Any]] = None
+    ):
         """Register a variable as FMU interface.
         
         Args:
             var (ModelVariable): The variable to be registered
             nested (bool): Optional, does the "." in the variable name reflect an object hierarchy to access it? Default True
+            compute (Callable[[], Any]): Optional, computes the value of an output when it is read. The value is
+                cached until the next step or a change of the variables
         """
-        variable_reference = len(self.vars)
+        variable_reference = self._next_value_reference()
         self.vars[variable_reference] = var
         # Set the unique value reference
         var.value_reference = variable_reference
+        if self._name_index is not None:
+            self._name_index.add(var.name, variable_reference)
+        if var.causality == Fmi3Causality.structuralParameter:
+            self._structural_parameters.add(var.name)
+        if compute is not None:
+            self.__register_computed(var, compute)
+            return
         owner = self
         if var.getter is None and nested and "." in var.name:
             split = var.name.split(".")
             split.pop(-1)
             for s in split:
                 owner = getattr(owner, s)
+        if var.getter is None and var.setter is None and _sized_by_parameters(var):
+            self._resizable[variable_reference] = lambda: owner
         if var.getter is None:
             if hasattr(var, "dimensions") and len(var.dimensions) > 0:
-                var.getter = lambda: getattr(owner, var.local_name).flatten().tolist()
+                # ravel does not copy contiguous arrays, the FMI wrapper copies the values from their buffer
+                var.getter = lambda: getattr(owner, var.local_name).ravel()
             else:
                 var.getter = lambda: getattr(owner, var.local_name)
+        tracked = var.causality in TRACKED_CAUSALITIES
         if var.setter is None and hasattr(owner, var.local_name) and var.variability != Fmi3Variability.constant:
             if hasattr(var, "dimensions") and len(var.dimensions) > 0:
                 import numpy as np
-                var.setter = lambda v: setattr(owner, var.local_name, np.reshape(v, newshape=getattr(owner, var.local_name).shape))
+                def array_setter(v):
+                    # Write into the model array rather than binding a new one: no array is allocated when the
+                    # values are already an array (e.g. the view from `_set_buffer`) and the views on it stay valid
+                    current = getattr(owner, var.local_name)
+                    values = (v if isinstance(v, np.ndarray) else np.asarray(v, dtype=current.dtype)).reshape(current.shape)
+                    if tracked and not np.array_equal(current, values):
+                        self._input_changed(var.name)
+                    np.copyto(current, values, casting="unsafe")
+                var.setter = array_setter
+            elif tracked:
+                def tracking_setter(v):
+                    if v != getattr(owner, var.local_name):
+                        self._input_changed(var.name)
+                    setattr(owner, var.local_name, v)
+                var.setter = tracking_setter
             else:
                 var.setter = lambda v: setattr(owner, var.local_name, v)
+        elif var.setter is not None and tracked:
+            # A custom setter cannot tell if the value changed, each call is reported as a change
+            custom_setter = var.setter
+            def changing_setter(v):
+                self._input_changed(var.name)
+                custom_setter(v)
+            var.setter = changing_setter
         
         if var_type:
             self.type_definitions[var_type.name] = var_type
@@ -254,9 +485,313 @@ class Fmi3SlaveBase(object):
         if has_event_indicator:
             self.register_event_indicator(var.value_reference)
 
+    def __register_computed(self, var: ModelVariable, compute: Callable[[], Any]):
+        if var.getter is not None or var.setter is not None:
+            raise ValueError(f"Computed variable {var.name} cannot have a getter or a setter")
+        vr = var.value_reference
+        array = len(getattr(var, "dimensions", [])) > 0
+
+        def computed_getter():
+            try:
+                return self._computed[vr]
+            except KeyError:
+                value = compute()
+                if array:
+                    import numpy as np
+                    value = np.array(value).ravel()
+                self._computed[vr] = value
+                return value
+        var.getter = computed_getter
+
+        self._compute_functions[vr] = compute
+
+    def _input_changed(self, name: str):
+        self._changed_inputs.add(name)
+        self._computed.clear()
+        if name in self._structural_parameters:
+            self._changed_structure.add(name)
+            self._sizes.clear()
+
+    def _size(self, var: ModelVariable) -> int:
+        size = self._sizes.get(var.value_reference)
+        if size is None:
+            size = self._sizes[var.value_reference] = var.size(self.vars, self)
+        return size
+
+    def _next_value_reference(self) -> int:
+        return len(self.vars) + sum(block.size for block in self.blocks)
+
+    def register_block(self, var_type: type, name: str, fields: Optional[List[str]] = None, nested: bool = True, **kwargs) -> VariableBlock:
+        """Register the elements of a NumPy array as scalar variables with contiguous value references.
+
+        The array is accessed with one indexing operation per run of elements in the get and set calls,
+        instead of one call per variable. The array may be reassigned but its shape must not change.
+
+        Args:
+            var_type (type): Variable class of the elements, e.g. Float64
+            name (str): Name of the array attribute, the elements are named `name[i]`, `name[i,j]`...
+            fields (List[str]): Optional, fields of a structured array to register, named `name[i].field`
+            nested (bool): Optional, does the "." in the name reflect an object hierarchy to access it? Default True
+            **kwargs: Arguments of the element variables, e.g. causality, variability or description
+
+        Returns:
+            VariableBlock : the registered block
+        """
+        if not (isinstance(var_type, type) and issubclass(var_type, Arrayable)):
+            raise TypeError(f"Blocks of {var_type!r} are not supported, use a numeric or Boolean variable type")
+        owner = self
+        if nested and "." in name:
+            for s in name.split(".")[:-1]:
+                owner = getattr(owner, s)
+        local_name = name.split(".")[-1]
+        array = getattr(owner, local_name)
+        if not hasattr(array, "flat"):
+            raise TypeError(f"{name} is not a NumPy array")
+        block = VariableBlock(
+            name, var_type, self._next_value_reference(), lambda: getattr(owner, local_name), array.shape, fields, **kwargs
+        )
+        self.blocks.append(block)
+        self._blocks_by_name[name] = block
+        if self._name_index is not None:
+            self._index_block(self._name_index, block)
+        return block
+
+    @staticmethod
+    def _index_block(index: NameIndex, block: VariableBlock):
+        for vr, element_name in enumerate(block.element_names(), block.value_reference):
+            index.add(element_name, vr)
+
+    def _names(self) -> NameIndex:
+        # Built on first use, then kept up to date by the registrations
+        if self._name_index is None:
+            index = NameIndex()
+            for var in self.vars.values():
+                index.add(var.name, var.value_reference)
+            for block in self.blocks:
+                self._index_block(index, block)
+            self._name_index = index
+        return self._name_index
+
+    def _type_name(self, vr: int) -> str:
+        # Suffix of the get_<type>/set_<type> methods handling a value reference
+        var = self.vars.get(vr)
+        if var is not None:
+            return _type_name(type(var))
+        for block in self.blocks:
+            if block.value_reference <= vr < block.value_reference + block.size:
+                return _type_name(block.var_type)
+        raise KeyError(vr)
+
+    def select(self, pattern: str) -> VariableSelection:
+        """Resolve the variables matching a structured name pattern, to read and write them as a vector.
+
+        The pattern is resolved once: keep the selection to exchange the values at each step.
+
+        Args:
+            pattern (str): Variable name or pattern where `*` and `?` match within one level of the `.`
+                hierarchy and `**` matches any number of levels, e.g. `plant.zone*.T`
+
+        Returns:
+            VariableSelection : the matching variables in value reference order, with their `names`
+                and `value_references`, read with `get()` and written with `set(values)`
+        """
+        variables = self._names().match(pattern)
+        if not variables:
+            raise ValueError(f"No variable matches {pattern}")
+        return VariableSelection(self, variables)
+
+    def _variables_with_blocks(self) -> List[ModelVariable]:
+        """All the variables in value reference order, including the (created) elements of the blocks."""
+        if not self.blocks:
+            return list(self.vars.values())
+        elements = [var for block in self.blocks for var in block.variables()]
+        return sorted([*self.vars.values(), *elements], key=attrgetter("value_reference"))
+
+    def _block_runs(self, vrs: List[int]) -> List[Tuple[Optional[VariableBlock], int, int, Any]]:
+        # Split the value references in runs of registered variables and runs of elements of one block:
+        # (block or None, start, stop, offsets of the elements in the block)
+        import numpy as np
+        refs = np.asarray(vrs, dtype=np.int64)
+        starts = np.array([block.value_reference for block in self.blocks])
+        ends = starts + np.array([block.size for block in self.blocks])
+        candidate = np.maximum(np.searchsorted(starts, refs, side="right") - 1, 0)
+        owner = np.where((refs >= starts[candidate]) & (refs < ends[candidate]), candidate, -1)
+        for vr in refs[owner < 0].tolist():
+            if vr not in self.vars:
+                raise KeyError(vr)
+        bounds = [0, *(np.flatnonzero(np.diff(owner)) + 1).tolist(), len(vrs)]
+        runs = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            index = int(owner[start])
+            if index < 0:
+                runs.append((None, start, stop, None))
+            else:
+                block = self.blocks[index]
+                runs.append((block, start, stop, refs[start:stop] - block.value_reference))
+        return runs
+
+    def _get_block_values(self, vrs: List[int], var_type: type, get: Callable[[List[int]], List[Any]]) -> List[Any]:
+        refs = list()
+        for block, start, stop, offsets in self._block_runs(vrs):
+            if block is None:
+                refs.extend(get(vrs[start:stop]))
+            elif issubclass(block.var_type, var_type):
+                refs.extend(block.get(offsets))
+            else:
+                raise TypeError(f"Variable with valueReference={vrs[start]} is not of type {var_type.__name__}!")
+        return refs
+
+    def _set_block_values(self, vrs: List[int], values: List[Any], var_type: type, set: Callable[[List[int], List[Any]], None]):
+        offset = 0
+        for block, start, stop, offsets in self._block_runs(vrs):
+            if block is None:
+                run = vrs[start:stop]
+                size = sum(self._size(var) if isinstance(var, var_type) else 1 for var in map(self.vars.__getitem__, run))
+                set(run, values[offset:offset + size])
+                offset += size
+            elif issubclass(block.var_type, var_type):
+                run_values = values[offset:offset + stop - start]
+                if block.attributes.get("causality") not in TRACKED_CAUSALITIES:
+                    self._computed.clear()
+                elif block.get(offsets) != list(run_values):
+                    self._input_changed(block.name)
+                block.set(offsets, run_values)
+                offset += stop - start
+            else:
+                raise TypeError(f"Variable with valueReference={vrs[start]} is not of type {var_type.__name__}!")
+
+    def _get_value(self, var: ModelVariable) -> Any:
+        if var.getter is not None:
+            return var.getter()
+        return var.instance_getter(self)
+
+    def _set_value(self, var: ModelVariable, value: Any):
+        # The computed outputs may depend on any variable, the tracked ones only clear them when changed
+        if var.causality not in TRACKED_CAUSALITIES:
+            self._computed.clear()
+        if var.setter is not None:
+            var.setter(value)
+        else:
+            var.instance_setter(self, value)
+
+    def _get_buffer(self, type_name: str, vrs: List[int]) -> Any:
+        """Return the values of `get_<type_name>` for the FMI wrapper.
+
+        When array variables are read, the values are returned as one NumPy array of the FMI type
+        that the wrapper copies from its buffer, instead of a list converted value by value.
+        """
+        get = getattr(self, f"get_{type_name}")
+        variables = [self.vars.get(vr) for vr in vrs]
+        if None in variables or not any(len(getattr(var, "dimensions", [])) > 0 for var in variables):
+            return get(vrs)
+        import numpy as np
+        dtype = np.dtype(type_name)
+        parts = []
+        # Runs of scalars, and variables of another type raising the TypeError, go through the getter
+        run: List[int] = []
+        for vr, var in zip(vrs, variables):
+            if len(getattr(var, "dimensions", [])) > 0 and _type_name(type(var)) == type_name:
+                if run:
+                    parts.append(np.asarray(get(run), dtype=dtype))
+                    run = []
+                parts.append(np.asarray(self._get_value(var), dtype=dtype))
+            else:
+                run.append(vr)
+        if run:
+            parts.append(np.asarray(get(run), dtype=dtype))
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def _set_buffer(self, type_name: str, vrs: List[int], values: memoryview):
+        """Pass the values of the FMI wrapper to `set_<type_name>`.
+
+        The values are a memoryview of the FMI type. The array variables are written from a NumPy view
+        on it, instead of a list converted value by value; their setters receive that read-only view.
+        """
+        set = getattr(self, f"set_{type_name}")
+        variables = [self.vars.get(vr) for vr in vrs]
+        if None in variables or not any(len(getattr(var, "dimensions", [])) > 0 for var in variables):
+            return set(vrs, values.tolist())
+        import numpy as np
+        buffer = np.frombuffer(values, dtype=type_name)
+        offset = 0
+        # Runs of scalars, and variables of another type raising the TypeError, go through the setter
+        run: List[int] = []
+        for vr, var in zip(vrs, variables):
+            if len(getattr(var, "dimensions", [])) > 0 and _type_name(type(var)) == type_name:
+                if run:
+                    set(run, buffer[offset:offset + len(run)].tolist())
+                    offset += len(run)
+                    run = []
+                size = self._size(var)
+                self._set_value(var, buffer[offset:offset + size])
+                offset += size
+            else:
+                run.append(vr)
+        if run:
+            set(run, buffer[offset:offset + len(run)].tolist())
+
+    @staticmethod
+    def _has_setter(var: ModelVariable) -> bool:
+        return var.setter is not None or var.instance_setter is not None
+
     def register_event_indicator(self, vr):
         self.event_indicators.append(vr)
 
+    def register_partition(self, clock: Clock, partition: Callable[[float], Any]):
+        """Register the model partition executed when an input clock ticks.
+
+        Partitions must be registered in `__init__`, the FMI wrapper looks them up once per instance.
+
+        Args:
+            clock (Clock): The registered input clock activating the partition
+            partition (Callable[[float], Any]): Called with the activation time
+        """
+        if not isinstance(clock, Clock) or clock.value_reference is None:
+            raise ValueError(f"{clock!r} is not a registered Clock variable!")
+        if clock.causality != Fmi3Causality.input:
+            raise ValueError(f"Model partitions are activated by input clocks, {clock.name} is not an input!")
+        self.partitions[clock.value_reference] = partition
+
+    def clock_state(self, clock: Clock) -> ClockState:
+        """Return the interval and shift of a clock in this instance.
+
+        Setting `interval` on the returned state reports the new interval to the importer as changed.
+        """
+        state = self._clock_states.get(clock.value_reference)
+        if state is None:
+            state = self._clock_states[clock.value_reference] = clock.new_state()
+        return state
+
+    def activate_model_partition(self, clock_reference: int, activation_time: float):
+        partition = self.partitions.get(clock_reference)
+        if partition is None:
+            raise ValueError(f"No model partition registered for clock with valueReference={clock_reference}!")
+        partition(activation_time)
+
+    def _get_model_partitions(self) -> Dict[int, Callable[[float], Any]]:
+        return self.partitions
+
+    def _get_computed_values(self) -> Dict[int, Any]:
+        # Cached values of the computed outputs, cleared by the FMI wrapper after the calls advancing the model
+        return self._computed
+
+    def get_variable_dependencies(self, vr: int) -> List[Tuple[int, int, int, int]]:
+        """Return the dependencies of an unknown at runtime.
+
+        Dependencies are declared per variable, so the element indices are always 0.
+        Without declared dependencies the unknown depends on all the inputs and continuous states.
+
+        Returns:
+            List[Tuple[int, int, int, int]] : (elementIndexOfDependent, independent, elementIndexOfIndependent, dependencyKind)
+        """
+        var = self.vars[vr]
+        if var.dependencies is None:
+            states = [v.derivative for v in self.vars.values() if isinstance(v, Float64) and v.derivative is not None]
+            inputs = [v.value_reference for v in self.vars.values() if v.causality == Fmi3Causality.input]
+            return [(0, int(ref), 0, int(Fmi3DependencyKind.dependent)) for ref in inputs + states]
+        kinds = var.dependencies_kind or [Fmi3DependencyKind.dependent] * len(var.dependencies)
+        return [(0, d.value_reference, 0, int(kind)) for d, kind in zip(var.dependencies, kinds)]
+
     def setup_experiment(self, start_time: float):
         pass
 
@@ -270,21 +805,118 @@ class Fmi3SlaveBase(object):
     def exit_initialization_mode(self):
         pass
 
+    def enter_configuration_mode(self):
+        pass
+
+    def exit_configuration_mode(self):
+        """Apply the structural parameters set in (re)configuration mode.
+
+        The registered NumPy arrays whose dimensions refer to a structural parameter are reallocated
+        once to their new size, keeping the overlapping values, and `reconfigure` is called if a
+        structural parameter was changed. Models overriding this method must call it.
+        """
+        self._sizes.clear()
+        for vr, owner in self._resizable.items():
+            self._resize_array(self.vars[vr], owner())
+        if self._changed_structure:
+            changed, self._changed_structure = self._changed_structure, set()
+            self.reconfigure(changed)
+        self._computed.clear()
+
+    def reconfigure(self, parameters: Set[str]):
+        """Rebuild the internal work arrays of the model after a change of its structural parameters.
+
+        Args:
+            parameters (Set[str]): Names of the structural parameters set to a new value
+        """
+        pass
+
+    def _resize_array(self, var: ModelVariable, owner: Any):
+        import numpy as np
+        current = getattr(owner, var.local_name)
+        shape = tuple(int(dim.size(self.vars, self)) for dim in var.dimensions)
+        # Axes beyond the declared dimensions, e.g. of column vectors, are kept
+        shape += current.shape[len(shape):]
+        if current.shape == shape:
+            return
+        resized = np.zeros(shape, dtype=current.dtype)
+        overlap = tuple(slice(0, min(a, b)) for a, b in zip(shape, current.shape))
+        resized[overlap] = current[overlap]
+        setattr(owner, var.local_name, resized)
+
+    def enter_event_mode(self):
+        pass
+
+    def enter_step_mode(self):
+        pass
+
     def do_step(self, current_time: float, step_size: float) -> Fmi3StepResult:
         pass
 
+    def inputs_changed(self) -> bool:
+        """Test if an input or a parameter was set to a new value since the last step."""
+        return len(self._changed_inputs) > 0
+
+    def changed_inputs(self) -> Set[str]:
+        """Names of the inputs and parameters set to a new value since the last step.
+
+        Changes are recorded by the setters of the registered variables, blocks are reported by their name.
+        They are cleared after each step run by a `do_step` decorated with `skip_if_inputs_unchanged`,
+        other models clear them with `clear_changed_inputs`.
+        """
+        return set(self._changed_inputs)
+
+    def clear_changed_inputs(self):
+        self._changed_inputs.clear()
+
     def terminate(self):
         pass
 
+    def get_int8(self, vrs: List[int]) -> List[int]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, Int8, self.get_int8)
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Int8):
+                if len(var.dimensions) == 0:
+                    refs.append(int(self._get_value(var)))
+                else:
+                    refs.extend(map(int, _as_list(self._get_value(var))))
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Int8!"
+                )
+        return refs
+
+    def get_int16(self, vrs: List[int]) -> List[int]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, Int16, self.get_int16)
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Int16):
+                if len(var.dimensions) == 0:
+                    refs.append(int(self._get_value(var)))
+                else:
+                    refs.extend(map(int, _as_list(self._get_value(var))))
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Int16!"
+                )
+        return refs
+
     def get_int32(self, vrs: List[int]) -> List[int]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, Int32, self.get_int32)
         refs = list()
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, Int32):
                 if len(var.dimensions) == 0:
-                    refs.append(int(var.getter()))
+                    refs.append(int(self._get_value(var)))
                 else:
-                    refs.extend(map(int, var.getter()))
+                    refs.extend(map(int, _as_list(self._get_value(var))))
             else:
                 raise TypeError(
                     f"Variable with valueReference={vr} is not of type Int32!"
@@ -292,45 +924,120 @@ class Fmi3SlaveBase(object):
         return refs
     
     def get_int64(self, vrs: List[int]) -> List[int]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, Int64, self.get_int64)
         refs = list()
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, (Enumeration, Int64)):
                 if len(var.dimensions) == 0:
-                    refs.append(int(var.getter()))
+                    refs.append(int(self._get_value(var)))
                 else:
-                    refs.extend(map(int, var.getter()))
+                    refs.extend(map(int, _as_list(self._get_value(var))))
             else:
                 raise TypeError(
                     f"Variable with valueReference={vr} is not of type Int64!"
                 )
         return refs
 
-    def get_uint64(self, vrs: List[int]) -> List[ctypes.c_uint64]:
+    def get_uint8(self, vrs: List[int]) -> List[int]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, UInt8, self.get_uint8)
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, UInt8):
+                if len(var.dimensions) == 0:
+                    refs.append(int(self._get_value(var)))
+                else:
+                    refs.extend(map(int, _as_list(self._get_value(var))))
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type UInt8!"
+                )
+        return refs
+
+    def get_uint16(self, vrs: List[int]) -> List[int]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, UInt16, self.get_uint16)
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, UInt16):
+                if len(var.dimensions) == 0:
+                    refs.append(int(self._get_value(var)))
+                else:
+                    refs.extend(map(int, _as_list(self._get_value(var))))
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type UInt16!"
+                )
+        return refs
+
+    def get_uint32(self, vrs: List[int]) -> List[int]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, UInt32, self.get_uint32)
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, UInt32):
+                if len(var.dimensions) == 0:
+                    refs.append(int(self._get_value(var)))
+                else:
+                    refs.extend(map(int, _as_list(self._get_value(var))))
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type UInt32!"
+                )
+        return refs
+
+    def get_uint64(self, vrs: List[int]) -> List[int]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, UInt64, self.get_uint64)
         refs = list()
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, UInt64):
                 if len(var.dimensions) == 0:
-                    val = var.getter()
-                    refs.append(ctypes.c_uint64(val) if not isinstance(val, ctypes.c_uint64) else val)
+                    val = self._get_value(var)
+                    # Models may still hold their counters as ctypes.c_uint64
+                    refs.append(val.value if isinstance(val, ctypes.c_uint64) else int(val))
                 else:
-                    refs.extend(map(ctypes.c_uint64, var.getter()))
+                    refs.extend(map(int, _as_list(self._get_value(var))))
             else:
                 raise TypeError(
                     f"Variable with valueReference={vr} is not of type Uint64!"
                 )
         return refs
 
+    def get_float32(self, vrs: List[int]) -> List[float]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, Float32, self.get_float32)
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Float32):
+                if len(var.dimensions) == 0:
+                    refs.append(float(self._get_value(var)))
+                else:
+                    refs.extend(map(float, _as_list(self._get_value(var))))
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Float32!"
+                )
+        return refs
+
     def get_float64(self, vrs: List[int]) -> List[float]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, Float64, self.get_float64)
         refs = list()
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, Float64):
                 if len(var.dimensions) == 0:
-                    refs.append(float(var.getter()))
+                    refs.append(float(self._get_value(var)))
                 else:
-                    refs.extend(var.getter())
+                    refs.extend(_as_list(self._get_value(var)))
             else:
                 raise TypeError(
                     f"Variable with valueReference={vr} is not of type Float64!"
@@ -338,14 +1045,16 @@ class Fmi3SlaveBase(object):
         return refs
 
     def get_boolean(self, vrs: List[int]) -> List[bool]:
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._get_block_values(vrs, Boolean, self.get_boolean)
         refs = list()
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, Boolean):
                 if len(var.dimensions) == 0:
-                    refs.append(bool(var.getter()))
+                    refs.append(bool(self._get_value(var)))
                 else:
-                    refs.extend(var.getter())
+                    refs.extend(_as_list(self._get_value(var)))
             
             else:
                 raise TypeError(
@@ -353,28 +1062,118 @@ class Fmi3SlaveBase(object):
                 )
         return refs
 
+    def get_clock(self, vrs: List[int]) -> List[bool]:
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Clock):
+                active = bool(self._get_value(var))
+                refs.append(active)
+                # An output clock is deactivated once its state has been retrieved
+                if active and var.causality == Fmi3Causality.output and self._has_setter(var):
+                    self._set_value(var, False)
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Clock!"
+                )
+        return refs
+
+    def get_interval_decimal(self, vrs: List[int]) -> List[Tuple[float, Fmi3IntervalQualifier]]:
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Clock):
+                refs.append(self.clock_state(var).pop_interval())
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Clock!"
+                )
+        return refs
+
+    def get_shift_decimal(self, vrs: List[int]) -> List[float]:
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Clock):
+                refs.append(float(self.clock_state(var).shift))
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Clock!"
+                )
+        return refs
+
     def get_string(self, vrs: List[int]) -> List[str]:
         refs = list()
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, String):
-                refs.append(str(var.getter()))
+                refs.append(str(self._get_value(var)))
             else:
                 raise TypeError(
                     f"Variable with valueReference={vr} is not of type String!"
                 )
         return refs
 
+    def get_binary(self, vrs: List[int]) -> List[Any]:
+        refs = list()
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Binary):
+                refs.append(self._get_value(var))
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Binary!"
+                )
+        return refs
+
+    def set_int8(self, vrs: List[int], values: List[int]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, Int8, self.set_int8)
+        offset = 0
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Int8):
+                size = self._size(var)
+                if size > 1:
+                    self._set_value(var, values[offset:offset+size])
+                else:
+                    self._set_value(var, values[offset])
+                offset += size
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Int8!"
+                )
+
+    def set_int16(self, vrs: List[int], values: List[int]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, Int16, self.set_int16)
+        offset = 0
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Int16):
+                size = self._size(var)
+                if size > 1:
+                    self._set_value(var, values[offset:offset+size])
+                else:
+                    self._set_value(var, values[offset])
+                offset += size
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Int16!"
+                )
+
     def set_int32(self, vrs: List[int], values: List[int]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, Int32, self.set_int32)
         offset = 0
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, Int32):
-                size = var.size(self.vars)
+                size = self._size(var)
                 if size > 1:
-                    var.setter(values[offset:offset+size])
+                    self._set_value(var, values[offset:offset+size])
                 else:
-                    var.setter(values[offset])
+                    self._set_value(var, values[offset])
                 offset += size
             else:
                 raise TypeError(
@@ -382,47 +1181,125 @@ class Fmi3SlaveBase(object):
                 )
                 
     def set_int64(self, vrs: List[int], values: List[int]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, Int64, self.set_int64)
         offset = 0
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, (Enumeration, Int64)):
-                size = var.size(self.vars)
+                size = self._size(var)
                 if size > 1:
-                    var.setter(values[offset:offset+size])
+                    self._set_value(var, values[offset:offset+size])
                 else:
-                    var.setter(values[offset])
+                    self._set_value(var, values[offset])
                 offset += size
             else:
                 raise TypeError(
                     f"Variable with valueReference={vr} is not of type Int64!"
                 )
 
+    def set_uint8(self, vrs: List[int], values: List[int]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, UInt8, self.set_uint8)
+        offset = 0
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, UInt8):
+                size = self._size(var)
+                if size > 1:
+                    self._set_value(var, values[offset:offset+size])
+                else:
+                    self._set_value(var, values[offset])
+                offset += size
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type UInt8!"
+                )
+
+    def set_uint16(self, vrs: List[int], values: List[int]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, UInt16, self.set_uint16)
+        offset = 0
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, UInt16):
+                size = self._size(var)
+                if size > 1:
+                    self._set_value(var, values[offset:offset+size])
+                else:
+                    self._set_value(var, values[offset])
+                offset += size
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type UInt16!"
+                )
+
+    def set_uint32(self, vrs: List[int], values: List[int]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, UInt32, self.set_uint32)
+        offset = 0
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, UInt32):
+                size = self._size(var)
+                if size > 1:
+                    self._set_value(var, values[offset:offset+size])
+                else:
+                    self._set_value(var, values[offset])
+                offset += size
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type UInt32!"
+                )
+
     def set_uint64(self, vrs: List[int], values: List[int]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, UInt64, self.set_uint64)
         offset = 0
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, UInt64):
-                size = var.size(self.vars)
+                size = self._size(var)
                 if size > 1:
-                    var.setter(values[offset:offset+size])
+                    self._set_value(var, values[offset:offset+size])
                 else:
-                    var.setter(values[offset])
+                    self._set_value(var, values[offset])
                 offset += size
             else:
                 raise TypeError(
                     f"Variable with valueReference={vr} is not of type UInt64!"
                 )
 
+    def set_float32(self, vrs: List[int], values: List[float]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, Float32, self.set_float32)
+        offset = 0
+        for vr in vrs:
+            var = self.vars[vr]
+            if isinstance(var, Float32):
+                size = self._size(var)
+                if size > 1:
+                    self._set_value(var, values[offset:offset+size])
+                else:
+                    self._set_value(var, values[offset])
+                offset += size
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Float32!"
+                )
+
     def set_float64(self, vrs: List[int], values: List[float]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, Float64, self.set_float64)
         offset = 0
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, Float64):
-                size = var.size(self.vars)
+                size = self._size(var)
                 if size > 1:
-                    var.setter(values[offset:offset+size])
+                    self._set_value(var, values[offset:offset+size])
                 else:
-                    var.setter(values[offset])
+                    self._set_value(var, values[offset])
                 offset += size
             else:
                 raise TypeError(
@@ -430,15 +1307,17 @@ class Fmi3SlaveBase(object):
                 )
 
     def set_boolean(self, vrs: List[int], values: List[bool]):
+        if self.blocks and not all(map(self.vars.__contains__, vrs)):
+            return self._set_block_values(vrs, values, Boolean, self.set_boolean)
         offset = 0
         for vr in vrs:
             var = self.vars[vr]
             if isinstance(var, Boolean):
-                size = var.size(self.vars)
+                size = self._size(var)
                 if size > 1:
-                    var.setter(values[offset:offset+size])
+                    self._set_value(var, values[offset:offset+size])
                 else:
-                    var.setter(values[offset])
+                    self._set_value(var, values[offset])
                 offset += size
             else:
                 raise TypeError(
@@ -449,27 +1328,81 @@ class Fmi3SlaveBase(object):
         for vr, value in zip(vrs, values):
             var = self.vars[vr]
             if isinstance(var, String):
-                var.setter(value)
+                self._set_value(var, value)
             else:
                 raise TypeError(
                     f"Variable with valueReference={vr} is not of type String!"
                 )
 
+    def set_clock(self, vrs: List[int], values: List[bool]):
+        for vr, value in zip(vrs, values):
+            var = self.vars[vr]
+            if isinstance(var, Clock):
+                self._set_value(var, bool(value))
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Clock!"
+                )
+
+    def set_interval_decimal(self, vrs: List[int], values: List[float]):
+        for vr, value in zip(vrs, values):
+            var = self.vars[vr]
+            if isinstance(var, Clock):
+                self.clock_state(var).set_interval(value)
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Clock!"
+                )
+
+    def set_shift_decimal(self, vrs: List[int], values: List[float]):
+        for vr, value in zip(vrs, values):
+            var = self.vars[vr]
+            if isinstance(var, Clock):
+                self.clock_state(var).shift = value
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Clock!"
+                )
+
+    def set_binary(self, vrs: List[int], values: List[bytes]):
+        for vr, value in zip(vrs, values):
+            var = self.vars[vr]
+            if isinstance(var, Binary):
+                self._set_value(var, value)
+            else:
+                raise TypeError(
+                    f"Variable with valueReference={vr} is not of type Binary!"
+                )
+
     def _get_fmu_state(self) -> Dict[str, Any]:
         state = dict()
         for var in self.vars.values():
-            state[var.name] = var.getter()
+            if var.value_reference in self._compute_functions:
+                # Computed again from the restored state
+                continue
+            if isinstance(var, Binary):
+                # Copy binary values as they may be mutable buffers
+                state[var.name] = bytes(self._get_value(var))
+            else:
+                state[var.name] = _as_list(self._get_value(var))
+        for block in self.blocks:
+            state[block.name] = block.get_all()
         return state
 
     def _set_fmu_state(self, state: Dict[str, Any]):
-        vars_by_name = dict([(v.name, v) for v in self.vars.values()])
+        names = self._names()
         for name, value in state.items():
-            if name not in vars_by_name:
+            block = self._blocks_by_name.get(name)
+            if block is not None:
+                block.set_all(value)
+                continue
+            v = self.vars.get(names.get(name))
+            if v is None:
                 setattr(self, name, value)
-            else:
-                v = vars_by_name[name]
-                if v.setter is not None:
-                    v.setter(value)
+            elif self._has_setter(v):
+                self._set_value(v, value)
+        self._computed.clear()
+        self._sizes.clear()
 
     def get_number_of_event_indicators(self) -> int:
         return len(self.event_indicators)
@@ -484,12 +1417,13 @@ class Fmi3SlaveBase(object):
         
         for vr in vrs:
             var = self.vars[vr]
-            size = var.size(self.vars)
+            size = self._size(var)
             if size > 1:
-                var.setter(values[offset:offset+size])
+                self._set_value(var, values[offset:offset+size])
             else:
-                var.setter(values[offset])
+                self._set_value(var, values[offset])
             offset += size
+        self._computed.clear()
         
     def get_continuous_states(self) -> List[float]:
         offset = 0
@@ -503,9 +1437,9 @@ class Fmi3SlaveBase(object):
         for vr in vrs:
             var = self.vars[vr]
             if len(var.dimensions) == 0:
-                refs.append(float(var.getter()))
+                refs.append(float(self._get_value(var)))
             else:
-                refs.extend(var.getter())
+                refs.extend(_as_list(self._get_value(var)))
                 
         return refs
     
@@ -517,14 +1451,15 @@ class Fmi3SlaveBase(object):
     
     def set_time(self, time: float):
         self.time = time
+        self._computed.clear()
 
     @staticmethod
     def _fmu_state_to_bytes(state: Dict[str, Any]) -> bytes:
-        return json.dumps(state).encode("utf-8")
+        return json.dumps(state, default=_encode_binary).encode("utf-8")
 
     @staticmethod
     def _fmu_state_from_bytes(state: bytes) -> Dict[str, Any]:
-        return json.loads(state.decode("utf-8"))
+        return json.loads(state.decode("utf-8"), object_hook=_decode_binary)
 
     def _get_log_queue(self):
         return self.log_queue
@@ -0,0 +1,302 @@
+"""Load a PythonFMU3 FMU in the calling Python interpreter.
+
+Python-hosted masters can execute the model class of a PythonFMU3 FMU directly instead of going
+through the shared library, which converts every value from Python to C and back to Python.
+The instances expose the FMI 3 functions with the names and return values of `fmpy.fmi3`.
+"""
+import importlib.machinery
+import importlib.util
+import shutil
+import sys
+import tempfile
+import uuid
+import zipfile
+import zipimport
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from .builder import PYTHON_BUNDLE, get_class_name
+from .enums import Fmi3Status
+from .fmi3slave import Fmi3SlaveBase
+from .simulate import _step_result
+
+FilePath = Union[str, Path]
+
+SLAVE_MODULE = "resources/slavemodule.txt"
+
+# FMI types handled by the fmi3Get<Type>/fmi3Set<Type> functions
+FMI3_TYPES = ("Float32", "Float64", "Int8", "Int16", "Int32", "Int64", "UInt8", "UInt16", "UInt32", "UInt64", "Boolean", "String", "Binary", "Clock")
+
+
+def is_python_fmu(filename: FilePath) -> bool:
+    """Test if an FMU (file or extracted folder) was built by PythonFMU3."""
+    filename = Path(filename)
+    if filename.is_dir():
+        return (filename / SLAVE_MODULE).is_file()
+    try:
+        with zipfile.ZipFile(filename) as fmu:
+            return SLAVE_MODULE in fmu.namelist()
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+class Fmi3CallError(Exception):
+    """An FMI call of an in-process instance returned a status worse than warning."""
+
+    def __init__(self, function: str, status: Fmi3Status):
+        super().__init__(f"{function} failed with status {status.name}")
+        self.function = function
+        self.status = status
+
+
+def _load_slave_class(resources: Path) -> type:
+    lines = (resources / "slavemodule.txt").read_text().splitlines()
+    module_name = lines[0].strip()
+    class_name = lines[1].strip() if len(lines) > 1 else ""
+
+    # The model is loaded under a unique name, so that the same module of several FMUs loads side by side
+    unique_name = f"{module_name}_{uuid.uuid4().hex}"
+    source = resources / f"{module_name}.py"
+    bundle = resources / PYTHON_BUNDLE
+    # Same lookup as the FMU binary for the local dependencies: the resources folder, then the bundled sources
+    paths = [str(path) for path in (resources, bundle) if path.exists()]
+    for path in paths:
+        sys.path.insert(0, path)
+    try:
+        if source.exists():
+            spec = importlib.util.spec_from_file_location(unique_name, source)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[unique_name] = module
+            spec.loader.exec_module(module)
+        else:
+            # zipimport loads the modules by name, its code is run in the uniquely named module
+            code = zipimport.zipimporter(str(bundle)).get_code(module_name)
+            module = importlib.util.module_from_spec(importlib.machinery.ModuleSpec(unique_name, None, origin=str(bundle / source.name)))
+            sys.modules[unique_name] = module
+            exec(code, module.__dict__)
+    finally:
+        for path in paths:
+            sys.path.remove(path)
+
+    if not class_name:
+        class_name = get_class_name(source)
+    return getattr(module, class_name)
+
+
+class InProcessFmu:
+    """Instance of a PythonFMU3 FMU executed in the calling Python interpreter.
+
+    The methods follow the FMI 3 functions (without the `fmi3` prefix), value references and values are
+    Python sequences and the results are returned instead of written to output arguments. Python
+    exceptions raised by the model are propagated to the caller.
+
+    Args:
+        filename (str or Path): FMU file or extracted FMU folder
+        instance_name (str): Name of the instance
+        logger (Callable[[Fmi3Status, str, str], None]): Optional, called with the status, category and
+            message of the messages logged by the model
+    """
+
+    def __init__(self, filename: FilePath, instance_name: str = "instance", logger: Optional[Callable[[Fmi3Status, str, str], None]] = None):
+        filename = Path(filename)
+        if not is_python_fmu(filename):
+            raise ValueError(f"{filename} is not a PythonFMU3 FMU")
+        self._tempdir = None
+        if filename.is_dir():
+            self.unzipdir = filename
+        else:
+            self._tempdir = tempfile.mkdtemp(prefix="pythonfmu3_")
+            with zipfile.ZipFile(filename) as fmu:
+                fmu.extractall(self._tempdir)
+            self.unzipdir = Path(self._tempdir)
+        self.resources = self.unzipdir / "resources"
+        self.instance_name = instance_name
+        self.logger = logger
+        self.logging_on = False
+        self.slave_class = _load_slave_class(self.resources)
+        self.instance: Optional[Fmi3SlaveBase] = None
+        self._instance_kwargs = {}
+
+    def _flush_log(self):
+        queue = self.instance._get_log_queue()
+        for msg in queue:
+            if self.logger is not None and (self.logging_on or not msg.debug):
+                self.logger(Fmi3Status(msg.status), msg.category or "", msg.msg)
+        queue.clear()
+
+    def _call(self, method: str, *args) -> Any:
+        try:
+            return getattr(self.instance, method)(*args)
+        finally:
+            self._flush_log()
+
+    def instantiate(self, visible: bool = False, loggingOn: bool = False, eventModeUsed: bool = False, earlyReturnAllowed: bool = False):
+        self.logging_on = loggingOn
+        self._instance_kwargs = dict(
+            instance_name=self.instance_name,
+            resources=str(self.resources),
+            visible=visible,
+            event_mode_used=eventModeUsed,
+            early_return_allowed=earlyReturnAllowed,
+        )
+        self.instance = self.slave_class(**self._instance_kwargs)
+
+    def freeInstance(self):
+        self.instance = None
+        if self._tempdir is not None:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
+
+    def reset(self):
+        # The FMU binary also creates a new instance of the model class
+        self.instance = self.slave_class(**self._instance_kwargs)
+
+    def enterInitializationMode(self, tolerance: Optional[float] = None, startTime: float = 0.0, stopTime: Optional[float] = None):
+        self._call("setup_experiment", startTime)
+        self._call("enter_initialization_mode")
+
+    def exitInitializationMode(self):
+        self._call("exit_initialization_mode")
+
+    def enterConfigurationMode(self):
+        self._call("enter_configuration_mode")
+
+    def exitConfigurationMode(self):
+        self._call("exit_configuration_mode")
+
+    def enterEventMode(self):
+        self._call("enter_event_mode")
+
+    def enterStepMode(self):
+        self._call("enter_step_mode")
+
+    def enterContinuousTimeMode(self):
+        pass
+
+    def terminate(self):
+        self._call("terminate")
+
+    def doStep(self, currentCommunicationPoint: float, communicationStepSize: float, noSetFMUStatePriorToCurrentPoint: bool = True) -> Tuple[bool, bool, bool, float]:
+        result = self._call("do_step", currentCommunicationPoint, communicationStepSize)
+        status, terminate = _step_result(result)
+        if status > Fmi3Status.warning:
+            raise Fmi3CallError("doStep", status)
+
+        end_time = currentCommunicationPoint + communicationStepSize
+        # Events and early returns are only reported when the importer asked for them
+        event = self.instance.event_mode_used and bool(getattr(result, "eventHandlingNeeded", False))
+        early_return = False
+        if self.instance.early_return_allowed and getattr(result, "earlyReturn", False):
+            last_time = getattr(result, "lastSuccessfulTime", None)
+            if last_time is not None:
+                early_return, end_time = True, last_time
+        return event, terminate, early_return, end_time
+
+    def updateDiscreteStates(self) -> Tuple[bool, bool, bool, bool, bool, float]:
+        result = self._call("update_discrete_states")
+        return (result.discreteStateNeedsUpdate, result.terminateSimulation, result.nominalsOfContinuousStatesChanged,
+                result.valuesOfContinuousStatesChanged, result.nextEventTimeDefined, result.nextEventTime)
+
+    def setTime(self, time: float):
+        self._call("set_time", time)
+
+    def getNumberOfContinuousStates(self) -> int:
+        return self._call("get_number_of_continuous_states")
+
+    def getNumberOfEventIndicators(self) -> int:
+        return self._call("get_number_of_event_indicators")
+
+    def getContinuousStates(self) -> List[float]:
+        return list(self._call("get_continuous_states"))
+
+    def setContinuousStates(self, values: Sequence[float]):
+        self._call("set_continuous_states", list(values))
+
+    def getContinuousStateDerivatives(self) -> List[float]:
+        return list(self._call("get_continuous_state_derivatives"))
+
+    def getEventIndicators(self) -> List[float]:
+        return list(self._call("get_event_indicators"))
+
+    def getNominalsOfContinuousStates(self) -> List[float]:
+        return list(self._call("get_nominals_of_continuous_states", self.getNumberOfContinuousStates()))
+
+    def getNumberOfVariableDependencies(self, valueReference: int) -> int:
+        return len(self._call("get_variable_dependencies", valueReference))
+
+    def getVariableDependencies(self, dependent: int) -> Tuple[List[int], List[int], List[int], List[int]]:
+        dependencies = self._call("get_variable_dependencies", dependent)
+        return tuple(list(column) for column in zip(*dependencies)) if dependencies else ([], [], [], [])
+
+    def getOutputDerivatives(self, valueReferences: Sequence[int], orders: Sequence[int]) -> List[float]:
+        return self._call("get_output_derivatives", list(valueReferences), list(orders))
+
+    def getIntervalDecimal(self, valueReferences: Sequence[int]) -> Tuple[List[float], List[int]]:
+        intervals = self._call("get_interval_decimal", list(valueReferences))
+        return [interval for interval, _ in intervals], [int(qualifier) for _, qualifier in intervals]
+
+    def setIntervalDecimal(self, valueReferences: Sequence[int], intervals: Sequence[float]):
+        self._call("set_interval_decimal", list(valueReferences), list(intervals))
+
+    def getShiftDecimal(self, valueReferences: Sequence[int]) -> List[float]:
+        return self._call("get_shift_decimal", list(valueReferences))
+
+    def setShiftDecimal(self, valueReferences: Sequence[int], shifts: Sequence[float]):
+        self._call("set_shift_decimal", list(valueReferences), list(shifts))
+
+    def activateModelPartition(self, clockReference: int, activationTime: float):
+        self._call("activate_model_partition", clockReference, activationTime)
+
+    def getFMUState(self) -> Any:
+        return self._call("_get_fmu_state")
+
+    def setFMUState(self, state: Any):
+        self._call("_set_fmu_state", state)
+
+    def freeFMUState(self, state: Any):
+        pass
+
+    def serializeFMUState(self, state: Any) -> bytes:
+        return Fmi3SlaveBase._fmu_state_to_bytes(state)
+
+    def deserializeFMUState(self, serializedState: bytes) -> Any:
+        return Fmi3SlaveBase._fmu_state_from_bytes(serializedState)
+
+
+def _getter(fmi_type: str) -> Callable[[InProcessFmu, Sequence[int]], List[Any]]:
+    method = f"get_{fmi_type.lower()}"
+
+    def get(self: InProcessFmu, valueReferences: Sequence[int], nValues: Optional[int] = None) -> List[Any]:
+        return self._call(method, list(valueReferences))
+    get.__name__ = f"get{fmi_type}"
+    return get
+
+
+def _setter(fmi_type: str) -> Callable[[InProcessFmu, Sequence[int], Sequence[Any]], None]:
+    method = f"set_{fmi_type.lower()}"
+
+    def set(self: InProcessFmu, valueReferences: Sequence[int], values: Sequence[Any]):
+        self._call(method, list(valueReferences), list(values))
+    set.__name__ = f"set{fmi_type}"
+    return set
+
+
+for _fmi_type in FMI3_TYPES:
+    setattr(InProcessFmu, f"get{_fmi_type}", _getter(_fmi_type))
+    setattr(InProcessFmu, f"set{_fmi_type}", _setter(_fmi_type))
+
+
+def load_fmu(filename: FilePath, instance_name: str = "instance", **kwargs) -> InProcessFmu:
+    """Load and instantiate a PythonFMU3 FMU in the calling interpreter.
+
+    Args:
+        filename (str or Path): FMU file or extracted FMU folder
+        instance_name (str): Name of the instance
+        **kwargs: `logger` and the arguments of `InProcessFmu.instantiate`
+
+    Returns:
+        InProcessFmu : the instantiated FMU
+    """
+    fmu = InProcessFmu(filename, instance_name, logger=kwargs.pop("logger", None))
+    fmu.instantiate(**kwargs)
+    return fmu
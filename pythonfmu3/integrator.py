@@ -0,0 +1,233 @@
+"""Co-simulation interface integrating a model exchange model in Python."""
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .cosimulation import CoSimulation
+from .enums import Fmi3Causality, Fmi3Status
+from .fmi3slave import Fmi3SlaveBase, Fmi3StepResult, _as_list
+from .modelexchange import Fmi3UpdateDiscreteStatesResult
+from .variables import Float64
+
+# Integration methods of scipy.integrate.solve_ivp
+SCIPY_INTEGRATORS = ("RK45", "RK23", "DOP853", "Radau", "BDF", "LSODA")
+# Fixed-step method available without SciPy
+FALLBACK_INTEGRATOR = "RK4"
+
+# Maximal number of events handled within one communication step
+MAX_EVENTS_PER_STEP = 1000
+
+
+def _rk4_step(rhs: Callable[[float, List[float]], List[float]], t: float, x: List[float], h: float) -> List[float]:
+    k1 = rhs(t, x)
+    k2 = rhs(t + h / 2, [xi + h / 2 * ki for xi, ki in zip(x, k1)])
+    k3 = rhs(t + h / 2, [xi + h / 2 * ki for xi, ki in zip(x, k2)])
+    k4 = rhs(t + h, [xi + h * ki for xi, ki in zip(x, k3)])
+    return [xi + h / 6 * (a + 2 * b + 2 * c + d) for xi, a, b, c, d in zip(x, k1, k2, k3, k4)]
+
+
+def _sign_changed(z: Sequence[float], new_z: Sequence[float]) -> bool:
+    return any((a > 0) != (b > 0) for a, b in zip(z, new_z))
+
+
+# co-simulation mixin for model exchange models
+class IntegratedCoSimulation(CoSimulation):
+    """
+    Implement `do_step` by integrating the model exchange equations of the class.
+
+    Classes derived from IntegratedCoSimulation must also derive from ModelExchange, and list
+    IntegratedCoSimulation before Fmi3SlaveBase, e.g. `class Model(IntegratedCoSimulation, Fmi3SlaveBase, ModelExchange)`.
+    All the right-hand side evaluations stay in Python, the importer only calls `fmi3DoStep`.
+
+    State events are detected on the sign changes of `get_event_indicators` and time events with the
+    `nextEventTime` returned by `update_discrete_states`; both are handled with `update_discrete_states`.
+
+    Class attributes:
+    - `integrator`: A method of `scipy.integrate.solve_ivp` (default "RK45", "BDF" for stiff models)
+      or "RK4"; the fixed-step RK4 method is used when SciPy is not installed.
+    - `integrator_step`: Maximal step of the integrator, default the communication step size
+    - `rtol`, `atol`: Tolerances of the SciPy integrators
+    - `event_tolerance`: Time tolerance of the state event location with the RK4 method
+
+    The first derivatives of the outputs that are continuous states are provided to the importer
+    from the state derivatives at the end of the step.
+    """
+
+    integrator: str = "RK45"
+    integrator_step: Optional[float] = None
+    rtol: float = 1e-6
+    atol: float = 1e-9
+    event_tolerance: float = 1e-10
+
+    # Time of the pending time event and whether the initial event iteration ran, saved with the FMU state
+    _next_event_time: Optional[float] = None
+    _events_initialized: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        owner = next(base for base in cls.__mro__ if "do_step" in base.__dict__)
+        if owner is Fmi3SlaveBase:
+            raise TypeError(
+                f"{cls.__name__} must list IntegratedCoSimulation before Fmi3SlaveBase in its bases, "
+                "whose default do_step would otherwise be used"
+            )
+
+    def do_step(self, current_time: float, step_size: float) -> Fmi3StepResult:
+        end_time = current_time + step_size
+        eps = 1e-12 * max(1.0, abs(end_time))
+
+        if not self._events_initialized:
+            # Initial event iteration, done by the importer for model exchange
+            self.set_time(current_time)
+            result = self._handle_events()
+            self._events_initialized = True
+            self._next_event_time = result.nextEventTime if result.nextEventTimeDefined else None
+            if result.terminateSimulation:
+                return Fmi3StepResult(terminateSimulation=True, earlyReturn=self.early_return_allowed, lastSuccessfulTime=current_time)
+
+        time = current_time
+        states = list(self.get_continuous_states())
+        next_event = self._next_event_time
+
+        for _ in range(MAX_EVENTS_PER_STEP):
+            stop_time = end_time if next_event is None else min(end_time, next_event)
+            if stop_time > time + eps:
+                time, states, state_event = self._integrate(time, stop_time, states)
+            else:
+                state_event = False
+            self.set_time(time)
+            self.set_continuous_states(states)
+
+            time_event = next_event is not None and next_event <= time + eps
+            if state_event or time_event:
+                result = self._handle_events()
+                next_event = result.nextEventTime if result.nextEventTimeDefined else None
+                self._next_event_time = next_event
+                if result.terminateSimulation:
+                    return Fmi3StepResult(terminateSimulation=True, earlyReturn=self.early_return_allowed, lastSuccessfulTime=time)
+                if result.valuesOfContinuousStatesChanged:
+                    states = list(self.get_continuous_states())
+
+            if time >= end_time - eps:
+                # Refresh the variables computed with the derivatives at the end of the step
+                self.get_continuous_state_derivatives()
+                return Fmi3StepResult()
+
+        self.log(f"More than {MAX_EVENTS_PER_STEP} events within the step at t={current_time}", Fmi3Status.error)
+        return Fmi3StepResult(status=Fmi3Status.error)
+
+    def _get_fmu_state(self) -> Dict[str, Any]:
+        state = super()._get_fmu_state()
+        # Restored as attributes by _set_fmu_state
+        state["_events_initialized"] = self._events_initialized
+        state["_next_event_time"] = self._next_event_time
+        return state
+
+    @property
+    def max_output_derivative_order(self) -> int:
+        """int: 1 if an output is a continuous state, its derivative being provided, 0 otherwise"""
+        return 1 if any(self.vars[vr].causality == Fmi3Causality.output for vr in self._state_derivatives()) else 0
+
+    def _state_derivatives(self) -> Dict[int, Float64]:
+        # Derivative variables by value reference of their continuous state
+        return {int(v.derivative): v for v in self.vars.values() if isinstance(v, Float64) and v.derivative is not None}
+
+    def get_output_derivatives(self, vrs: List[int], orders: List[int]) -> List[float]:
+        derivatives = self._state_derivatives()
+        values = []
+        for vr, order in zip(vrs, orders):
+            if order != 1 or vr not in derivatives:
+                raise ValueError(f"Variable with valueReference={vr} has no derivative of order {order}")
+            value = self._get_value(derivatives[vr])
+            values.extend(_as_list(value) if len(derivatives[vr].dimensions) > 0 else [value])
+        return values
+
+    def _handle_events(self) -> Fmi3UpdateDiscreteStatesResult:
+        # Event iteration: repeat until the discrete states have converged
+        while True:
+            result = self.update_discrete_states()
+            if result.terminateSimulation or not result.discreteStateNeedsUpdate:
+                return result
+
+    def _rhs(self, t: float, x: Sequence[float]) -> List[float]:
+        self.set_time(t)
+        self.set_continuous_states(list(x))
+        return list(self.get_continuous_state_derivatives())
+
+    def _indicators(self, t: float, x: Sequence[float]) -> List[float]:
+        self.set_time(t)
+        self.set_continuous_states(list(x))
+        return list(self.get_event_indicators())
+
+    def _integrate(self, t0: float, t1: float, x0: List[float]) -> Tuple[float, List[float], bool]:
+        """Integrate from t0 to t1, stopping at the first state event.
+
+        Returns:
+            Tuple[float, List[float], bool] : time reached, states at that time and whether a state event occurred
+        """
+        if self.integrator != FALLBACK_INTEGRATOR:
+            try:
+                from scipy.integrate import solve_ivp
+            except ImportError:
+                self.log(f"SciPy is not installed, {FALLBACK_INTEGRATOR} is used instead of {self.integrator}", Fmi3Status.warning)
+                self.integrator = FALLBACK_INTEGRATOR
+            else:
+                return self._integrate_scipy(solve_ivp, t0, t1, x0)
+        return self._integrate_rk4(t0, t1, x0)
+
+    def _integrate_scipy(self, solve_ivp, t0: float, t1: float, x0: List[float]) -> Tuple[float, List[float], bool]:
+        if self.integrator not in SCIPY_INTEGRATORS:
+            raise ValueError(f"Unknown integrator {self.integrator}, expected one of {SCIPY_INTEGRATORS + (FALLBACK_INTEGRATOR,)}")
+
+        z0 = self._indicators(t0, x0)
+        events = []
+        for i in range(len(z0)):
+            def event(t, x, i=i):
+                return self._indicators(t, x)[i]
+            event.terminal = True
+            events.append(event)
+
+        kwargs = dict(method=self.integrator, rtol=self.rtol, atol=self.atol)
+        if self.integrator_step is not None:
+            kwargs["max_step"] = self.integrator_step
+        solution = solve_ivp(self._rhs, (t0, t1), x0, events=events or None, **kwargs)
+        if solution.status < 0:
+            raise RuntimeError(f"Integration failed at t={solution.t[-1]}: {solution.message}")
+        t, x = float(solution.t[-1]), [float(v) for v in solution.y[:, -1]]
+        if solution.status != 1:
+            return t, x, False
+        # The located root may lie on either side of the sign change, step past it
+        dt = self.event_tolerance
+        while not _sign_changed(z0, self._indicators(t, x)) and t + dt <= t1:
+            x = _rk4_step(self._rhs, t, x, dt)
+            t += dt
+            dt *= 2
+        return t, x, True
+
+    def _integrate_rk4(self, t0: float, t1: float, x0: List[float]) -> Tuple[float, List[float], bool]:
+        h_max = self.integrator_step or (t1 - t0)
+        n_steps = max(1, math.ceil((t1 - t0) / h_max - 1e-9))
+        h = (t1 - t0) / n_steps
+
+        t, x = t0, x0
+        z = self._indicators(t, x)
+        for step in range(n_steps):
+            t_next = t1 if step == n_steps - 1 else t0 + (step + 1) * h
+            x_next = _rk4_step(self._rhs, t, x, t_next - t)
+            z_next = self._indicators(t_next, x_next)
+            if _sign_changed(z, z_next):
+                return self._locate_event(t, x, z, t_next)
+            t, x, z = t_next, x_next, z_next
+        return t, x, False
+
+    def _locate_event(self, t0: float, x0: List[float], z0: List[float], t1: float) -> Tuple[float, List[float], bool]:
+        # Bisection on the time of the first sign change, each trial restarts from t0
+        lo, hi = t0, t1
+        x_hi = _rk4_step(self._rhs, t0, x0, t1 - t0)
+        while hi - lo > self.event_tolerance:
+            mid = (lo + hi) / 2
+            x_mid = _rk4_step(self._rhs, t0, x0, mid - t0)
+            if _sign_changed(z0, self._indicators(mid, x_mid)):
+                hi, x_hi = mid, x_mid
+            else:
+                lo = mid
+        return hi, x_hi, True
@@ -0,0 +1,317 @@
+"""Asyncio co-simulation master stepping Python models in-process or in worker processes."""
+import asyncio
+import multiprocessing
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .builder import instantiate_slave
+from .enums import Fmi3Causality, Fmi3Status
+from .fmi3slave import Fmi3SlaveBase
+from .names import _type_name
+from .simulate import _step_result
+from .variables import ModelVariable
+
+FilePath = Union[str, Path]
+
+
+class VariableInfo(NamedTuple):
+    value_reference: int
+    # Suffix of the get_<type>/set_<type> facade methods, e.g. "float64"
+    type_name: str
+    causality: Optional[Fmi3Causality]
+    scalar: bool
+
+
+class Connection(NamedTuple):
+    source: str
+    output: str
+    target: str
+    input: str
+
+
+def _variable_info(var: ModelVariable) -> VariableInfo:
+    return VariableInfo(var.value_reference, _type_name(type(var)), var.causality, len(getattr(var, "dimensions", [])) == 0)
+
+
+def _model_variables(slave: Fmi3SlaveBase) -> Dict[str, VariableInfo]:
+    return {v.name: _variable_info(v) for v in slave._variables_with_blocks()}
+
+
+def _check_step(name: str, time: float, result: Any) -> bool:
+    status, terminate = _step_result(result)
+    if status > Fmi3Status.warning:
+        raise RuntimeError(f"do_step of {name} at t={time} returned status {status.name}")
+    return terminate
+
+
+class LocalSlave:
+    """Run a model instance in the master process.
+
+    The calls are made from the event loop: in-process models share the interpreter and do not overlap.
+    """
+
+    def __init__(self, name: str, slave: Fmi3SlaveBase):
+        self.name = name
+        self.slave = slave
+
+    async def start(self) -> Dict[str, VariableInfo]:
+        return _model_variables(self.slave)
+
+    async def call(self, method: str, *args) -> Any:
+        return getattr(self.slave, method)(*args)
+
+    async def do_step(self, current_time: float, step_size: float) -> bool:
+        return _check_step(self.name, current_time, self.slave.do_step(current_time, step_size))
+
+    async def stop(self):
+        pass
+
+
+def _worker(connection, script_file: str, instance_name: str):
+    # Entry point of the worker processes: serve (method, args) requests until None is received
+    script_file = Path(script_file)
+    slave = instantiate_slave(script_file, script_file.stem, instance_name=instance_name)
+    connection.send(_model_variables(slave))
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        method, args = request
+        try:
+            result = getattr(slave, method)(*args)
+            if method == "do_step":
+                result = _check_step(instance_name, args[0], result)
+            connection.send((True, result))
+        except Exception as e:
+            connection.send((False, e))
+    connection.close()
+
+
+class ProcessSlave:
+    """Run a model defined in a Python script in a worker process.
+
+    The requests are sent through a pipe and awaited in a thread, so the steps of several worker
+    processes overlap.
+    """
+
+    def __init__(self, name: str, script_file: FilePath):
+        self.name = name
+        self.script_file = Path(script_file)
+        self._connection = None
+        self._process = None
+        self._lock = threading.Lock()
+
+    def _request(self, request: Any) -> Any:
+        with self._lock:
+            self._connection.send(request)
+            return self._connection.recv()
+
+    async def start(self) -> Dict[str, VariableInfo]:
+        context = multiprocessing.get_context("spawn")
+        self._connection, child = context.Pipe()
+        self._process = context.Process(target=_worker, args=(child, str(self.script_file), self.name), daemon=True)
+        self._process.start()
+        child.close()
+        return await asyncio.get_running_loop().run_in_executor(None, self._connection.recv)
+
+    async def call(self, method: str, *args) -> Any:
+        success, result = await asyncio.get_running_loop().run_in_executor(None, self._request, (method, args))
+        if not success:
+            raise result
+        return result
+
+    async def do_step(self, current_time: float, step_size: float) -> bool:
+        return await self.call("do_step", current_time, step_size)
+
+    async def stop(self):
+        if self._process is not None:
+            self._connection.send(None)
+            await asyncio.get_running_loop().run_in_executor(None, self._process.join)
+            self._connection.close()
+            self._process = None
+
+
+class CoSimulationMaster:
+    """Fixed-step co-simulation master.
+
+    Models are stepped in topological order of their connections: the models of one level only
+    depend on the outputs of previous levels, which are set before the level is stepped, and the
+    steps of a level are run concurrently. Models in an algebraic loop are stepped last, with the
+    loop inputs taken from the previous communication point. The values are exchanged with one
+    `get_<type>`/`set_<type>` call per model and variable type.
+    """
+
+    def __init__(self):
+        self.slaves: Dict[str, Union[LocalSlave, ProcessSlave]] = {}
+        self.connections: List[Connection] = []
+        self.variables: Dict[str, Dict[str, VariableInfo]] = {}
+        self.start_values: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        # (level, transfers to the level) pairs resolved when the models are started
+        self._schedule: List[Tuple[List[str], Dict[Tuple[str, str], List[Tuple[int, str, int]]]]] = []
+
+    def add_slave(self, name: str, slave: Fmi3SlaveBase):
+        """Add a model instance executed in the master process."""
+        self._add(LocalSlave(name, slave))
+
+    def add_process_slave(self, name: str, script_file: FilePath):
+        """Add a model defined in a Python script, executed in a worker process."""
+        self._add(ProcessSlave(name, script_file))
+
+    def _add(self, slave: Union[LocalSlave, ProcessSlave]):
+        if slave.name in self.slaves:
+            raise ValueError(f"A model named {slave.name} was already added")
+        self.slaves[slave.name] = slave
+
+    def connect(self, source: str, output: str, target: str, input: str):
+        """Connect the output of a model to the input of another one."""
+        for name in (source, target):
+            if name not in self.slaves:
+                raise ValueError(f"Unknown model {name}")
+        self.connections.append(Connection(source, output, target, input))
+
+    def set_start_value(self, slave: str, name: str, value: Any):
+        """Set a scalar variable of a model in initialization mode, e.g. a parameter."""
+        if slave not in self.slaves:
+            raise ValueError(f"Unknown model {slave}")
+        self.start_values[slave][name] = value
+
+    def levels(self) -> List[List[str]]:
+        """Group the models by topological level of the connection graph, models in loops come last."""
+        upstream = defaultdict(set)
+        for c in self.connections:
+            if c.source != c.target:
+                upstream[c.target].add(c.source)
+
+        levels = []
+        done = set()
+        remaining = list(self.slaves)
+        while remaining:
+            level = [name for name in remaining if upstream[name] <= done]
+            if not level:
+                # Algebraic loop: step the rest with the values of the previous communication point
+                levels.append(remaining)
+                break
+            levels.append(level)
+            done.update(level)
+            remaining = [name for name in remaining if name not in done]
+        return levels
+
+    def _variable(self, slave: str, name: str) -> VariableInfo:
+        try:
+            return self.variables[slave][name]
+        except KeyError:
+            raise ValueError(f"Unknown variable {name} in model {slave}") from None
+
+    def _transfers(self, targets: List[str]) -> Dict[Tuple[str, str], List[Tuple[int, str, int]]]:
+        # Group the connections to the targets by source and type: (output, target, input) value references
+        gets = defaultdict(list)
+        for c in self.connections:
+            if c.target in targets:
+                output, input = self._variable(c.source, c.output), self._variable(c.target, c.input)
+                if output.type_name != input.type_name:
+                    raise TypeError(f"Cannot connect {c.source}.{c.output} ({output.type_name}) to {c.target}.{c.input} ({input.type_name})")
+                gets[(c.source, output.type_name)].append((output.value_reference, c.target, input.value_reference))
+        return gets
+
+    async def _exchange(self, gets: Dict[Tuple[str, str], List[Tuple[int, str, int]]]):
+        if not gets:
+            return
+        keys = list(gets)
+        values = await asyncio.gather(*(
+            self.slaves[source].call(f"get_{type_name}", [vr for vr, _, _ in gets[(source, type_name)]]) for source, type_name in keys
+        ))
+
+        sets = defaultdict(lambda: ([], []))
+        for (source, type_name), source_values in zip(keys, values):
+            for (_, target, input_vr), value in zip(gets[(source, type_name)], source_values):
+                vrs, target_values = sets[(target, type_name)]
+                vrs.append(input_vr)
+                target_values.append(value)
+        await asyncio.gather(*(
+            self.slaves[target].call(f"set_{type_name}", vrs, target_values) for (target, type_name), (vrs, target_values) in sets.items()
+        ))
+
+    async def start(self, start_time: float = 0.0):
+        """Start the models and initialize them, propagating the connected values level by level."""
+        names = list(self.slaves)
+        variables = await asyncio.gather(*(self.slaves[name].start() for name in names))
+        self.variables = dict(zip(names, variables))
+        for c in self.connections:
+            if not (self._variable(c.source, c.output).scalar and self._variable(c.target, c.input).scalar):
+                raise ValueError(f"Cannot connect {c.source}.{c.output} to {c.target}.{c.input}, only scalar variables can be connected")
+
+        await asyncio.gather(*(slave.call("setup_experiment", start_time) for slave in self.slaves.values()))
+        await asyncio.gather(*(slave.call("enter_initialization_mode") for slave in self.slaves.values()))
+        sets = defaultdict(lambda: ([], []))
+        for slave, values in self.start_values.items():
+            for name, value in values.items():
+                var = self._variable(slave, name)
+                vrs, slave_values = sets[(slave, var.type_name)]
+                vrs.append(var.value_reference)
+                slave_values.append(value)
+        await asyncio.gather(*(
+            self.slaves[slave].call(f"set_{type_name}", vrs, values) for (slave, type_name), (vrs, values) in sets.items()
+        ))
+        self._schedule = [(level, self._transfers(level)) for level in self.levels()]
+        for _, gets in self._schedule:
+            await self._exchange(gets)
+        await asyncio.gather(*(slave.call("exit_initialization_mode") for slave in self.slaves.values()))
+
+    async def step(self, time: float, step_size: float) -> bool:
+        """Run one communication step; return True if a model requested to terminate the simulation."""
+        terminate = False
+        for level, gets in self._schedule:
+            await self._exchange(gets)
+            results = await asyncio.gather(*(self.slaves[name].do_step(time, step_size) for name in level))
+            terminate = terminate or any(results)
+        return terminate
+
+    async def stop(self):
+        """Terminate the models and stop the worker processes."""
+        try:
+            await asyncio.gather(*(slave.call("terminate") for slave in self.slaves.values()))
+        finally:
+            await asyncio.gather(*(slave.stop() for slave in self.slaves.values()))
+
+    async def simulate(
+        self,
+        start_time: float,
+        stop_time: float,
+        step_size: float,
+        observer: Optional[Callable[[float], Any]] = None
+    ) -> float:
+        """Start the models, step them from start to stop time and stop them.
+
+        Args:
+            start_time (float) : Start time
+            stop_time (float) : Stop time
+            step_size (float) : Communication step size
+            observer (Callable[[float], Any]) : optional, called after each communication step with the time reached
+
+        Returns:
+            float : time reached, before stop time if a model terminated the simulation
+        """
+        n_steps = max(1, int(round((stop_time - start_time) / step_size)))
+        time = start_time
+        try:
+            await self.start(start_time)
+        except BaseException:
+            await asyncio.gather(*(slave.stop() for slave in self.slaves.values()))
+            raise
+        try:
+            for step in range(n_steps):
+                terminate = await self.step(time, step_size)
+                time = start_time + (step + 1) * step_size
+                if observer is not None:
+                    observer(time)
+                if terminate:
+                    break
+        finally:
+            await self.stop()
+        return time
+
+    def run(self, start_time: float, stop_time: float, step_size: float, observer: Optional[Callable[[float], Any]] = None) -> float:
+        """Blocking version of `simulate`, running its own event loop."""
+        return asyncio.run(self.simulate(start_time, stop_time, step_size, observer))
@@ -32,6 +32,9 @@ class ModelExchange(ABC, metaclass=RequireTimeMeta):
     Optional methods:
     - `get_event_indicators`: Should return a list of event indicators.
     - `update_discrete_states`: Signify converged solution at current super-dense time instant.
+
+    The continuous state derivatives, event indicators and nominals may also be returned as float64
+    NumPy arrays (or any float64 buffer), which are copied in one go by the FMU binary.
     """
     
     @abstractmethod
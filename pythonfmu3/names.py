@@ -0,0 +1,156 @@
+"""Index of the structured variable names and name-based access to the variables of a model."""
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .variables import Enumeration
+
+
+class _Node(object):
+    __slots__ = ("children", "name", "value_reference")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # Full name and value reference of the variable ending at this node, if any
+        self.name: Optional[str] = None
+        self.value_reference: Optional[int] = None
+
+
+def _segment_matcher(segment: str) -> Optional[Callable[[str], Any]]:
+    # `*` and `?` are the only wildcards: brackets are part of the names of array elements, e.g. `cell[0]`
+    if "*" not in segment and "?" not in segment:
+        return None
+    return re.compile(re.escape(segment).replace(r"\*", ".*").replace(r"\?", ".")).fullmatch
+
+
+class NameIndex(object):
+    """Trie of the variable names over their `.` separated hierarchy.
+
+    Patterns are matched segment by segment: `*` and `?` match any characters of one segment
+    (e.g. `plant.zone*.T`) and a `**` segment matches any number of segments (e.g. `plant.**.T`).
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._value_references: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._value_references)
+
+    def add(self, name: str, value_reference: int):
+        node = self._root
+        for segment in name.split("."):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node()
+            node = child
+        node.name = name
+        node.value_reference = value_reference
+        self._value_references[name] = value_reference
+
+    def get(self, name: str) -> Optional[int]:
+        """Value reference of a variable name, None if unknown."""
+        return self._value_references.get(name)
+
+    def match(self, pattern: str) -> List[Tuple[str, int]]:
+        """(name, value reference) of the variables matching the pattern, in value reference order."""
+        value_reference = self._value_references.get(pattern)
+        if value_reference is not None:
+            return [(pattern, value_reference)]
+        segments = [(segment, _segment_matcher(segment)) for segment in pattern.split(".")]
+        found: Dict[int, str] = {}
+        self._match(self._root, segments, 0, found)
+        return sorted(((name, vr) for vr, name in found.items()), key=lambda item: item[1])
+
+    def _match(self, node: _Node, segments: List[Tuple[str, Any]], i: int, found: Dict[int, str]):
+        if i == len(segments):
+            if node.value_reference is not None:
+                found[node.value_reference] = node.name
+            return
+        segment, matcher = segments[i]
+        if segment == "**":
+            self._match(node, segments, i + 1, found)
+            for child in node.children.values():
+                self._match(child, segments, i, found)
+        elif matcher is None:
+            child = node.children.get(segment)
+            if child is not None:
+                self._match(child, segments, i + 1, found)
+        else:
+            for key, child in node.children.items():
+                if matcher(key):
+                    self._match(child, segments, i + 1, found)
+
+
+class VariableSelection(object):
+    """Variables of a model resolved once from a name pattern, read and written as one vector.
+
+    Created by `Fmi3SlaveBase.select`. The values are exchanged with one `get_<type>`/`set_<type>`
+    call per variable type; the values of array variables are flattened lists.
+
+    Args:
+        slave (Fmi3SlaveBase): The model
+        variables (Iterable[Tuple[str, int]]): (name, value reference) of the selected variables
+    """
+    __slots__ = ("slave", "names", "value_references", "_groups")
+
+    def __init__(self, slave: Any, variables: Iterable[Tuple[str, int]]):
+        self.slave = slave
+        variables = list(variables)
+        self.names: List[str] = [name for name, _ in variables]
+        self.value_references: List[int] = [vr for _, vr in variables]
+        # (type name, value references, positions in the selection, array value references) per variable type
+        groups: Dict[str, Tuple[List[int], List[int], Set[int]]] = {}
+        for position, vr in enumerate(self.value_references):
+            vrs, positions, arrays = groups.setdefault(slave._type_name(vr), ([], [], set()))
+            vrs.append(vr)
+            positions.append(position)
+            if len(getattr(slave.vars.get(vr), "dimensions", [])) > 0:
+                arrays.add(vr)
+        self._groups = [(type_name, vrs, positions, arrays) for type_name, (vrs, positions, arrays) in groups.items()]
+
+    def __len__(self) -> int:
+        return len(self.value_references)
+
+    def get(self) -> List[Any]:
+        """Values of the selected variables, in the order of `names`."""
+        values = [None] * len(self.value_references)
+        for type_name, vrs, positions, arrays in self._groups:
+            group = getattr(self.slave, f"get_{type_name}")(vrs)
+            if not arrays:
+                for position, value in zip(positions, group):
+                    values[position] = value
+                continue
+            offset = 0
+            for position, vr in zip(positions, vrs):
+                if vr in arrays:
+                    size = self.slave._size(self.slave.vars[vr])
+                    values[position] = group[offset:offset + size]
+                else:
+                    size = 1
+                    values[position] = group[offset]
+                offset += size
+        return values
+
+    def set(self, values: List[Any]):
+        """Set the selected variables, in the order of `names`."""
+        if len(values) != len(self.value_references):
+            raise ValueError(f"Expected {len(self.value_references)} values, got {len(values)}")
+        for type_name, vrs, positions, _ in self._groups:
+            group = []
+            for position in positions:
+                value = values[position]
+                if isinstance(value, (list, tuple)):
+                    group.extend(value)
+                elif hasattr(value, "ravel"):
+                    group.extend(value.ravel().tolist())
+                else:
+                    group.append(value)
+            getattr(self.slave, f"set_{type_name}")(vrs, group)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.value_references)} variables)"
+
+
+def _type_name(var_type: type) -> str:
+    # Suffix of the get_<type>/set_<type> facade methods
+    return "int64" if issubclass(var_type, Enumeration) else var_type.__name__.lower()
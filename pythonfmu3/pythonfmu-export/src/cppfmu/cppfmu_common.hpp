@@ -34,12 +34,22 @@ namespace cppfmu
 {
 
 // Aliases for FMI types and enums
+typedef fmi3Float32 FMIFloat32;
 typedef fmi3Float64 FMIFloat64;
+typedef fmi3Int8 FMIInt8;
+typedef fmi3Int16 FMIInt16;
 typedef fmi3Int32 FMIInt32;
 typedef fmi3Int64 FMIInt64;
+typedef fmi3UInt8 FMIUInt8;
+typedef fmi3UInt16 FMIUInt16;
+typedef fmi3UInt32 FMIUInt32;
 typedef fmi3UInt64 FMIUInt64;
 typedef fmi3Boolean FMIBoolean;
 typedef fmi3String FMIString;
+typedef fmi3Binary FMIBinary;
+typedef fmi3Clock FMIClock;
+typedef fmi3IntervalQualifier FMIIntervalQualifier;
+typedef fmi3DependencyKind FMIDependencyKind;
 typedef fmi3LogMessageCallback FMICallbackLogger;
 typedef fmi3Instance FMIComponent;
 typedef fmi3InstanceEnvironment FMIComponentEnvironment;
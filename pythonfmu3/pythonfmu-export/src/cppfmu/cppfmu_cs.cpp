@@ -51,6 +51,30 @@ void SlaveInstance::Reset()
 }
 
 
+void SlaveInstance::EnterConfigurationMode()
+{
+    // Do nothing
+}
+
+
+void SlaveInstance::ExitConfigurationMode()
+{
+    // Do nothing
+}
+
+
+void SlaveInstance::EnterEventMode()
+{
+    // Do nothing
+}
+
+
+void SlaveInstance::EnterStepMode()
+{
+    // Do nothing
+}
+
+
 void SlaveInstance::SetFloat64(
     const FMIValueReference /*vr*/[],
     std::size_t nvr,
@@ -121,6 +145,91 @@ void SlaveInstance::SetString(
 }
 
 
+void SlaveInstance::SetFloat32(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const FMIFloat32 /*value*/[],
+    std::size_t nValues)
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::SetInt8(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const FMIInt8 /*value*/[],
+    std::size_t nValues)
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::SetInt16(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const FMIInt16 /*value*/[],
+    std::size_t nValues)
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::SetUInt8(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const FMIUInt8 /*value*/[],
+    std::size_t nValues)
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::SetUInt16(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const FMIUInt16 /*value*/[],
+    std::size_t nValues)
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::SetUInt32(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const FMIUInt32 /*value*/[],
+    std::size_t nValues)
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::SetBinary(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const std::size_t /*valueSizes*/[],
+    const FMIBinary /*value*/[],
+    std::size_t nValues)
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
 void SlaveInstance::GetFloat64(
     const FMIValueReference /*vr*/[],
     std::size_t nvr,
@@ -193,6 +302,197 @@ void SlaveInstance::GetString(
 }
 
 
+void SlaveInstance::GetFloat32(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    FMIFloat32 /*value*/[],
+    std::size_t nValues) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::GetInt8(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    FMIInt8 /*value*/[],
+    std::size_t nValues) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::GetInt16(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    FMIInt16 /*value*/[],
+    std::size_t nValues) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::GetUInt8(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    FMIUInt8 /*value*/[],
+    std::size_t nValues) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::GetUInt16(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    FMIUInt16 /*value*/[],
+    std::size_t nValues) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::GetUInt32(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    FMIUInt32 /*value*/[],
+    std::size_t nValues) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::GetBinary(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    std::size_t /*valueSizes*/[],
+    FMIBinary /*value*/[],
+    std::size_t nValues) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent variable");
+    }
+}
+
+
+void SlaveInstance::GetClock(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    FMIClock /*value*/[]) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to get nonexistent clock");
+    }
+}
+
+
+void SlaveInstance::SetClock(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const FMIClock /*value*/[])
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent clock");
+    }
+}
+
+
+void SlaveInstance::GetIntervalDecimal(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    FMIFloat64 /*interval*/[],
+    FMIIntervalQualifier /*qualifier*/[]) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to get nonexistent clock");
+    }
+}
+
+
+void SlaveInstance::SetIntervalDecimal(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const FMIFloat64 /*interval*/[])
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent clock");
+    }
+}
+
+
+void SlaveInstance::GetShiftDecimal(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    FMIFloat64 /*shift*/[]) const
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to get nonexistent clock");
+    }
+}
+
+
+void SlaveInstance::SetShiftDecimal(
+    const FMIValueReference /*vr*/[],
+    std::size_t nvr,
+    const FMIFloat64 /*shift*/[])
+{
+    if (nvr != 0) {
+        throw std::logic_error("Attempted to set nonexistent clock");
+    }
+}
+
+
+void SlaveInstance::ActivateModelPartition(
+    FMIValueReference /*clockReference*/,
+    FMIFloat64 /*activationTime*/)
+{
+    throw std::logic_error("Model partitions are not supported");
+}
+
+
+void SlaveInstance::GetNumberOfVariableDependencies(
+    FMIValueReference /*vr*/,
+    std::size_t& /*nDependencies*/) const
+{
+    throw std::logic_error("Variable dependencies are not supported");
+}
+
+
+void SlaveInstance::GetVariableDependencies(
+    FMIValueReference /*dependent*/,
+    std::size_t /*elementIndicesOfDependent*/[],
+    FMIValueReference /*independents*/[],
+    std::size_t /*elementIndicesOfIndependents*/[],
+    FMIDependencyKind /*dependencyKinds*/[],
+    std::size_t /*nDependencies*/) const
+{
+    throw std::logic_error("Variable dependencies are not supported");
+}
+
+
+void SlaveInstance::GetOutputDerivatives(
+    const FMIValueReference /*vr*/[],
+    std::size_t /*nvr*/,
+    const FMIInt32 /*order*/[],
+    FMIFloat64 /*values*/[],
+    std::size_t /*nValues*/) const
+{
+    throw std::logic_error("Output derivatives are not supported");
+}
+
+
 SlaveInstance::~SlaveInstance() CPPFMU_NOEXCEPT
 {
     // Do nothing
@@ -65,6 +65,18 @@ public:
      */
     virtual void Reset();
 
+    /* Called from fmi3EnterConfigurationMode() and fmi3ExitConfigurationMode().
+     * Do nothing by default.
+     */
+    virtual void EnterConfigurationMode();
+    virtual void ExitConfigurationMode();
+
+    /* Called from fmi3EnterEventMode() and fmi3EnterStepMode().
+     * Do nothing by default.
+     */
+    virtual void EnterEventMode();
+    virtual void EnterStepMode();
+
     /* Called from fmi3SetXxx()/fmiSetXxx().
      * Throws std::logic_error by default.
      */
@@ -98,6 +110,42 @@ public:
         std::size_t nvr,
         const FMIString value[],
         std::size_t nValues);
+    virtual void SetFloat32(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIFloat32 value[],
+        std::size_t nValues);
+    virtual void SetInt8(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIInt8 value[],
+        std::size_t nValues);
+    virtual void SetInt16(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIInt16 value[],
+        std::size_t nValues);
+    virtual void SetUInt8(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIUInt8 value[],
+        std::size_t nValues);
+    virtual void SetUInt16(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIUInt16 value[],
+        std::size_t nValues);
+    virtual void SetUInt32(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIUInt32 value[],
+        std::size_t nValues);
+    virtual void SetBinary(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const std::size_t valueSizes[],
+        const FMIBinary value[],
+        std::size_t nValues);
 
     /* Called from fmi3GetXxx()/fmiGetXxx().
      * Throws std::logic_error by default.
@@ -132,6 +180,98 @@ public:
         std::size_t nvr,
         FMIString value[],
         std::size_t nValues) const;
+    virtual void GetFloat32(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        FMIFloat32 value[],
+        std::size_t nValues) const;
+    virtual void GetInt8(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        FMIInt8 value[],
+        std::size_t nValues) const;
+    virtual void GetInt16(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        FMIInt16 value[],
+        std::size_t nValues) const;
+    virtual void GetUInt8(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        FMIUInt8 value[],
+        std::size_t nValues) const;
+    virtual void GetUInt16(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        FMIUInt16 value[],
+        std::size_t nValues) const;
+    virtual void GetUInt32(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        FMIUInt32 value[],
+        std::size_t nValues) const;
+    virtual void GetBinary(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        std::size_t valueSizes[],
+        FMIBinary value[],
+        std::size_t nValues) const;
+
+    /* Clocks and model partitions of Scheduled Execution.
+     * Throw std::logic_error by default.
+     */
+    virtual void GetClock(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        FMIClock value[]) const;
+    virtual void SetClock(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIClock value[]);
+    virtual void GetIntervalDecimal(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        FMIFloat64 interval[],
+        FMIIntervalQualifier qualifier[]) const;
+    virtual void SetIntervalDecimal(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIFloat64 interval[]);
+    virtual void GetShiftDecimal(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        FMIFloat64 shift[]) const;
+    virtual void SetShiftDecimal(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIFloat64 shift[]);
+    virtual void ActivateModelPartition(
+        FMIValueReference clockReference,
+        FMIFloat64 activationTime);
+
+    /* Called from fmi3GetNumberOfVariableDependencies() and fmi3GetVariableDependencies().
+     * Throw std::logic_error by default.
+     */
+    virtual void GetNumberOfVariableDependencies(
+        FMIValueReference vr,
+        std::size_t& nDependencies) const;
+    virtual void GetVariableDependencies(
+        FMIValueReference dependent,
+        std::size_t elementIndicesOfDependent[],
+        FMIValueReference independents[],
+        std::size_t elementIndicesOfIndependents[],
+        FMIDependencyKind dependencyKinds[],
+        std::size_t nDependencies) const;
+
+    /* Called from fmi3GetOutputDerivatives().
+     * Throw std::logic_error by default.
+     */
+    virtual void GetOutputDerivatives(
+        const FMIValueReference vr[],
+        std::size_t nvr,
+        const FMIInt32 order[],
+        FMIFloat64 values[],
+        std::size_t nValues) const;
 
     // Called from fmi3DoStep()/fmiDoStep(). Must be implemented in model code.
     virtual FMIStatus DoStep(
@@ -193,6 +333,9 @@ public:
  *              cppfmu::AllocateUnique(), etc.  Allocation and deallocation
  *              requests get forwarded to the simulation environment.
  *
+ *     eventModeUsed, earlyReturnAllowed = The co-simulation options of
+ *              fmi3InstantiateCoSimulation(), false for other interfaces.
+ *
  *     logger = An object which the model code can use to log messages (e.g.
  *              warnings or debug info).  The messages are forwarded to the
  *              simulation environment's logging facilities.
@@ -207,6 +350,8 @@ std::unique_ptr<cppfmu::SlaveInstance> CppfmuInstantiateSlave(
     cppfmu::FMIFloat64 timeout,
     cppfmu::FMIBoolean visible,
     cppfmu::FMIBoolean interactive,
+    cppfmu::FMIBoolean eventModeUsed,
+    cppfmu::FMIBoolean earlyReturnAllowed,
     const cppfmu::Logger& logger);
 
 
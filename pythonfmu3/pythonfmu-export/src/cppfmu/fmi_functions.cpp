@@ -11,20 +11,6 @@
 #define NOT_IMPLEMENTED throw std::logic_error("function " + std::string(__func__) + " not implemented")
 
 
-#define NOT_IMPLEMENTED_GETTER(suffix, var) fmi3Status fmi3Get##suffix( \
-    fmi3Instance c, \
-    const fmi3ValueReference vr[], \
-    size_t nValueReferences, \
-    var values[], \
-    size_t nValues) { NOT_IMPLEMENTED;}  
-
-#define NOT_IMPLEMENTED_SETTER(suffix, var) fmi3Status fmi3Set##suffix ( \
-    fmi3Instance c, \
-    const fmi3ValueReference vr[], \
-    size_t nValueReferences, \
-    const var values[], \
-    size_t nValues) { NOT_IMPLEMENTED;}  
-
 namespace
 {
 // A struct that holds all the data for one model instance.
@@ -50,7 +36,8 @@ struct Component
     Component(cppfmu::FMIComponentEnvironment instanceEnvironment,
         cppfmu::FMICallbackLogger logCallback,
         cppfmu::FMIBoolean loggingOn) : loggerSettings{std::make_shared<cppfmu::Logger::Settings>()},
-        logger{instanceEnvironment, logCallback, loggerSettings}
+        logger{instanceEnvironment, logCallback, loggerSettings},
+        state{State::Instantiated}
     {
         loggerSettings->debugLoggingEnabled = (loggingOn == cppfmu::FMITrue);
     }
@@ -107,6 +94,8 @@ fmi3Instance fmi3InstantiateCoSimulation(
             0.0,
             visible,
             cppfmu::FMIFalse,
+            eventModeUsed,
+            earlyReturnAllowed,
             component->logger);
         return component;
     } catch (const cppfmu::FatalError& e) {
@@ -146,6 +135,8 @@ fmi3Instance fmi3InstantiateModelExchange(
             0.0,
             visible,
             cppfmu::FMIFalse,
+            cppfmu::FMIFalse,
+            cppfmu::FMIFalse,
             component->logger);
         return component;
     } catch (const cppfmu::FatalError& e) {
@@ -176,7 +167,37 @@ fmi3Instance fmi3InstantiateScheduledExecution(
     fmi3LockPreemptionCallback     lockPreemption,
     fmi3UnlockPreemptionCallback   unlockPreemption)
 {
-    throw std::logic_error("Unsupported FMU instance type requested (only co-simulation is supported)");
+    // Model partitions run to completion while the importer waits, preemption is never locked
+    try {
+        auto component = new Component(
+            instanceEnvironment,
+            logMessage,
+            loggingOn);
+        component->slave = CppfmuInstantiateSlave(
+            instanceName,
+            instantiationToken,
+            resourcePath,
+            "application/x-fmu-sharedlibrary",
+            0.0,
+            visible,
+            cppfmu::FMIFalse,
+            cppfmu::FMIFalse,
+            cppfmu::FMIFalse,
+            component->logger);
+        return component;
+    } catch (const cppfmu::FatalError& e) {
+        if (logMessage)
+        {
+            logMessage(instanceEnvironment, fmi3Fatal, "", e.what());
+        }
+        return nullptr;
+    } catch (const std::exception& e) {
+        if (logMessage)
+        {
+            logMessage(instanceEnvironment, fmi3Error, "", e.what());
+        }
+        return nullptr;
+    }
 }
 
 
@@ -210,6 +231,7 @@ fmi3Status fmi3EnterInitializationMode(fmi3Instance c, fmi3Boolean, fmi3Float64,
     const auto component = reinterpret_cast<Component*>(c);
     try {
         component->slave->EnterInitializationMode();
+        component->state = Component::State::InitializationMode;
         return fmi3OK;
     } catch (const cppfmu::FatalError& e) {
         component->logger.Log(fmi3Fatal, "", e.what());
@@ -238,38 +260,72 @@ fmi3Status fmi3ExitInitializationMode(fmi3Instance c)
 
 fmi3Status fmi3EnterConfigurationMode(fmi3Instance c)
 {
-    
     const auto component = reinterpret_cast<Component*>(c);
-    component->state = Component::State::ConfigurationMode;
-    return fmi3OK;
-
+    try {
+        component->slave->EnterConfigurationMode();
+        // Entered from Instantiated (configuration) or from Step/Event Mode (reconfiguration)
+        component->state = component->state == Component::State::Instantiated
+            ? Component::State::ConfigurationMode
+            : Component::State::ReconfigurationMode;
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
 fmi3Status fmi3ExitConfigurationMode(fmi3Instance c)
 {
     const auto component = reinterpret_cast<Component*>(c);
-    if (component->state == Component::State::ConfigurationMode)
-    {
-        component->state = Component::State::Instantiated;
-
-    } else{
-        component->state = Component::State::StepMode;
+    try {
+        component->slave->ExitConfigurationMode();
+        // Back to Instantiated after configuration, to Step Mode after reconfiguration
+        component->state = component->state == Component::State::ConfigurationMode
+            ? Component::State::Instantiated
+            : Component::State::StepMode;
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
     }
-    return fmi3OK;
 }
 
 fmi3Status fmi3EnterEventMode(fmi3Instance c)
 {
     const auto component = reinterpret_cast<Component*>(c);
-    component->state = Component::State::EventMode;
-    return fmi3OK;
+    try {
+        component->slave->EnterEventMode();
+        component->state = Component::State::EventMode;
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
 fmi3Status fmi3EnterStepMode(fmi3Instance c)
 {
     const auto component = reinterpret_cast<Component*>(c);
-    component->state = Component::State::StepMode;
-    return fmi3OK;
+    try {
+        component->slave->EnterStepMode();
+        component->state = Component::State::StepMode;
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
 
@@ -294,6 +350,8 @@ fmi3Status fmi3Reset(fmi3Instance c)
     const auto component = reinterpret_cast<Component*>(c);
     try {
         component->slave->Reset();
+        // A reset instance can be configured again
+        component->state = Component::State::Instantiated;
         return fmi3OK;
     } catch (const cppfmu::FatalError& e) {
         component->logger.Log(fmi3Fatal, "", e.what());
@@ -425,6 +483,147 @@ fmi3Status fmi3GetString(
     }
 }
 
+fmi3Status fmi3GetFloat32(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    fmi3Float32 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetFloat32(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3GetInt8(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    fmi3Int8 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetInt8(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3GetInt16(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    fmi3Int16 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetInt16(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3GetUInt8(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    fmi3UInt8 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetUInt8(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3GetUInt16(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    fmi3UInt16 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetUInt16(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3GetUInt32(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    fmi3UInt32 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetUInt32(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3GetBinary(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    size_t valueSizes[],
+    fmi3Binary values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetBinary(vr, nvr, valueSizes, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
 
 fmi3Status fmi3SetFloat64(
     fmi3Instance c,
@@ -546,6 +745,147 @@ fmi3Status fmi3SetString(
     }
 }
 
+fmi3Status fmi3SetFloat32(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const fmi3Float32 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetFloat32(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3SetInt8(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const fmi3Int8 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetInt8(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3SetInt16(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const fmi3Int16 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetInt16(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3SetUInt8(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const fmi3UInt8 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetUInt8(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3SetUInt16(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const fmi3UInt16 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetUInt16(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3SetUInt32(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const fmi3UInt32 values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetUInt32(vr, nvr, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
+fmi3Status fmi3SetBinary(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const size_t valueSizes[],
+    const fmi3Binary values[],
+    size_t nValues)
+{
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetBinary(vr, nvr, valueSizes, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
+}
+
 fmi3Status fmi3GetContinuousStates(
     fmi3Instance c,
     fmi3Float64 continuousStates[],
@@ -862,17 +1202,23 @@ fmi3Status fmi3GetDirectionalDerivative(
 
 fmi3Status fmi3GetOutputDerivatives(
     fmi3Instance c,
-    const fmi3ValueReference[],
-    size_t,
-    const fmi3Int32[],
-    fmi3Float64[],
-    size_t)
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const fmi3Int32 order[],
+    fmi3Float64 values[],
+    size_t nValues)
 {
-    reinterpret_cast<Component*>(c)->logger.Log(
-        fmi3Error,
-        "cppfmu",
-        "FMI function not supported: fmiGetOutputDerivatives");
-    return fmi3Error;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetOutputDerivatives(vr, nvr, order, values, nValues);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
 fmi3Status fmi3DoStep(
@@ -888,6 +1234,9 @@ fmi3Status fmi3DoStep(
     const auto component = reinterpret_cast<Component*>(c);
     try {
         double endTime = currentCommunicationPoint;
+        *eventHandlingNeeded = fmi3False;
+        *terminateSimulation = fmi3False;
+        *earlyReturn = fmi3False;
         const auto status = component->slave->DoStep(
             currentCommunicationPoint,
             communicationStepSize,
@@ -896,7 +1245,11 @@ fmi3Status fmi3DoStep(
             terminateSimulation,
             earlyReturn,
             endTime);
-        if (status == fmi3Status::fmi3OK) {
+        if (status == fmi3Status::fmi3OK && *earlyReturn) {
+            // The step stopped at an internal event, endTime is the time reached
+            *lastSuccessfulTime = endTime;
+            return fmi3OK;
+        } else if (status == fmi3Status::fmi3OK) {
             *lastSuccessfulTime =
                 currentCommunicationPoint + communicationStepSize;
             return fmi3OK;
@@ -914,69 +1267,60 @@ fmi3Status fmi3DoStep(
 }
 }
 
-// NOT IMPLEMENTED
-
-NOT_IMPLEMENTED_GETTER(Float32, fmi3Float32);
-NOT_IMPLEMENTED_SETTER(Float32, fmi3Float32);
-
-NOT_IMPLEMENTED_GETTER(Int8, fmi3Int8);
-NOT_IMPLEMENTED_SETTER(Int8, fmi3Int8);
-NOT_IMPLEMENTED_GETTER(Int16, fmi3Int16);
-NOT_IMPLEMENTED_SETTER(Int16, fmi3Int16);
-
-NOT_IMPLEMENTED_GETTER(UInt8, fmi3UInt8);
-NOT_IMPLEMENTED_SETTER(UInt8, fmi3UInt8);
-NOT_IMPLEMENTED_GETTER(UInt16, fmi3UInt16);
-NOT_IMPLEMENTED_SETTER(UInt16, fmi3UInt16);
-NOT_IMPLEMENTED_GETTER(UInt32, fmi3UInt32);
-NOT_IMPLEMENTED_SETTER(UInt32, fmi3UInt32);
-
-
-fmi3Status fmi3GetClock(fmi3Instance instance,
-    const fmi3ValueReference valueReferences[],
-    size_t nValueReferences,
+fmi3Status fmi3GetClock(fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
     fmi3Clock values[])
 {
-    NOT_IMPLEMENTED;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetClock(vr, nvr, values);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
-fmi3Status fmi3SetClock(fmi3Instance instance,
-    const fmi3ValueReference valueReferences[],
-    size_t nValueReferences,
+fmi3Status fmi3SetClock(fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
     const fmi3Clock values[])
 {
-    NOT_IMPLEMENTED;
-}
-
-fmi3Status fmi3GetBinary(fmi3Instance instance,
-    const fmi3ValueReference valueReferences[],
-    size_t nValueReferences,
-    size_t valueSizes[],
-    fmi3Binary values[],
-    size_t nValues)
-{
-
-    NOT_IMPLEMENTED;
-}
-
-fmi3Status fmi3SetBinary(fmi3Instance instance,
-    const fmi3ValueReference valueReferences[],
-    size_t nValueReferences,
-    const size_t valueSizes[],
-    const fmi3Binary values[],
-    size_t nValues)
-{
-    NOT_IMPLEMENTED;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetClock(vr, nvr, values);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
-fmi3Status fmi3GetNumberOfVariableDependencies(fmi3Instance instance,
+fmi3Status fmi3GetNumberOfVariableDependencies(fmi3Instance c,
     fmi3ValueReference valueReference,
     size_t* nDependencies)
 {
-    NOT_IMPLEMENTED;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetNumberOfVariableDependencies(valueReference, *nDependencies);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
-fmi3Status fmi3GetVariableDependencies(fmi3Instance instance,
+fmi3Status fmi3GetVariableDependencies(fmi3Instance c,
     fmi3ValueReference dependent,
     size_t elementIndicesOfDependent[],
     fmi3ValueReference independents[],
@@ -984,7 +1328,17 @@ fmi3Status fmi3GetVariableDependencies(fmi3Instance instance,
     fmi3DependencyKind dependencyKinds[],
     size_t nDependencies)
 {
-    NOT_IMPLEMENTED;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetVariableDependencies(dependent, elementIndicesOfDependent, independents, elementIndicesOfIndependents, dependencyKinds, nDependencies);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
 fmi3Status fmi3GetAdjointDerivative(fmi3Instance instance,
@@ -1001,13 +1355,23 @@ fmi3Status fmi3GetAdjointDerivative(fmi3Instance instance,
 }
 
 fmi3Status fmi3GetIntervalDecimal(
-    fmi3Instance instance, 
-    const fmi3ValueReference valueReferences[],
-    size_t nValueReferences, 
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
     fmi3Float64 intervals[],
     fmi3IntervalQualifier qualifiers[])
 {
-  NOT_IMPLEMENTED;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetIntervalDecimal(vr, nvr, intervals, qualifiers);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
 fmi3Status fmi3GetIntervalFraction(
@@ -1021,11 +1385,23 @@ fmi3Status fmi3GetIntervalFraction(
   NOT_IMPLEMENTED;
 }
 
-fmi3Status
-fmi3GetShiftDecimal(fmi3Instance instance, const fmi3ValueReference valueReferences[],
-    size_t nValueReferences, fmi3Float64 shifts[])
+fmi3Status fmi3GetShiftDecimal(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    fmi3Float64 shifts[])
 {
-  NOT_IMPLEMENTED;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->GetShiftDecimal(vr, nvr, shifts);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
 fmi3Status
@@ -1035,11 +1411,23 @@ fmi3GetShiftFraction(fmi3Instance instance, const fmi3ValueReference valueRefere
   NOT_IMPLEMENTED;
 }
 
-fmi3Status
-fmi3SetIntervalDecimal(fmi3Instance instance, const fmi3ValueReference valueReferences[],
-    size_t nValueReferences, const fmi3Float64 intervals[])
+fmi3Status fmi3SetIntervalDecimal(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const fmi3Float64 intervals[])
 {
-  NOT_IMPLEMENTED;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetIntervalDecimal(vr, nvr, intervals);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
 fmi3Status
@@ -1050,11 +1438,23 @@ fmi3SetIntervalFraction(fmi3Instance instance, const fmi3ValueReference valueRef
   NOT_IMPLEMENTED;
 }
 
-fmi3Status
-fmi3SetShiftDecimal(fmi3Instance instance, const fmi3ValueReference valueReferences[],
-    size_t nValueReferences, const fmi3Float64 shifts[])
+fmi3Status fmi3SetShiftDecimal(
+    fmi3Instance c,
+    const fmi3ValueReference vr[],
+    size_t nvr,
+    const fmi3Float64 shifts[])
 {
-  NOT_IMPLEMENTED;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->SetShiftDecimal(vr, nvr, shifts);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
 fmi3Status
@@ -1072,9 +1472,21 @@ fmi3EvaluateDiscreteStates(fmi3Instance instance)
 }
 
 
-fmi3Status fmi3ActivateModelPartition(fmi3Instance instance, fmi3ValueReference clockReference,
+fmi3Status fmi3ActivateModelPartition(
+    fmi3Instance c,
+    fmi3ValueReference clockReference,
     fmi3Float64 activationTime)
 {
-  NOT_IMPLEMENTED;
+    const auto component = reinterpret_cast<Component*>(c);
+    try {
+        component->slave->ActivateModelPartition(clockReference, activationTime);
+        return fmi3OK;
+    } catch (const cppfmu::FatalError& e) {
+        component->logger.Log(fmi3Fatal, "", e.what());
+        return fmi3Fatal;
+    } catch (const std::exception& e) {
+        component->logger.Log(fmi3Error, "", e.what());
+        return fmi3Error;
+    }
 }
 
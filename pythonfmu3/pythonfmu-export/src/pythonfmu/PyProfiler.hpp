@@ -0,0 +1,186 @@
+#ifndef PYTHONFMU_PYPROFILER_HPP
+#define PYTHONFMU_PYPROFILER_HPP
+
+#include <chrono>
+#include <cstdint>
+#include <cstdlib>
+#include <fstream>
+#include <iomanip>
+#include <map>
+#include <memory>
+#include <sstream>
+#include <string>
+
+namespace pythonfmu
+{
+
+// Opt-in instrumentation of the FMI calls of one instance, enabled by the PYTHONFMU3_PROFILE
+// environment variable: "1" or "log" reports through the FMI logger, any other value is the
+// folder to write <instanceName>.json to.
+class PyProfiler
+{
+public:
+    using Clock = std::chrono::steady_clock;
+
+    enum class Phase
+    {
+        GilWait,
+        Python,
+        LogFlush
+    };
+
+    struct Stats
+    {
+        std::uint64_t calls = 0;
+        double total = 0.0;
+        double gilWait = 0.0;
+        double python = 0.0;
+        double logFlush = 0.0;
+    };
+
+    // Times the enclosing scope and accounts for it in the current FMI call.
+    class Scope
+    {
+    public:
+        Scope(PyProfiler* profiler, Phase phase)
+            : profiler_(profiler)
+            , phase_(phase)
+        {
+            if (profiler_ != nullptr) start_ = Clock::now();
+        }
+
+        ~Scope()
+        {
+            if (profiler_ != nullptr) profiler_->add(phase_, seconds(start_));
+        }
+
+        Scope(const Scope&) = delete;
+        Scope& operator=(const Scope&) = delete;
+
+    private:
+        PyProfiler* profiler_;
+        Phase phase_;
+        Clock::time_point start_;
+    };
+
+    // Times a whole FMI call, from GIL acquisition to release.
+    class Call
+    {
+    public:
+        Call(PyProfiler* profiler, const char* function)
+            : profiler_(profiler)
+        {
+            if (profiler_ != nullptr) {
+                previous_ = profiler_->current_;
+                profiler_->current_ = &profiler_->stats_[function];
+                start_ = Clock::now();
+            }
+        }
+
+        ~Call()
+        {
+            if (profiler_ != nullptr) {
+                profiler_->current_->calls++;
+                profiler_->current_->total += seconds(start_);
+                profiler_->current_ = previous_;
+            }
+        }
+
+        Call(const Call&) = delete;
+        Call& operator=(const Call&) = delete;
+
+    private:
+        PyProfiler* profiler_;
+        Stats* previous_ = nullptr;
+        Clock::time_point start_;
+    };
+
+    static std::unique_ptr<PyProfiler> fromEnvironment()
+    {
+        const char* value = std::getenv("PYTHONFMU3_PROFILE");
+        if (value == nullptr || *value == '\0' || std::string(value) == "0") {
+            return nullptr;
+        }
+        return std::make_unique<PyProfiler>(value);
+    }
+
+    explicit PyProfiler(std::string target)
+        : target_(std::move(target))
+    { }
+
+    bool logReport() const
+    {
+        return target_ == "1" || target_ == "log";
+    }
+
+    // Write the report to <target>/<instanceName>.json; return false if the file cannot be opened.
+    bool writeReport(const std::string& instanceName) const
+    {
+        std::ofstream file(target_ + "/" + instanceName + ".json");
+        if (!file) return false;
+        file << toJson(instanceName) << "\n";
+        return file.good();
+    }
+
+    // Marshalling is the time spent in a call outside of GIL acquisition, Python and log flushing.
+    std::string toJson(const std::string& instanceName) const
+    {
+        std::ostringstream oss;
+        oss << std::setprecision(9);
+        oss << "{\"instanceName\": \"" << escape(instanceName) << "\", \"functions\": {";
+        bool first = true;
+        for (const auto& [function, stats] : stats_) {
+            oss << (first ? "" : ", ") << "\"" << function << "\": {"
+                << "\"calls\": " << stats.calls
+                << ", \"total\": " << stats.total
+                << ", \"gilWait\": " << stats.gilWait
+                << ", \"python\": " << stats.python
+                << ", \"marshalling\": " << (stats.total - stats.gilWait - stats.python - stats.logFlush)
+                << ", \"logFlush\": " << stats.logFlush
+                << "}";
+            first = false;
+        }
+        oss << "}}";
+        return oss.str();
+    }
+
+private:
+    std::string target_;
+    std::map<std::string, Stats> stats_;
+    Stats* current_ = nullptr;
+
+    static double seconds(Clock::time_point start)
+    {
+        return std::chrono::duration<double>(Clock::now() - start).count();
+    }
+
+    static std::string escape(const std::string& s)
+    {
+        std::string escaped;
+        for (char c : s) {
+            if (c == '"' || c == '\\') escaped += '\\';
+            escaped += c;
+        }
+        return escaped;
+    }
+
+    void add(Phase phase, double duration)
+    {
+        if (current_ == nullptr) return;
+        switch (phase) {
+            case Phase::GilWait:
+                current_->gilWait += duration;
+                break;
+            case Phase::Python:
+                current_->python += duration;
+                break;
+            case Phase::LogFlush:
+                current_->logFlush += duration;
+                break;
+        }
+    }
+};
+
+} // namespace pythonfmu
+
+#endif
@@ -1,14 +1,17 @@
 
 #include "pythonfmu/IPyState.hpp"
 #include "pythonfmu/PySlaveInstance.hpp"
+#include "pythonfmu/PyProfiler.hpp"
 
 #include "pythonfmu/PyState.hpp"
 
 #include "cppfmu/cppfmu_cs.hpp"
 
+#include <cstring>
 #include <fstream>
 #include <functional>
 #include <mutex>
+#include <stdexcept>
 #include <regex>
 #include <sstream>
 #include <utility>
@@ -16,14 +19,6 @@
 namespace pythonfmu
 {
 
-inline std::string getline(const std::string& fileName)
-{
-    std::string line;
-    std::ifstream infile(fileName);
-    std::getline(infile, line);
-    return line;
-}
-
 inline std::string findClassName(const std::string& fileName)
 {
     std::string line;
@@ -39,21 +34,135 @@ inline std::string findClassName(const std::string& fileName)
     return "";
 }
 
-inline void py_safe_run(const std::function<void(PyGILState_STATE gilState)>& f)
+// Copy the values returned by the getters of the model. Lists are read element by element with
+// `convert`, other objects exposing a buffer of one of the `formats` with items of the size of T
+// (e.g. NumPy arrays) are copied at once and any other sequence is read through the sequence
+// protocol. Returns false with a Python error set on failure.
+template<typename T>
+inline bool readArray(PyObject* obj, T* values, std::size_t nValues, const char* formats, T (*convert)(PyObject*))
 {
-    PyGILState_STATE gil_state = PyGILState_Ensure();
+    if (PyList_Check(obj)) {
+        if (static_cast<std::size_t>(PyList_Size(obj)) < nValues) {
+            PyErr_Format(PyExc_ValueError, "Expected %zu values, got %zd", nValues, PyList_Size(obj));
+            return false;
+        }
+        for (std::size_t i = 0; i < nValues; i++) {
+            values[i] = convert(PyList_GetItem(obj, i));
+        }
+        return PyErr_Occurred() == nullptr;
+    }
+
+    // The limited API has no access to the buffer itself, a memoryview exposes its format and
+    // PyBytes_FromObject makes a single contiguous copy of it.
+    PyObject* view = PyMemoryView_FromObject(obj);
+    if (view != nullptr) {
+        PyObject* format = PyObject_GetAttrString(view, "format");
+        PyObject* itemsize = PyObject_GetAttrString(view, "itemsize");
+        bool matches = false;
+        if (format != nullptr && itemsize != nullptr && PyLong_AsSsize_t(itemsize) == static_cast<Py_ssize_t>(sizeof(T))) {
+            for (const char* f = formats; *f != '\0' && !matches; f++) {
+                const char code[] = {*f, '\0'};
+                matches = PyUnicode_CompareWithASCIIString(format, code) == 0;
+            }
+        }
+        Py_XDECREF(format);
+        Py_XDECREF(itemsize);
+        if (matches) {
+            PyObject* bytes = PyBytes_FromObject(view);
+            Py_DECREF(view);
+            if (bytes == nullptr) return false;
+            auto size = static_cast<std::size_t>(PyBytes_Size(bytes));
+            if (size < nValues * sizeof(T)) {
+                PyErr_Format(PyExc_ValueError, "Expected %zu values, got %zu", nValues, size / sizeof(T));
+                Py_DECREF(bytes);
+                return false;
+            }
+            std::memcpy(values, PyBytes_AsString(bytes), nValues * sizeof(T));
+            Py_DECREF(bytes);
+            return true;
+        }
+        Py_DECREF(view);
+    }
+    PyErr_Clear();
+
+    if (PySequence_Size(obj) < static_cast<Py_ssize_t>(nValues)) {
+        if (!PyErr_Occurred()) {
+            PyErr_Format(PyExc_ValueError, "Expected %zu values, got %zd", nValues, PySequence_Size(obj));
+        }
+        return false;
+    }
+    for (std::size_t i = 0; i < nValues; i++) {
+        PyObject* item = PySequence_GetItem(obj, i);
+        if (item == nullptr) return false;
+        values[i] = convert(item);
+        Py_DECREF(item);
+    }
+    return PyErr_Occurred() == nullptr;
+}
+
+inline cppfmu::FMIFloat64 toFloat64(PyObject* o) { return PyFloat_AsDouble(o); }
+inline cppfmu::FMIFloat32 toFloat32(PyObject* o) { return static_cast<cppfmu::FMIFloat32>(PyFloat_AsDouble(o)); }
+inline cppfmu::FMIInt8 toInt8(PyObject* o) { return static_cast<cppfmu::FMIInt8>(PyLong_AsLong(o)); }
+inline cppfmu::FMIInt16 toInt16(PyObject* o) { return static_cast<cppfmu::FMIInt16>(PyLong_AsLong(o)); }
+inline cppfmu::FMIInt32 toInt32(PyObject* o) { return static_cast<cppfmu::FMIInt32>(PyLong_AsLong(o)); }
+inline cppfmu::FMIInt64 toInt64(PyObject* o) { return static_cast<cppfmu::FMIInt64>(PyLong_AsLongLong(o)); }
+inline cppfmu::FMIUInt8 toUInt8(PyObject* o) { return static_cast<cppfmu::FMIUInt8>(PyLong_AsUnsignedLong(o)); }
+inline cppfmu::FMIUInt16 toUInt16(PyObject* o) { return static_cast<cppfmu::FMIUInt16>(PyLong_AsUnsignedLong(o)); }
+inline cppfmu::FMIUInt32 toUInt32(PyObject* o) { return static_cast<cppfmu::FMIUInt32>(PyLong_AsUnsignedLong(o)); }
+inline cppfmu::FMIUInt64 toUInt64(PyObject* o) { return static_cast<cppfmu::FMIUInt64>(PyLong_AsUnsignedLongLong(o)); }
+
+// Item of a list or tuple returned by PySequence_Fast, its macros are not part of the limited API
+inline PyObject* fastItem(PyObject* sequence, std::size_t i)
+{
+    auto index = static_cast<Py_ssize_t>(i);
+    return PyList_Check(sequence) ? PyList_GetItem(sequence, index) : PyTuple_GetItem(sequence, index);
+}
+
+// Copy the float64 values returned by a model exchange hook, see readArray.
+inline bool readFloat64Array(PyObject* obj, cppfmu::FMIFloat64* values, std::size_t nValues)
+{
+    return readArray(obj, values, nValues, "d", toFloat64);
+}
+
+// Values passed by the importer to a setter, as a memoryview of the struct `format` of T read by
+// Fmi3SlaveBase._set_buffer. The limited API cannot wrap the buffer of the importer, the values are
+// copied once into a bytes object rather than converted one by one into a list.
+template<typename T>
+inline PyObject* valuesView(const T* values, std::size_t nValues, const char* format)
+{
+    PyObject* bytes = PyBytes_FromStringAndSize(reinterpret_cast<const char*>(values), nValues * sizeof(T));
+    if (bytes == nullptr) return nullptr;
+    PyObject* view = PyMemoryView_FromObject(bytes);
+    Py_DECREF(bytes);
+    if (view == nullptr) return nullptr;
+    PyObject* cast = PyObject_CallMethod(view, "cast", "s", format);
+    Py_DECREF(view);
+    return cast;
+}
+
+void PySlaveInstance::py_safe_run(const char* function, const std::function<void(PyGILState_STATE gilState)>& f) const
+{
+    PyProfiler::Call call(profiler_.get(), function);
+    PyGILState_STATE gil_state;
+    {
+        PyProfiler::Scope gilWait(profiler_.get(), PyProfiler::Phase::GilWait);
+        gil_state = PyGILState_Ensure();
+    }
     f(gil_state);
     PyGILState_Release(gil_state);
 }
 
-PySlaveInstance::PySlaveInstance(std::string instanceName, std::string resources, const cppfmu::Logger& logger, const bool visible, std::shared_ptr<IPyState> pyState)
+PySlaveInstance::PySlaveInstance(std::string instanceName, std::string resources, const cppfmu::Logger& logger, const bool visible, const bool eventModeUsed, const bool earlyReturnAllowed, std::shared_ptr<IPyState> pyState)
     : pyState_{ std::move(pyState) }
     , instanceName_(std::move(instanceName))
     , resources_(std::move(resources))
     , logger_(logger)
     , visible_(visible)
+    , eventModeUsed_(eventModeUsed)
+    , earlyReturnAllowed_(earlyReturnAllowed)
+    , profiler_(PyProfiler::fromEnvironment())
 {
-    py_safe_run([this](PyGILState_STATE gilState) {
+    py_safe_run("Instantiate", [this](PyGILState_STATE gilState) {
         // Append resources path to python sys path
         PyObject* sys_module = PyImport_ImportModule("sys");
         if (sys_module == nullptr) {
@@ -65,19 +174,39 @@ PySlaveInstance::PySlaveInstance(std::string instanceName, std::string resources
             handle_py_exception("[ctor] PyObject_GetAttrString", gilState);
         }
         int success = PyList_Insert(sys_path, 0, PyUnicode_FromString(resources_.c_str()));
-        Py_DECREF(sys_path);
         if (success != 0) {
+            Py_DECREF(sys_path);
             handle_py_exception("[ctor] PyList_Insert", gilState);
         }
 
-        std::string moduleName = getline(resources_ + "/slavemodule.txt");
+        // Python sources bundled at build time are imported through zipimport without extraction
+        const std::string bundle = resources_ + "/python.zip";
+        if (std::ifstream(bundle).good()) {
+            PyObject* pyBundle = PyUnicode_FromString(bundle.c_str());
+            success = PyList_Insert(sys_path, 0, pyBundle);
+            Py_DECREF(pyBundle);
+            if (success != 0) {
+                Py_DECREF(sys_path);
+                handle_py_exception("[ctor] PyList_Insert", gilState);
+            }
+        }
+        Py_DECREF(sys_path);
+
+        std::ifstream moduleFile(resources_ + "/slavemodule.txt");
+        std::string moduleName;
+        std::string className;
+        std::getline(moduleFile, moduleName);
+        std::getline(moduleFile, className);
+
         PyObject* pModule = PyImport_ImportModule(moduleName.c_str());
         if (pModule == nullptr) {
             PyErr_Print();
             handle_py_exception("[ctor] PyImport_ImportModule", gilState);
         }
 
-        std::string className = findClassName(resources_ + "/" + moduleName + ".py");
+        if (className.empty()) {
+            className = findClassName(resources_ + "/" + moduleName + ".py");
+        }
         if (className.empty()) {
             cleanPyObject();
             throw cppfmu::FatalError("Unable to find class extending Fmi3SlaveBase!");
@@ -101,6 +230,7 @@ PySlaveInstance::PySlaveInstance(std::string instanceName, std::string resources
 
 void PySlaveInstance::clearLogBuffer() const
 {
+    PyProfiler::Scope logFlush(profiler_.get(), PyProfiler::Phase::LogFlush);
     clearLogStrBuffer();
 
     PyObject* debugField = Py_BuildValue("s", "debug");
@@ -149,26 +279,51 @@ void PySlaveInstance::initialize(PyGILState_STATE gilState)
 {
     Py_XDECREF(pInstance_);
     Py_XDECREF(pMessages_);
+    Py_XDECREF(pComputed_);
 
     PyObject* args = PyTuple_New(0);
-    PyObject* kwargs = Py_BuildValue("{ss,ss,sn,si}",
+    PyObject* kwargs = Py_BuildValue("{ss,ss,sn,si,sO,sO}",
         "instance_name", instanceName_.c_str(),
         "resources", resources_.c_str(),
         "logger", &logger_,
-        "visible", visible_);
-    pInstance_ = PyObject_Call(pClass_, args, kwargs);
+        "visible", visible_,
+        "event_mode_used", eventModeUsed_ ? Py_True : Py_False,
+        "early_return_allowed", earlyReturnAllowed_ ? Py_True : Py_False);
+    {
+        PyProfiler::Scope python(profiler_.get(), PyProfiler::Phase::Python);
+        pInstance_ = PyObject_Call(pClass_, args, kwargs);
+    }
     Py_DECREF(args);
     Py_DECREF(kwargs);
     if (pInstance_ == nullptr) {
         handle_py_exception("[initialize] PyObject_Call", gilState);
     }
-    pMessages_ = PyObject_CallMethod(pInstance_, "_get_log_queue", nullptr);
+    pMessages_ = callMethod(pInstance_, "_get_log_queue", nullptr);
+    pComputed_ = callMethod(pInstance_, "_get_computed_values", nullptr);
+    if (pComputed_ == nullptr) {
+        handle_py_exception("[initialize] PyObject_CallMethod", gilState);
+    }
+
+    // Look the partitions up once so that activating a clock calls its partition directly
+    clearPartitions();
+    PyObject* partitions = callMethod(pInstance_, "_get_model_partitions", nullptr);
+    if (partitions == nullptr) {
+        handle_py_exception("[initialize] PyObject_CallMethod", gilState);
+    }
+    PyObject* key;
+    PyObject* partition;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(partitions, &pos, &key, &partition)) {
+        Py_INCREF(partition);
+        partitions_[static_cast<cppfmu::FMIValueReference>(PyLong_AsUnsignedLong(key))] = partition;
+    }
+    Py_DECREF(partitions);
 }
 
 void PySlaveInstance::SetupExperiment(cppfmu::FMIBoolean, cppfmu::FMIFloat64, cppfmu::FMIFloat64 startTime, cppfmu::FMIBoolean, cppfmu::FMIFloat64)
 {
-    py_safe_run([this, startTime](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "setup_experiment", "(d)", startTime);
+    py_safe_run(__func__, [this, startTime](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "setup_experiment", "(d)", startTime);
         if (f == nullptr) {
             handle_py_exception("[setupExperiment] PyObject_CallMethod", gilState);
         }
@@ -179,8 +334,8 @@ void PySlaveInstance::SetupExperiment(cppfmu::FMIBoolean, cppfmu::FMIFloat64, cp
 
 void PySlaveInstance::EnterInitializationMode()
 {
-    py_safe_run([this](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "enter_initialization_mode", nullptr);
+    py_safe_run(__func__, [this](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "enter_initialization_mode", nullptr);
         if (f == nullptr) {
             handle_py_exception("[enterInitializationMode] PyObject_CallMethod", gilState);
         }
@@ -191,12 +346,37 @@ void PySlaveInstance::EnterInitializationMode()
 
 void PySlaveInstance::ExitInitializationMode()
 {
-    py_safe_run([this](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "exit_initialization_mode", nullptr);
+    py_safe_run(__func__, [this](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "exit_initialization_mode", nullptr);
         if (f == nullptr) {
             handle_py_exception("[exitInitializationMode] PyObject_CallMethod", gilState);
         }
         Py_DECREF(f);
+        clearComputed();
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::EnterConfigurationMode()
+{
+    py_safe_run(__func__, [this](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "enter_configuration_mode", nullptr);
+        if (f == nullptr) {
+            handle_py_exception("[enterConfigurationMode] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::ExitConfigurationMode()
+{
+    py_safe_run(__func__, [this](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "exit_configuration_mode", nullptr);
+        if (f == nullptr) {
+            handle_py_exception("[exitConfigurationMode] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
         clearLogBuffer();
     });
 }
@@ -210,8 +390,8 @@ cppfmu::FMIStatus PySlaveInstance::DoStep(cppfmu::FMIFloat64 currentTime,
     cppfmu::FMIFloat64& endOfStep)
 {
     cppfmu::FMIStatus fmuStatus = cppfmu::FMIOK;
-    py_safe_run([this, &fmuStatus, currentTime, stepSize, terminateSimulation](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "do_step", "(dd)", currentTime, stepSize);
+    py_safe_run(__func__, [this, &fmuStatus, currentTime, stepSize, eventHandlingNeeded, terminateSimulation, earlyReturn, &endOfStep](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "do_step", "(dd)", currentTime, stepSize);
         if (f == nullptr) {
             handle_py_exception("[doStep] PyObject_CallMethod", gilState);
         }
@@ -236,24 +416,75 @@ cppfmu::FMIStatus PySlaveInstance::DoStep(cppfmu::FMIFloat64 currentTime,
                 Py_DECREF(pyTerminateSimulation);
             }
         }
+
+        // Events and early returns are only reported when the importer asked for them
+        if (eventModeUsed_ && PyObject_HasAttrString(f, "eventHandlingNeeded")) {
+            PyObject* pyEventHandlingNeeded = PyObject_GetAttrString(f, "eventHandlingNeeded");
+            if (pyEventHandlingNeeded) {
+                *eventHandlingNeeded = static_cast<bool>(PyObject_IsTrue(pyEventHandlingNeeded));
+                Py_DECREF(pyEventHandlingNeeded);
+            }
+        }
+        if (earlyReturnAllowed_ && PyObject_HasAttrString(f, "earlyReturn")) {
+            PyObject* pyEarlyReturn = PyObject_GetAttrString(f, "earlyReturn");
+            if (pyEarlyReturn) {
+                *earlyReturn = static_cast<bool>(PyObject_IsTrue(pyEarlyReturn));
+                Py_DECREF(pyEarlyReturn);
+            }
+            PyObject* pyLastSuccessfulTime = PyObject_GetAttrString(f, "lastSuccessfulTime");
+            if (pyLastSuccessfulTime && pyLastSuccessfulTime != Py_None) {
+                endOfStep = PyFloat_AsDouble(pyLastSuccessfulTime);
+            } else if (*earlyReturn) {
+                *earlyReturn = false;
+            }
+            Py_XDECREF(pyLastSuccessfulTime);
+            PyErr_Clear();
+        }
         Py_DECREF(f);
+        clearComputed();
         clearLogBuffer();
     });
 
     return fmuStatus;
 }
 
+void PySlaveInstance::EnterEventMode()
+{
+    py_safe_run(__func__, [this](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "enter_event_mode", nullptr);
+        if (f == nullptr) {
+            handle_py_exception("[enterEventMode] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearComputed();
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::EnterStepMode()
+{
+    py_safe_run(__func__, [this](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "enter_step_mode", nullptr);
+        if (f == nullptr) {
+            handle_py_exception("[enterStepMode] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearComputed();
+        clearLogBuffer();
+    });
+}
+
 void PySlaveInstance::Reset()
 {
-    py_safe_run([this](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this](PyGILState_STATE gilState) {
         initialize(gilState);
     });
 }
 
 void PySlaveInstance::Terminate()
 {
-    py_safe_run([this](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "terminate", nullptr);
+    py_safe_run(__func__, [this](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "terminate", nullptr);
         if (f == nullptr) {
             handle_py_exception("[terminate] PyObject_CallMethod", gilState);
         }
@@ -264,17 +495,18 @@ void PySlaveInstance::Terminate()
 
 void PySlaveInstance::SetFloat64(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIFloat64* values, std::size_t nValues)
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
-        PyObject* refs = PyList_New(nValues);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-        for (int i = 0; i < nValues; i++) {
-            PyList_SetItem(refs, i, Py_BuildValue("d", values[i]));
+        PyObject* refs = valuesView(values, nValues, "d");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setFloat64] valuesView", gilState);
         }
 
-        auto f = PyObject_CallMethod(pInstance_, "set_float64", "(OO)", vrs, refs);
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "float64", vrs, refs);
         Py_DECREF(vrs);
         Py_DECREF(refs);
         if (f == nullptr) {
@@ -287,18 +519,18 @@ void PySlaveInstance::SetFloat64(const cppfmu::FMIValueReference* vr, std::size_
 
 void PySlaveInstance::SetInt32(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIInt32* values, std::size_t nValues)
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
-        PyObject* refs = PyList_New(nValues);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-
-        for (int i = 0; i < nValues; i++) {
-            PyList_SetItem(refs, i, Py_BuildValue("i", values[i]));
+        PyObject* refs = valuesView(values, nValues, "i");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setInt32] valuesView", gilState);
         }
 
-        auto f = PyObject_CallMethod(pInstance_, "set_int32", "(OO)", vrs, refs);
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "int32", vrs, refs);
         Py_DECREF(vrs);
         Py_DECREF(refs);
         if (f == nullptr) {
@@ -311,17 +543,18 @@ void PySlaveInstance::SetInt32(const cppfmu::FMIValueReference* vr, std::size_t
 
 void PySlaveInstance::SetInt64(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIInt64* values, std::size_t nValues)
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
-        PyObject* refs = PyList_New(nValues);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-        for (int i = 0; i < nValues; i++) {
-            PyList_SetItem(refs, i, Py_BuildValue("L", values[i]));
+        PyObject* refs = valuesView(values, nValues, "q");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setInt64] valuesView", gilState);
         }
 
-        auto f = PyObject_CallMethod(pInstance_, "set_int64", "(OO)", vrs, refs);
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "int64", vrs, refs);
         Py_DECREF(vrs);
         Py_DECREF(refs);
         if (f == nullptr) {
@@ -334,17 +567,18 @@ void PySlaveInstance::SetInt64(const cppfmu::FMIValueReference* vr, std::size_t
 
 void PySlaveInstance::SetUInt64(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIUInt64* values, std::size_t nValues)
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
-        PyObject* refs = PyList_New(nValues);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-        for (int i = 0; i < nValues; i++) {
-            PyList_SetItem(refs, i, Py_BuildValue("K", values[i]));
+        PyObject* refs = valuesView(values, nValues, "Q");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setUInt64] valuesView", gilState);
         }
 
-        auto f = PyObject_CallMethod(pInstance_, "set_uint64", "(OO)", vrs, refs);
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "uint64", vrs, refs);
         Py_DECREF(vrs);
         Py_DECREF(refs);
         if (f == nullptr) {
@@ -357,7 +591,7 @@ void PySlaveInstance::SetUInt64(const cppfmu::FMIValueReference* vr, std::size_t
 
 void PySlaveInstance::SetBoolean(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIBoolean* values, std::size_t nValues)
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
         PyObject* refs = PyList_New(nValues);
         for (int i = 0; i < nvr; i++) {
@@ -367,7 +601,7 @@ void PySlaveInstance::SetBoolean(const cppfmu::FMIValueReference* vr, std::size_
             PyList_SetItem(refs, i, PyBool_FromLong(values[i]));
         }
 
-        auto f = PyObject_CallMethod(pInstance_, "set_boolean", "(OO)", vrs, refs);
+        auto f = callMethod(pInstance_, "set_boolean", "(OO)", vrs, refs);
         Py_DECREF(vrs);
         Py_DECREF(refs);
         if (f == nullptr) {
@@ -380,7 +614,7 @@ void PySlaveInstance::SetBoolean(const cppfmu::FMIValueReference* vr, std::size_
 
 void PySlaveInstance::SetString(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIString const* values, std::size_t nValues)
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
         PyObject* refs = PyList_New(nvr);
         for (int i = 0; i < nvr; i++) {
@@ -390,7 +624,7 @@ void PySlaveInstance::SetString(const cppfmu::FMIValueReference* vr, std::size_t
             PyList_SetItem(refs, i, Py_BuildValue("s", values[i]));
         }
 
-        auto f = PyObject_CallMethod(pInstance_, "set_string", "(OO)", vrs, refs);
+        auto f = callMethod(pInstance_, "set_string", "(OO)", vrs, refs);
         Py_DECREF(vrs);
         Py_DECREF(refs);
         if (f == nullptr) {
@@ -401,23 +635,191 @@ void PySlaveInstance::SetString(const cppfmu::FMIValueReference* vr, std::size_t
     });
 }
 
+void PySlaveInstance::SetFloat32(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIFloat32* values, std::size_t nValues)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        PyObject* refs = valuesView(values, nValues, "f");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setFloat32] valuesView", gilState);
+        }
+
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "float32", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setFloat32] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::SetInt8(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIInt8* values, std::size_t nValues)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        PyObject* refs = valuesView(values, nValues, "b");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setInt8] valuesView", gilState);
+        }
+
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "int8", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setInt8] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::SetInt16(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIInt16* values, std::size_t nValues)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        PyObject* refs = valuesView(values, nValues, "h");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setInt16] valuesView", gilState);
+        }
+
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "int16", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setInt16] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::SetUInt8(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIUInt8* values, std::size_t nValues)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        PyObject* refs = valuesView(values, nValues, "B");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setUInt8] valuesView", gilState);
+        }
+
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "uint8", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setUInt8] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::SetUInt16(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIUInt16* values, std::size_t nValues)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        PyObject* refs = valuesView(values, nValues, "H");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setUInt16] valuesView", gilState);
+        }
+
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "uint16", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setUInt16] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::SetUInt32(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIUInt32* values, std::size_t nValues)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        PyObject* refs = valuesView(values, nValues, "I");
+        if (refs == nullptr) {
+            Py_DECREF(vrs);
+            handle_py_exception("[setUInt32] valuesView", gilState);
+        }
+
+        auto f = callMethod(pInstance_, "_set_buffer", "(sOO)", "uint32", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setUInt32] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::SetBinary(const cppfmu::FMIValueReference* vr, std::size_t nvr, const std::size_t* valueSizes, cppfmu::FMIBinary const* values, std::size_t nValues)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &valueSizes, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        PyObject* refs = PyList_New(nValues);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        // The importer owns the values only for the duration of the call, so they are copied once into bytes
+        for (int i = 0; i < nValues; i++) {
+            PyList_SetItem(refs, i, PyBytes_FromStringAndSize(reinterpret_cast<const char*>(values[i]), valueSizes[i]));
+        }
+
+        auto f = callMethod(pInstance_, "set_binary", "(OO)", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setBinary] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
 void PySlaveInstance::GetFloat64(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIFloat64* values, std::size_t nValues) const
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
 
-        auto refs = PyObject_CallMethod(pInstance_, "get_float64", "O", vrs);
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "float64", vrs);
         Py_DECREF(vrs);
         if (refs == nullptr) {
             handle_py_exception("[getFloat64] PyObject_CallMethod", gilState);
         }
 
-        for (int i = 0; i < nValues; i++) {
-            PyObject* value = PyList_GetItem(refs, i);
-            values[i] = PyFloat_AsDouble(value);
+        if (!readArray(refs, values, nValues, "d", toFloat64)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getFloat64] readArray", gilState);
         }
         Py_DECREF(refs);
         clearLogBuffer();
@@ -426,20 +828,20 @@ void PySlaveInstance::GetFloat64(const cppfmu::FMIValueReference* vr, std::size_
 
 void PySlaveInstance::GetInt32(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIInt32* values, std::size_t nValues) const
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-        auto refs = PyObject_CallMethod(pInstance_, "get_int32", "O", vrs);
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "int32", vrs);
         Py_DECREF(vrs);
         if (refs == nullptr) {
             handle_py_exception("[getInt32] PyObject_CallMethod", gilState);
         }
 
-        for (int i = 0; i < nValues; i++) {
-            PyObject* value = PyList_GetItem(refs, i);
-            values[i] = static_cast<cppfmu::FMIInt32>(PyLong_AsLong(value));
+        if (!readArray(refs, values, nValues, "il", toInt32)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getInt32] readArray", gilState);
         }
         Py_DECREF(refs);
         clearLogBuffer();
@@ -448,20 +850,20 @@ void PySlaveInstance::GetInt32(const cppfmu::FMIValueReference* vr, std::size_t
 
 void PySlaveInstance::GetInt64(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIInt64* values, std::size_t nValues) const
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-        auto refs = PyObject_CallMethod(pInstance_, "get_int64", "O", vrs);
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "int64", vrs);
         Py_DECREF(vrs);
         if (refs == nullptr) {
             handle_py_exception("[getInt64] PyObject_CallMethod", gilState);
         }
 
-        for (int i = 0; i < nValues; i++) {
-            PyObject* value = PyList_GetItem(refs, i);
-            values[i] = static_cast<cppfmu::FMIInt64>(PyLong_AsLongLong(value));
+        if (!readArray(refs, values, nValues, "lq", toInt64)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getInt64] readArray", gilState);
         }
         Py_DECREF(refs);
         clearLogBuffer();
@@ -470,26 +872,21 @@ void PySlaveInstance::GetInt64(const cppfmu::FMIValueReference* vr, std::size_t
 
 void PySlaveInstance::GetUInt64(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIUInt64* values, std::size_t nValues) const
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-        auto refs = PyObject_CallMethod(pInstance_, "get_uint64", "O", vrs);
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "uint64", vrs);
         Py_DECREF(vrs);
         if (refs == nullptr) {
             handle_py_exception("[getUInt64] PyObject_CallMethod", gilState);
         }
 
-        for (int i = 0; i < nValues; i++) {
-            PyObject* item = PyList_GetItem(refs, i);
-            PyObject* value = PyObject_GetAttrString(item, "value");
-            if (value && PyLong_Check(value))
-            {
-                values[i] = static_cast<cppfmu::FMIUInt64>(PyLong_AsUnsignedLongLong(value));
-            }
+        if (!readArray(refs, values, nValues, "LQ", toUInt64)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getUInt64] readArray", gilState);
         }
-
         Py_DECREF(refs);
         clearLogBuffer();
     });
@@ -497,12 +894,12 @@ void PySlaveInstance::GetUInt64(const cppfmu::FMIValueReference* vr, std::size_t
 
 void PySlaveInstance::GetBoolean(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIBoolean* values, std::size_t nValues) const
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-        auto refs = PyObject_CallMethod(pInstance_, "get_boolean", "O", vrs);
+        auto refs = callMethod(pInstance_, "get_boolean", "O", vrs);
         Py_DECREF(vrs);
         if (refs == nullptr) {
             handle_py_exception("[getBoolean] PyObject_CallMethod", gilState);
@@ -519,22 +916,206 @@ void PySlaveInstance::GetBoolean(const cppfmu::FMIValueReference* vr, std::size_
 
 void PySlaveInstance::GetString(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIString* values, std::size_t nValues) const
 {
-    py_safe_run([this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
-        clearStrBuffer();
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
         PyObject* vrs = PyList_New(nvr);
         for (int i = 0; i < nvr; i++) {
             PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-        auto refs = PyObject_CallMethod(pInstance_, "get_string", "O", vrs);
+        auto refs = callMethod(pInstance_, "get_string", "O", vrs);
         Py_DECREF(vrs);
         if (refs == nullptr) {
             handle_py_exception("[getString] PyObject_CallMethod", gilState);
         }
 
         for (int i = 0; i < nValues; i++) {
-            PyObject* value = PyUnicode_AsEncodedString(PyList_GetItem(refs, i), "utf-8", nullptr);
-            values[i] = PyBytes_AsString(value);
-            strBuffer.emplace_back(value);
+            PyObject* value = PyList_GetItem(refs, i);
+            auto& cached = strCache_[vr[i]];
+            if (cached.first != value) {
+                // The str is new or was replaced: encode it once and keep it alive with its encoding
+                PyObject* encoded = PyUnicode_AsEncodedString(value, "utf-8", nullptr);
+                if (encoded == nullptr) {
+                    Py_DECREF(refs);
+                    handle_py_exception("[getString] PyUnicode_AsEncodedString", gilState);
+                }
+                Py_XDECREF(cached.first);
+                Py_XDECREF(cached.second);
+                Py_INCREF(value);
+                cached = {value, encoded};
+            }
+            values[i] = PyBytes_AsString(cached.second);
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetFloat32(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIFloat32* values, std::size_t nValues) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "float32", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getFloat32] PyObject_CallMethod", gilState);
+        }
+
+        if (!readArray(refs, values, nValues, "f", toFloat32)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getFloat32] readArray", gilState);
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetInt8(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIInt8* values, std::size_t nValues) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "int8", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getInt8] PyObject_CallMethod", gilState);
+        }
+
+        if (!readArray(refs, values, nValues, "b", toInt8)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getInt8] readArray", gilState);
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetInt16(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIInt16* values, std::size_t nValues) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "int16", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getInt16] PyObject_CallMethod", gilState);
+        }
+
+        if (!readArray(refs, values, nValues, "h", toInt16)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getInt16] readArray", gilState);
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetUInt8(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIUInt8* values, std::size_t nValues) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "uint8", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getUInt8] PyObject_CallMethod", gilState);
+        }
+
+        if (!readArray(refs, values, nValues, "B", toUInt8)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getUInt8] readArray", gilState);
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetUInt16(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIUInt16* values, std::size_t nValues) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "uint16", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getUInt16] PyObject_CallMethod", gilState);
+        }
+
+        if (!readArray(refs, values, nValues, "H", toUInt16)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getUInt16] readArray", gilState);
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetUInt32(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIUInt32* values, std::size_t nValues) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values, nValues](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        auto refs = callMethod(pInstance_, "_get_buffer", "(sO)", "uint32", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getUInt32] PyObject_CallMethod", gilState);
+        }
+
+        if (!readArray(refs, values, nValues, "IL", toUInt32)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getUInt32] readArray", gilState);
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetBinary(const cppfmu::FMIValueReference* vr, std::size_t nvr, std::size_t* valueSizes, cppfmu::FMIBinary* values, std::size_t nValues) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &valueSizes, &values, nValues](PyGILState_STATE gilState) {
+        clearBinBuffer();
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        auto refs = callMethod(pInstance_, "get_binary", "O", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getBinary] PyObject_CallMethod", gilState);
+        }
+
+        // bytes and bytearray values are exposed without copy, they are kept alive until the next call
+        for (int i = 0; i < nValues; i++) {
+            PyObject* value = PyList_GetItem(refs, i);
+            if (PyBytes_Check(value) || PyByteArray_Check(value)) {
+                Py_INCREF(value);
+            } else {
+                value = PyBytes_FromObject(value);
+                if (value == nullptr) {
+                    Py_DECREF(refs);
+                    handle_py_exception("[getBinary] PyBytes_FromObject", gilState);
+                }
+            }
+            binBuffer.emplace_back(value);
+
+            if (PyBytes_Check(value)) {
+                values[i] = reinterpret_cast<cppfmu::FMIBinary>(PyBytes_AsString(value));
+                valueSizes[i] = static_cast<std::size_t>(PyBytes_Size(value));
+            } else {
+                values[i] = reinterpret_cast<cppfmu::FMIBinary>(PyByteArray_AsString(value));
+                valueSizes[i] = static_cast<std::size_t>(PyByteArray_Size(value));
+            }
         }
         Py_DECREF(refs);
         clearLogBuffer();
@@ -543,15 +1124,14 @@ void PySlaveInstance::GetString(const cppfmu::FMIValueReference* vr, std::size_t
 
 void PySlaveInstance::GetContinuousStates(cppfmu::FMIFloat64* continuousStates, std::size_t nStates) const
 {
-    py_safe_run([this, &continuousStates, nStates](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "get_continuous_states", nullptr);
+    py_safe_run(__func__, [this, &continuousStates, nStates](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "get_continuous_states", nullptr);
         if (f == nullptr) {
             handle_py_exception("[get_continuous_states] PyObject_CallMethod", gilState);
         }
-        // Assuming f is a list of floats
-        for (std::size_t i = 0; i < nStates; i++) {
-            PyObject* item = PyList_GetItem(f, i);
-            continuousStates[i] = static_cast<cppfmu::FMIFloat64>(PyFloat_AsDouble(item));
+        if (!readFloat64Array(f, continuousStates, nStates)) {
+            Py_DECREF(f);
+            handle_py_exception("[get_continuous_states] readFloat64Array", gilState);
         }
         Py_DECREF(f);
         clearLogBuffer();
@@ -560,16 +1140,15 @@ void PySlaveInstance::GetContinuousStates(cppfmu::FMIFloat64* continuousStates,
 
 void PySlaveInstance::GetContinuousStateDerivatives(cppfmu::FMIFloat64* continuousStateDerivatives, std::size_t nStates) const
 {
-    py_safe_run([this, &continuousStateDerivatives, nStates](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "get_continuous_state_derivatives", nullptr);
+    py_safe_run(__func__, [this, &continuousStateDerivatives, nStates](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "get_continuous_state_derivatives", nullptr);
         if (f == nullptr) {
             PyErr_Print();
             handle_py_exception("[get_continuous_state_derivatives] PyObject_CallMethod", gilState);
         }
-        // Assuming f is a list of floats
-        for (std::size_t i = 0; i < nStates; i++) {
-            PyObject* item = PyList_GetItem(f, i);
-            continuousStateDerivatives[i] = static_cast<cppfmu::FMIFloat64>(PyFloat_AsDouble(item));
+        if (!readFloat64Array(f, continuousStateDerivatives, nStates)) {
+            Py_DECREF(f);
+            handle_py_exception("[get_continuous_state_derivatives] readFloat64Array", gilState);
         }
         Py_DECREF(f);
         clearLogBuffer();
@@ -578,16 +1157,15 @@ void PySlaveInstance::GetContinuousStateDerivatives(cppfmu::FMIFloat64* continuo
 
 void PySlaveInstance::GetNominalsOfContinuousStates(cppfmu::FMIFloat64* nominalsOfContinuousStates, std::size_t nStates) const
 {
-    py_safe_run([this, &nominalsOfContinuousStates, nStates](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "get_nominals_of_continuous_states", "(i)", static_cast<int>(nStates));
+    py_safe_run(__func__, [this, &nominalsOfContinuousStates, nStates](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "get_nominals_of_continuous_states", "(i)", static_cast<int>(nStates));
          // Check if f is a valid object
          if (f == nullptr) {
             handle_py_exception("[getNominalContinuousStates] PyObject_CallMethod", gilState);
         }
-        // Assuming f is a list of floats
-        for (std::size_t i = 0; i < nStates; i++) {
-            PyObject* item = PyList_GetItem(f, i);
-            nominalsOfContinuousStates[i] = static_cast<cppfmu::FMIFloat64>(PyFloat_AsDouble(item));
+        if (!readFloat64Array(f, nominalsOfContinuousStates, nStates)) {
+            Py_DECREF(f);
+            handle_py_exception("[getNominalContinuousStates] readFloat64Array", gilState);
         }
         Py_DECREF(f);
         clearLogBuffer();
@@ -596,13 +1174,13 @@ void PySlaveInstance::GetNominalsOfContinuousStates(cppfmu::FMIFloat64* nominals
 
 void PySlaveInstance::SetContinuousStates(const cppfmu::FMIFloat64* continuousStates, std::size_t nStates)
 {
-    py_safe_run([this, &continuousStates, nStates](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &continuousStates, nStates](PyGILState_STATE gilState) {
         PyObject* refs = PyList_New(nStates);
         for (int i = 0; i < nStates; i++) {
             PyList_SetItem(refs, i, Py_BuildValue("d", continuousStates[i]));
         }
 
-        auto f = PyObject_CallMethod(pInstance_, "set_continuous_states", "(O)", refs);
+        auto f = callMethod(pInstance_, "set_continuous_states", "(O)", refs);
         Py_DECREF(refs);
         if (f == nullptr) {
             handle_py_exception("[setContinuousStates] PyObject_CallMethod", gilState);
@@ -614,8 +1192,8 @@ void PySlaveInstance::SetContinuousStates(const cppfmu::FMIFloat64* continuousSt
 
 void PySlaveInstance::GetNumberOfContinuousStates(std::size_t& nStates) const
 {
-    py_safe_run([this, &nStates](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "get_number_of_continuous_states", nullptr);
+    py_safe_run(__func__, [this, &nStates](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "get_number_of_continuous_states", nullptr);
         if (f == nullptr) {
             handle_py_exception("[getNumberOfContinuousStates] PyObject_CallMethod", gilState);
         }
@@ -627,8 +1205,8 @@ void PySlaveInstance::GetNumberOfContinuousStates(std::size_t& nStates) const
 
 void PySlaveInstance::GetNumberOfEventIndicators(std::size_t& nIndicators) const
 {
-    py_safe_run([this, &nIndicators](PyGILState_STATE gilState) {
-         auto f = PyObject_CallMethod(pInstance_, "get_number_of_event_indicators", nullptr);
+    py_safe_run(__func__, [this, &nIndicators](PyGILState_STATE gilState) {
+         auto f = callMethod(pInstance_, "get_number_of_event_indicators", nullptr);
          if (f == nullptr) {
              handle_py_exception("[getNumberOfEventIndicators] PyObject_CallMethod", gilState);
          }
@@ -640,15 +1218,14 @@ void PySlaveInstance::GetNumberOfEventIndicators(std::size_t& nIndicators) const
 
 void PySlaveInstance::GetEventIndicators(cppfmu::FMIFloat64* eventIndicators, std::size_t nIndicators) const
 {
-    py_safe_run([this, &eventIndicators, nIndicators](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "get_event_indicators", nullptr);
+    py_safe_run(__func__, [this, &eventIndicators, nIndicators](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "get_event_indicators", nullptr);
         if (f == nullptr) {
             handle_py_exception("[getEventIndicators] PyObject_CallMethod", gilState);
         }
-        // Assuming f is a list of floats
-        for (std::size_t i = 0; i < nIndicators; i++) {
-            PyObject* item = PyList_GetItem(f, i);
-            eventIndicators[i] = static_cast<cppfmu::FMIFloat64>(PyFloat_AsDouble(item));
+        if (!readFloat64Array(f, eventIndicators, nIndicators)) {
+            Py_DECREF(f);
+            handle_py_exception("[getEventIndicators] readFloat64Array", gilState);
         }
         Py_DECREF(f);
         clearLogBuffer();
@@ -659,8 +1236,8 @@ void PySlaveInstance::GetEventIndicators(cppfmu::FMIFloat64* eventIndicators, st
 
 void PySlaveInstance::SetTime(cppfmu::FMIFloat64 time)
 {
-    py_safe_run([this, time](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "set_time", "(d)", time);
+    py_safe_run(__func__, [this, time](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "set_time", "(d)", time);
         if (f == nullptr) {
             handle_py_exception("[setTime] PyObject_CallMethod", gilState);
         }
@@ -677,52 +1254,291 @@ void PySlaveInstance::UpdateDiscreteStates(
     cppfmu::FMIBoolean* nextEventTimeDefined,
     cppfmu::FMIFloat64* nextEventTime)
 {
-    py_safe_run([this, discreteStatesNeedUpdate, terminateSimulation, nominalContinuousStatesChanged, valuesOfContinuousStatesChanged, nextEventTimeDefined, nextEventTime](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "update_discrete_states", nullptr);
+    py_safe_run(__func__, [this, discreteStatesNeedUpdate, terminateSimulation, nominalContinuousStatesChanged, valuesOfContinuousStatesChanged, nextEventTimeDefined, nextEventTime](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "update_discrete_states", nullptr);
         if (f == nullptr) {
             handle_py_exception("[updateDiscreteStates] PyObject_CallMethod", gilState);
         }
 
-        if (PyObject_HasAttrString(f, "discreteStatesNeedUpdate")) {
-            PyObject * pyDiscreteStatesNeedUpdate = PyObject_GetAttrString(f, "discreteStatesNeedUpdate");
-            *discreteStatesNeedUpdate = static_cast<bool>(PyObject_IsTrue(pyDiscreteStatesNeedUpdate));
-            Py_DECREF(pyDiscreteStatesNeedUpdate);
+        // The flags missing from the result of the model are false
+        const auto readFlag = [f](const char* name, cppfmu::FMIBoolean* flag) {
+            *flag = false;
+            if (PyObject_HasAttrString(f, name)) {
+                PyObject* pyFlag = PyObject_GetAttrString(f, name);
+                if (pyFlag) {
+                    *flag = static_cast<bool>(PyObject_IsTrue(pyFlag));
+                    Py_DECREF(pyFlag);
+                }
+            }
+        };
+        readFlag("discreteStateNeedsUpdate", discreteStatesNeedUpdate);
+        readFlag("terminateSimulation", terminateSimulation);
+        readFlag("nominalsOfContinuousStatesChanged", nominalContinuousStatesChanged);
+        readFlag("valuesOfContinuousStatesChanged", valuesOfContinuousStatesChanged);
+        readFlag("nextEventTimeDefined", nextEventTimeDefined);
+        if (*nextEventTimeDefined) {
+            PyObject* pyNextEventTime = PyObject_GetAttrString(f, "nextEventTime");
+            if (pyNextEventTime) {
+                *nextEventTime = PyFloat_AsDouble(pyNextEventTime);
+                Py_DECREF(pyNextEventTime);
+            }
         }
-        if (PyObject_HasAttrString(f, "terminateSimulation")) {
-            PyObject* pyTerminateSimulation = PyObject_GetAttrString(f, "terminateSimulation");
-            *terminateSimulation = static_cast<bool>(PyObject_IsTrue(pyTerminateSimulation));
-            Py_DECREF(pyTerminateSimulation);
+
+        Py_DECREF(f);
+        clearComputed();
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetClock(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIClock* values) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        auto refs = callMethod(pInstance_, "get_clock", "O", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getClock] PyObject_CallMethod", gilState);
+        }
+
+        for (int i = 0; i < nvr; i++) {
+            PyObject* value = PyList_GetItem(refs, i);
+            values[i] = PyObject_IsTrue(value);
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::SetClock(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIClock* values)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &values](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        PyObject* refs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+            PyList_SetItem(refs, i, PyBool_FromLong(values[i]));
         }
-        if (PyObject_HasAttrString(f, "nominalContinuousStatesChanged")) {
-            PyObject* pyNominalContinuousStatesChanged = PyObject_GetAttrString(f, "nominalContinuousStatesChanged");
-            *nominalContinuousStatesChanged = static_cast<bool>(PyObject_IsTrue(pyNominalContinuousStatesChanged));
-            Py_DECREF(pyNominalContinuousStatesChanged);
+
+        auto f = callMethod(pInstance_, "set_clock", "(OO)", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setClock] PyObject_CallMethod", gilState);
         }
-        if (PyObject_HasAttrString(f, "valuesOfContinuousStatesChanged")) {
-            PyObject* pyValuesOfContinuousStatesChanged = PyObject_GetAttrString(f, "valuesOfContinuousStatesChanged");
-            *valuesOfContinuousStatesChanged = static_cast<bool>(PyObject_IsTrue(pyValuesOfContinuousStatesChanged));
-            Py_DECREF(pyValuesOfContinuousStatesChanged);
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetIntervalDecimal(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIFloat64* intervals, cppfmu::FMIIntervalQualifier* qualifiers) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &intervals, &qualifiers](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
         }
-        if (PyObject_HasAttrString(f, "nextEventTimeDefined")) {
-            PyObject* pyNextEventTimeDefined = PyObject_GetAttrString(f, "nextEventTimeDefined");
-            *nextEventTimeDefined = static_cast<bool>(PyObject_IsTrue(pyNextEventTimeDefined));
-            Py_DECREF(pyNextEventTimeDefined);
+        auto refs = callMethod(pInstance_, "get_interval_decimal", "O", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getIntervalDecimal] PyObject_CallMethod", gilState);
         }
-        if (nextEventTimeDefined && *nextEventTimeDefined) {
-            PyObject* pyNextEventTime = PyObject_GetAttrString(f, "nextEventTime");
-            *nextEventTime = PyFloat_AsDouble(pyNextEventTime);
-            Py_DECREF(pyNextEventTime);
+
+        // Each item is an (interval, qualifier) tuple
+        for (int i = 0; i < nvr; i++) {
+            PyObject* item = PyList_GetItem(refs, i);
+            intervals[i] = PyFloat_AsDouble(PyTuple_GetItem(item, 0));
+            qualifiers[i] = static_cast<cppfmu::FMIIntervalQualifier>(PyLong_AsLong(PyTuple_GetItem(item, 1)));
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::SetIntervalDecimal(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIFloat64* intervals)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &intervals](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        PyObject* refs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+            PyList_SetItem(refs, i, Py_BuildValue("d", intervals[i]));
+        }
+
+        auto f = callMethod(pInstance_, "set_interval_decimal", "(OO)", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setIntervalDecimal] PyObject_CallMethod", gilState);
+        }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetShiftDecimal(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIFloat64* shifts) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &shifts](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+        }
+        auto refs = callMethod(pInstance_, "get_shift_decimal", "O", vrs);
+        Py_DECREF(vrs);
+        if (refs == nullptr) {
+            handle_py_exception("[getShiftDecimal] PyObject_CallMethod", gilState);
+        }
+
+        for (int i = 0; i < nvr; i++) {
+            shifts[i] = PyFloat_AsDouble(PyList_GetItem(refs, i));
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::SetShiftDecimal(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIFloat64* shifts)
+{
+    py_safe_run(__func__, [this, &vr, nvr, &shifts](PyGILState_STATE gilState) {
+        PyObject* vrs = PyList_New(nvr);
+        PyObject* refs = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+            PyList_SetItem(refs, i, Py_BuildValue("d", shifts[i]));
+        }
+
+        auto f = callMethod(pInstance_, "set_shift_decimal", "(OO)", vrs, refs);
+        Py_DECREF(vrs);
+        Py_DECREF(refs);
+        if (f == nullptr) {
+            handle_py_exception("[setShiftDecimal] PyObject_CallMethod", gilState);
         }
+        Py_DECREF(f);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::ActivateModelPartition(cppfmu::FMIValueReference clockReference, cppfmu::FMIFloat64 activationTime)
+{
+    const auto it = partitions_.find(clockReference);
+    if (it == partitions_.end()) {
+        throw std::invalid_argument("No model partition registered for clock with valueReference=" + std::to_string(clockReference));
+    }
+    PyObject* partition = it->second;
+
+    // Only the partition of the activated clock is called, without going through the facade
+    py_safe_run(__func__, [this, partition, activationTime](PyGILState_STATE gilState) {
+        PyObject* f;
+        {
+            PyProfiler::Scope python(profiler_.get(), PyProfiler::Phase::Python);
+            f = PyObject_CallFunction(partition, "(d)", activationTime);
+        }
+        if (f == nullptr) {
+            handle_py_exception("[activateModelPartition] PyObject_CallFunction", gilState);
+        }
+        Py_DECREF(f);
+        clearComputed();
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetNumberOfVariableDependencies(cppfmu::FMIValueReference vr, std::size_t& nDependencies) const
+{
+    py_safe_run(__func__, [this, vr, &nDependencies](PyGILState_STATE gilState) {
+        auto refs = callMethod(pInstance_, "get_variable_dependencies", "(I)", vr);
+        if (refs == nullptr) {
+            handle_py_exception("[getNumberOfVariableDependencies] PyObject_CallMethod", gilState);
+        }
+        Py_ssize_t size = PySequence_Size(refs);
+        Py_DECREF(refs);
+        if (size < 0) {
+            handle_py_exception("[getNumberOfVariableDependencies] PySequence_Size", gilState);
+        }
+        nDependencies = static_cast<std::size_t>(size);
+        clearLogBuffer();
+    });
+}
 
+void PySlaveInstance::GetVariableDependencies(cppfmu::FMIValueReference dependent, std::size_t* elementIndicesOfDependent, cppfmu::FMIValueReference* independents, std::size_t* elementIndicesOfIndependents, cppfmu::FMIDependencyKind* dependencyKinds, std::size_t nDependencies) const
+{
+    py_safe_run(__func__, [this, dependent, &elementIndicesOfDependent, &independents, &elementIndicesOfIndependents, &dependencyKinds, nDependencies](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "get_variable_dependencies", "(I)", dependent);
+        if (f == nullptr) {
+            handle_py_exception("[getVariableDependencies] PyObject_CallMethod", gilState);
+        }
+        // Lists or tuples are accepted, for the dependencies and each of them
+        PyObject* refs = PySequence_Fast(f, "get_variable_dependencies must return a sequence");
         Py_DECREF(f);
+        if (refs == nullptr) {
+            handle_py_exception("[getVariableDependencies] PySequence_Fast", gilState);
+        }
+        if (static_cast<std::size_t>(PySequence_Size(refs)) != nDependencies) {
+            Py_DECREF(refs);
+            PyGILState_Release(gilState);
+            throw std::logic_error("Wrong number of dependencies requested for valueReference " + std::to_string(dependent));
+        }
+
+        // Each item is an (elementIndexOfDependent, independent, elementIndexOfIndependent, dependencyKind) tuple
+        for (std::size_t i = 0; i < nDependencies; i++) {
+            PyObject* item = PySequence_Fast(fastItem(refs, i), "a dependency must be a sequence");
+            if (item == nullptr || PySequence_Size(item) != 4) {
+                if (item != nullptr) {
+                    PyErr_Format(PyExc_ValueError, "Expected 4 values for a dependency, got %zd", PySequence_Size(item));
+                    Py_DECREF(item);
+                }
+                Py_DECREF(refs);
+                handle_py_exception("[getVariableDependencies] PySequence_Fast", gilState);
+            }
+            elementIndicesOfDependent[i] = static_cast<std::size_t>(PyLong_AsSize_t(fastItem(item, 0)));
+            independents[i] = static_cast<cppfmu::FMIValueReference>(PyLong_AsUnsignedLong(fastItem(item, 1)));
+            elementIndicesOfIndependents[i] = static_cast<std::size_t>(PyLong_AsSize_t(fastItem(item, 2)));
+            dependencyKinds[i] = static_cast<cppfmu::FMIDependencyKind>(PyLong_AsLong(fastItem(item, 3)));
+            Py_DECREF(item);
+            if (PyErr_Occurred()) {
+                Py_DECREF(refs);
+                handle_py_exception("[getVariableDependencies] PyLong_As", gilState);
+            }
+        }
+        Py_DECREF(refs);
+        clearLogBuffer();
+    });
+}
+
+void PySlaveInstance::GetOutputDerivatives(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIInt32* order, cppfmu::FMIFloat64* values, std::size_t nValues) const
+{
+    py_safe_run(__func__, [this, &vr, nvr, &order, &values, nValues](PyGILState_STATE gilState) {
+        if (!PyObject_HasAttrString(pInstance_, "get_output_derivatives")) {
+            PyGILState_Release(gilState);
+            SlaveInstance::GetOutputDerivatives(vr, nvr, order, values, nValues);
+        }
+        PyObject* vrs = PyList_New(nvr);
+        PyObject* orders = PyList_New(nvr);
+        for (int i = 0; i < nvr; i++) {
+            PyList_SetItem(vrs, i, Py_BuildValue("i", vr[i]));
+            PyList_SetItem(orders, i, Py_BuildValue("i", order[i]));
+        }
+
+        auto refs = callMethod(pInstance_, "get_output_derivatives", "(OO)", vrs, orders);
+        Py_DECREF(vrs);
+        Py_DECREF(orders);
+        if (refs == nullptr) {
+            handle_py_exception("[getOutputDerivatives] PyObject_CallMethod", gilState);
+        }
+        if (!readFloat64Array(refs, values, nValues)) {
+            Py_DECREF(refs);
+            handle_py_exception("[getOutputDerivatives] readFloat64Array", gilState);
+        }
+        Py_DECREF(refs);
         clearLogBuffer();
     });
 }
 
 void PySlaveInstance::GetFMUstate(fmi3FMUState& state)
 {
-    py_safe_run([this, &state](PyGILState_STATE gilState) {
-        auto f = PyObject_CallMethod(pInstance_, "_get_fmu_state", nullptr);
+    py_safe_run(__func__, [this, &state](PyGILState_STATE gilState) {
+        auto f = callMethod(pInstance_, "_get_fmu_state", nullptr);
         if (f == nullptr) {
             handle_py_exception("[_get_fmu_state] PyObject_CallMethod", gilState);
         }
@@ -733,9 +1549,9 @@ void PySlaveInstance::GetFMUstate(fmi3FMUState& state)
 
 void PySlaveInstance::SetFMUstate(const fmi3FMUState& state)
 {
-    py_safe_run([this, &state](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &state](PyGILState_STATE gilState) {
         auto pyState = reinterpret_cast<PyObject*>(state);
-        auto f = PyObject_CallMethod(pInstance_, "_set_fmu_state", "(O)", pyState);
+        auto f = callMethod(pInstance_, "_set_fmu_state", "(O)", pyState);
         if (f == nullptr) {
             handle_py_exception("[_set_fmu_state] PyObject_CallMethod", gilState);
         }
@@ -745,7 +1561,7 @@ void PySlaveInstance::SetFMUstate(const fmi3FMUState& state)
 
 void PySlaveInstance::FreeFMUstate(fmi3FMUState& state)
 {
-    py_safe_run([this, &state](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &state](PyGILState_STATE gilState) {
         auto f = reinterpret_cast<PyObject*>(state);
         Py_XDECREF(f);
     });
@@ -754,9 +1570,9 @@ void PySlaveInstance::FreeFMUstate(fmi3FMUState& state)
 size_t PySlaveInstance::SerializedFMUstateSize(const fmi3FMUState& state)
 {
     size_t size;
-    py_safe_run([this, &state, &size](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &state, &size](PyGILState_STATE gilState) {
         auto pyState = reinterpret_cast<PyObject*>(state);
-        PyObject* pyStateBytes = PyObject_CallMethod(pClass_, "_fmu_state_to_bytes", "(O)", pyState);
+        PyObject* pyStateBytes = callMethod(pClass_, "_fmu_state_to_bytes", "(O)", pyState);
         if (pyStateBytes == nullptr) {
             handle_py_exception("[SerializedFMUstateSize] PyObject_CallMethod", gilState);
         }
@@ -769,9 +1585,9 @@ size_t PySlaveInstance::SerializedFMUstateSize(const fmi3FMUState& state)
 
 void PySlaveInstance::SerializeFMUstate(const fmi3FMUState& state, fmi3Byte* bytes, size_t size)
 {
-    py_safe_run([this, &state, &bytes, size](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &state, &bytes, size](PyGILState_STATE gilState) {
         auto pyState = reinterpret_cast<PyObject*>(state);
-        PyObject* pyStateBytes = PyObject_CallMethod(pClass_, "_fmu_state_to_bytes", "(O)", pyState);
+        PyObject* pyStateBytes = callMethod(pClass_, "_fmu_state_to_bytes", "(O)", pyState);
         if (pyStateBytes == nullptr) {
             handle_py_exception("[SerializeFMUstate] PyObject_CallMethod", gilState);
         }
@@ -789,13 +1605,13 @@ void PySlaveInstance::SerializeFMUstate(const fmi3FMUState& state, fmi3Byte* byt
 
 void PySlaveInstance::DeSerializeFMUstate(const fmi3Byte bytes[], size_t size, fmi3FMUState& state)
 {
-    py_safe_run([this, &bytes, size, &state](PyGILState_STATE gilState) {
+    py_safe_run(__func__, [this, &bytes, size, &state](PyGILState_STATE gilState) {
         char const * castedBytes = reinterpret_cast<char const*>(bytes);
         PyObject* pyStateBytes = PyBytes_FromStringAndSize(castedBytes, size);
         if (pyStateBytes == nullptr) {
             handle_py_exception("[DeSerializeFMUstate] PyBytes_FromStringAndSize", gilState);
         }
-        PyObject* pyState = PyObject_CallMethod(pClass_, "_fmu_state_from_bytes", "(O)", pyStateBytes);
+        PyObject* pyState = callMethod(pClass_, "_fmu_state_from_bytes", "(O)", pyStateBytes);
         if (pyState == nullptr) {
             handle_py_exception("[DeSerializeFMUstate] PyObject_CallMethod", gilState);
         }
@@ -840,9 +1656,22 @@ void PySlaveInstance::handle_py_exception(const std::string& what, PyGILState_ST
     }
 }
 
+void PySlaveInstance::reportProfile() const
+{
+    auto& logger = const_cast<cppfmu::Logger&>(logger_);
+    if (profiler_->logReport()) {
+        logger.Log(cppfmu::FMIOK, "logAll", profiler_->toJson(instanceName_).c_str());
+    } else if (!profiler_->writeReport(instanceName_)) {
+        logger.Log(cppfmu::FMIWarning, "logStatusWarning", "Unable to write the profiling report");
+    }
+}
+
 PySlaveInstance::~PySlaveInstance()
 {
-    py_safe_run([this](PyGILState_STATE gilState) {
+    if (profiler_) {
+        reportProfile();
+    }
+    py_safe_run("FreeInstance", [this](PyGILState_STATE gilState) {
         cleanPyObject();
     });
 }
@@ -862,6 +1691,8 @@ std::unique_ptr<cppfmu::SlaveInstance> CppfmuInstantiateSlave(
     cppfmu::FMIFloat64,
     cppfmu::FMIBoolean visible,
     cppfmu::FMIBoolean,
+    cppfmu::FMIBoolean eventModeUsed,
+    cppfmu::FMIBoolean earlyReturnAllowed,
     const cppfmu::Logger& logger)
 {
 
@@ -885,7 +1716,7 @@ std::unique_ptr<cppfmu::SlaveInstance> CppfmuInstantiateSlave(
 
         ensurePyStateAlive();
         return std::make_unique<pythonfmu::PySlaveInstance>(
-            instanceName, resources, logger, visible, pyState);
+            instanceName, resources, logger, visible, eventModeUsed, earlyReturnAllowed, pyState);
     }
 }
 
@@ -4,9 +4,13 @@
 
 #include "cppfmu/cppfmu_cs.hpp"
 #include "pythonfmu/IPyState.hpp"
+#include "pythonfmu/PyProfiler.hpp"
 
 #include <Python.h>
+#include <functional>
+#include <memory>
 #include <string>
+#include <unordered_map>
 #include <vector>
 
 namespace pythonfmu
@@ -16,7 +20,7 @@ class PySlaveInstance : public cppfmu::SlaveInstance
 {
 
 public:
-    PySlaveInstance(std::string instanceName, std::string resources, const cppfmu::Logger& logger, bool visible, std::shared_ptr<IPyState> pyState);
+    PySlaveInstance(std::string instanceName, std::string resources, const cppfmu::Logger& logger, bool visible, bool eventModeUsed, bool earlyReturnAllowed, std::shared_ptr<IPyState> pyState);
 
     void initialize(PyGILState_STATE gilState);
 
@@ -25,6 +29,10 @@ public:
     void ExitInitializationMode() override;
     void Terminate() override;
     void Reset() override;
+    void EnterConfigurationMode() override;
+    void ExitConfigurationMode() override;
+    void EnterEventMode() override;
+    void EnterStepMode() override;
     cppfmu::FMIStatus DoStep(cppfmu::FMIFloat64 currentCommunicationPoint,
         cppfmu::FMIFloat64 communicationStepSize,
         cppfmu::FMIBoolean newStep,
@@ -39,6 +47,13 @@ public:
     void SetUInt64(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIUInt64* value, std::size_t nValues) override;
     void SetBoolean(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIBoolean* value, std::size_t nValues) override;
     void SetString(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIString const* value, std::size_t nValues) override;
+    void SetFloat32(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIFloat32* value, std::size_t nValues) override;
+    void SetInt8(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIInt8* value, std::size_t nValues) override;
+    void SetInt16(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIInt16* value, std::size_t nValues) override;
+    void SetUInt8(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIUInt8* value, std::size_t nValues) override;
+    void SetUInt16(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIUInt16* value, std::size_t nValues) override;
+    void SetUInt32(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIUInt32* value, std::size_t nValues) override;
+    void SetBinary(const cppfmu::FMIValueReference* vr, std::size_t nvr, const std::size_t* valueSizes, cppfmu::FMIBinary const* value, std::size_t nValues) override;
 
     void GetFloat64(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIFloat64* value, std::size_t nValues) const override;
     void GetInt32(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIInt32* value, std::size_t nValues) const override;
@@ -46,6 +61,25 @@ public:
     void GetUInt64(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIUInt64* value, std::size_t nValues) const override;
     void GetBoolean(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIBoolean* value, std::size_t nValues) const override;
     void GetString(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIString* value, std::size_t nValues) const override;
+    void GetFloat32(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIFloat32* value, std::size_t nValues) const override;
+    void GetInt8(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIInt8* value, std::size_t nValues) const override;
+    void GetInt16(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIInt16* value, std::size_t nValues) const override;
+    void GetUInt8(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIUInt8* value, std::size_t nValues) const override;
+    void GetUInt16(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIUInt16* value, std::size_t nValues) const override;
+    void GetUInt32(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIUInt32* value, std::size_t nValues) const override;
+    void GetBinary(const cppfmu::FMIValueReference* vr, std::size_t nvr, std::size_t* valueSizes, cppfmu::FMIBinary* value, std::size_t nValues) const override;
+
+    void GetClock(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIClock* value) const override;
+    void SetClock(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIClock* value) override;
+    void GetIntervalDecimal(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIFloat64* interval, cppfmu::FMIIntervalQualifier* qualifier) const override;
+    void SetIntervalDecimal(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIFloat64* interval) override;
+    void GetShiftDecimal(const cppfmu::FMIValueReference* vr, std::size_t nvr, cppfmu::FMIFloat64* shift) const override;
+    void SetShiftDecimal(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIFloat64* shift) override;
+    void ActivateModelPartition(cppfmu::FMIValueReference clockReference, cppfmu::FMIFloat64 activationTime) override;
+
+    void GetNumberOfVariableDependencies(cppfmu::FMIValueReference vr, std::size_t& nDependencies) const override;
+    void GetVariableDependencies(cppfmu::FMIValueReference dependent, std::size_t* elementIndicesOfDependent, cppfmu::FMIValueReference* independents, std::size_t* elementIndicesOfIndependents, cppfmu::FMIDependencyKind* dependencyKinds, std::size_t nDependencies) const override;
+    void GetOutputDerivatives(const cppfmu::FMIValueReference* vr, std::size_t nvr, const cppfmu::FMIInt32* order, cppfmu::FMIFloat64* values, std::size_t nValues) const override;
 
     void GetFMUstate(fmi3FMUState& State) override;
     void SetFMUstate(const fmi3FMUState& State) override;
@@ -82,24 +116,57 @@ private:
     PyObject* pClass_;
     PyObject* pInstance_{};
     PyObject* pMessages_{};
+    // Cached values of the computed outputs, see Fmi3SlaveBase.register_variable
+    PyObject* pComputed_{};
 
     const bool visible_;
+    const bool eventModeUsed_;
+    const bool earlyReturnAllowed_;
     const std::string instanceName_;
     const std::string resources_;
     const cppfmu::Logger& logger_;
 
-    mutable std::vector<PyObject*> strBuffer;
+    // UTF-8 encoding of the last string read per value reference, reused while the model returns the
+    // same str object: (str, bytes) pairs holding a reference to both
+    mutable std::unordered_map<cppfmu::FMIValueReference, std::pair<PyObject*, PyObject*>> strCache_;
+    mutable std::vector<PyObject*> binBuffer;
     mutable std::vector<PyObject*> logStrBuffer;
 
+    // Model partition callables indexed by the value reference of their clock
+    mutable std::unordered_map<cppfmu::FMIValueReference, PyObject*> partitions_;
+
+    // Only set when profiling is enabled, see PyProfiler
+    std::unique_ptr<PyProfiler> profiler_;
+
     void handle_py_exception(const std::string& what, PyGILState_STATE gilState) const;
 
-    inline void clearStrBuffer() const
+    void py_safe_run(const char* function, const std::function<void(PyGILState_STATE gilState)>& f) const;
+
+    void reportProfile() const;
+
+    template<typename... Args>
+    PyObject* callMethod(PyObject* o, const char* name, const char* format, Args... args) const
+    {
+        PyProfiler::Scope python(profiler_.get(), PyProfiler::Phase::Python);
+        return PyObject_CallMethod(o, name, format, args...);
+    }
+
+    inline void clearStrCache() const
     {
-        if (!strBuffer.empty()) {
-            for (auto obj : strBuffer) {
+        for (auto& entry : strCache_) {
+            Py_XDECREF(entry.second.first);
+            Py_XDECREF(entry.second.second);
+        }
+        strCache_.clear();
+    }
+
+    inline void clearBinBuffer() const
+    {
+        if (!binBuffer.empty()) {
+            for (auto obj : binBuffer) {
                 Py_DECREF(obj);
             }
-            strBuffer.clear();
+            binBuffer.clear();
         }
     }
 
@@ -113,14 +180,33 @@ private:
         }
     }
 
+    inline void clearPartitions() const
+    {
+        for (auto& partition : partitions_) {
+            Py_DECREF(partition.second);
+        }
+        partitions_.clear();
+    }
+
+    // The computed outputs are recomputed when first read after a call advancing the model
+    inline void clearComputed() const
+    {
+        if (pComputed_ != nullptr) {
+            PyDict_Clear(pComputed_);
+        }
+    }
+
     inline void cleanPyObject() const
     {
+        clearPartitions();
         clearLogBuffer();
         clearLogStrBuffer();
-        clearStrBuffer();
+        clearStrCache();
+        clearBinBuffer();
         Py_XDECREF(pClass_);
         Py_XDECREF(pInstance_);
         Py_XDECREF(pMessages_);
+        Py_XDECREF(pComputed_);
     }
 };
 
@@ -0,0 +1,11 @@
+from abc import ABC
+
+# scheduled execution mixin
+class ScheduledExecution(ABC):
+    """
+    Classes derived from ScheduledExecution are executed by the importer one model partition at a time.
+
+    A model partition is a callable taking the activation time, registered for an input `Clock`
+    with `register_partition`. Only the partition of the activated clock is run.
+    """
+    pass
@@ -0,0 +1,292 @@
+"""CLI command to simulate a Python FMU script without building it."""
+import argparse
+import csv
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .builder import instantiate_slave
+from .cosimulation import CoSimulation
+from .default_experiment import DefaultExperiment
+from .enums import Fmi3Causality, Fmi3Status
+from .fmi3slave import Fmi3SlaveBase
+from .integrator import MAX_EVENTS_PER_STEP
+from .modelexchange import ModelExchange, Fmi3UpdateDiscreteStatesResult
+from .variables import ModelVariable, flatten
+
+FilePath = Union[str, Path]
+
+FMI_TYPES = ("CoSimulation", "ModelExchange")
+
+# Default number of communication steps if neither the caller nor the model defines the step size
+DEFAULT_STEPS = 500
+
+
+class Recorder:
+    """Record model variables as columns.
+
+    Args:
+        variables (Iterable[ModelVariable]): Variables to record; arrays are recorded element-wise
+        instance (Fmi3SlaveBase): Optional, model instance holding the values of class level variables
+    """
+
+    def __init__(self, variables: Iterable[ModelVariable], instance: Optional[Fmi3SlaveBase] = None):
+        self.variables = list(variables)
+        self.instance = instance
+        self.columns: Dict[str, List[Any]] = {"time": []}
+        self._names: Optional[List[str]] = None
+
+    def _values(self, var: ModelVariable) -> List[Any]:
+        value = self.instance._get_value(var) if self.instance is not None else var.getter()
+        if len(getattr(var, "dimensions", [])) > 0:
+            return value.tolist() if hasattr(value, "tolist") else list(flatten(value))
+        return [value]
+
+    def sample(self, time: float):
+        values = [self._values(var) for var in self.variables]
+        if self._names is None:
+            self._names = []
+            for var, value in zip(self.variables, values):
+                if len(getattr(var, "dimensions", [])) > 0:
+                    self._names.extend(f"{var.name}[{i}]" for i in range(len(value)))
+                else:
+                    self._names.append(var.name)
+            self.columns.update((name, []) for name in self._names)
+
+        self.columns["time"].append(time)
+        for name, value in zip(self._names, (v for value in values for v in value)):
+            self.columns[name].append(value)
+
+    def to_csv(self, filename: FilePath):
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns.keys())
+            writer.writerows(zip(*self.columns.values()))
+
+
+def _step_result(result: Any) -> Tuple[Fmi3Status, bool]:
+    # Mirror the interpretation of the do_step return value made by the FMI wrapper
+    if hasattr(result, "status"):
+        status = Fmi3Status(result.status)
+    else:
+        status = Fmi3Status.ok if result else Fmi3Status.discard
+    return status, bool(getattr(result, "terminateSimulation", False))
+
+
+def _update_discrete_states(instance: ModelExchange) -> Fmi3UpdateDiscreteStatesResult:
+    # Event iteration: repeat until the discrete states have converged
+    while True:
+        result = instance.update_discrete_states()
+        instance._get_computed_values().clear()
+        if result.terminateSimulation or not result.discreteStateNeedsUpdate:
+            return result
+
+
+def _next_event(result: Fmi3UpdateDiscreteStatesResult, time: float, eps: float) -> Optional[float]:
+    # A next event time that does not lie ahead would stall the integration, it is ignored
+    if result.nextEventTimeDefined and result.nextEventTime > time + eps:
+        return result.nextEventTime
+    return None
+
+
+def _simulate_cs(instance: CoSimulation, recorder: Recorder, start_time: float, stop_time: float, step_size: float):
+    n_steps = max(1, int(round((stop_time - start_time) / step_size)))
+    time = start_time
+    recorder.sample(time)
+    for step in range(n_steps):
+        status, terminate = _step_result(instance.do_step(time, step_size))
+        # Like the FMI wrapper, the computed outputs are recomputed after the calls advancing the model
+        instance._get_computed_values().clear()
+        if status >= Fmi3Status.discard:
+            raise RuntimeError(f"do_step at t={time} returned status {status.name}")
+        time = start_time + (step + 1) * step_size
+        recorder.sample(time)
+        if terminate:
+            break
+
+
+def _simulate_me(instance: ModelExchange, recorder: Recorder, start_time: float, stop_time: float, step_size: float):
+    """Integrate the model with the forward Euler method, locating events on the integration grid."""
+    instance.set_time(start_time)
+    result = _update_discrete_states(instance)
+    eps = 1e-12 * max(1.0, abs(stop_time))
+    next_event = _next_event(result, start_time, eps)
+
+    time = start_time
+    states = list(instance.get_continuous_states())
+    indicators = list(instance.get_event_indicators())
+    recorder.sample(time)
+
+    step = 0
+    events = 0
+    while not result.terminateSimulation and time < stop_time - eps:
+        grid_time = min(start_time + (step + 1) * step_size, stop_time)
+        time_event = next_event is not None and next_event <= grid_time + eps
+        next_time = next_event if time_event else grid_time
+
+        derivatives = instance.get_continuous_state_derivatives()
+        states = [x + (next_time - time) * dx for x, dx in zip(states, derivatives)]
+        time = next_time
+        instance.set_time(time)
+        instance.set_continuous_states(states)
+
+        new_indicators = list(instance.get_event_indicators())
+        state_event = any((z > 0) != (new_z > 0) for z, new_z in zip(indicators, new_indicators))
+        if time_event or state_event:
+            events += 1
+            if events > MAX_EVENTS_PER_STEP:
+                raise RuntimeError(f"More than {MAX_EVENTS_PER_STEP} events within the step ending at t={grid_time}")
+            result = _update_discrete_states(instance)
+            next_event = _next_event(result, time, eps)
+            if result.valuesOfContinuousStatesChanged:
+                states = list(instance.get_continuous_states())
+            new_indicators = list(instance.get_event_indicators())
+        indicators = new_indicators
+
+        if time >= grid_time - eps:
+            step += 1
+            events = 0
+        recorder.sample(time)
+
+
+def simulate(
+    script_file: FilePath,
+    start_time: Optional[float] = None,
+    stop_time: Optional[float] = None,
+    step_size: Optional[float] = None,
+    fmi_type: Optional[str] = None,
+    variables: Optional[Iterable[str]] = None,
+    output: Optional[FilePath] = None
+) -> Dict[str, List[Any]]:
+    """Simulate the model defined in a Python script in-process, without building nor importing an FMU.
+
+    Co-simulation models are stepped with `do_step` at fixed communication steps. Model exchange models
+    are integrated with the forward Euler method; state and time events are handled at the end of
+    the integration step in which they occur.
+
+    Args:
+        script_file (str or pathlib.Path) : Path to the Python script
+        start_time (float) : optional, start time (default from the model default experiment or 0)
+        stop_time (float) : optional, stop time (default from the model default experiment or start time + 1)
+        step_size (float) : optional, communication or integration step (default from the model default experiment)
+        fmi_type (str) : optional, `CoSimulation` or `ModelExchange` (default CoSimulation if supported)
+        variables (Iterable[str]) : optional, names of the variables to record (default the outputs)
+        output (str or pathlib.Path) : optional, CSV file to write the results to
+
+    Returns:
+        Dict[str, List[Any]] : recorded values indexed by column name, starting with `time`
+    """
+    script_file = Path(script_file)
+    if not script_file.exists():
+        raise ValueError(f"No such file {script_file!s}")
+
+    instance = instantiate_slave(script_file, script_file.stem, instance_name=script_file.stem)
+
+    experiment = instance.default_experiment or DefaultExperiment()
+    if start_time is None:
+        start_time = experiment.start_time or 0.0
+    if stop_time is None:
+        stop_time = experiment.stop_time if experiment.stop_time is not None else start_time + 1.0
+    if step_size is None:
+        step_size = experiment.step_size or (stop_time - start_time) / DEFAULT_STEPS
+    if step_size <= 0.0 or stop_time < start_time:
+        raise ValueError(f"Invalid experiment: start={start_time}, stop={stop_time}, step={step_size}")
+
+    if fmi_type is None:
+        fmi_type = "CoSimulation" if isinstance(instance, CoSimulation) else "ModelExchange"
+    interface = {"CoSimulation": CoSimulation, "ModelExchange": ModelExchange}.get(fmi_type)
+    if interface is None:
+        raise ValueError(f"Unknown FMI type {fmi_type}, expected one of {FMI_TYPES}")
+    if not isinstance(instance, interface):
+        raise ValueError(f"Model {instance.modelName} does not implement the {fmi_type} interface")
+
+    if variables is None:
+        recorded = [v for v in instance.vars.values() if v.causality == Fmi3Causality.output]
+    else:
+        vars_by_name = dict([(v.name, v) for v in instance.vars.values()])
+        unknown = [name for name in variables if name not in vars_by_name]
+        if unknown:
+            raise ValueError(f"Unknown variables {unknown} in model {instance.modelName}")
+        recorded = [vars_by_name[name] for name in variables]
+    recorder = Recorder(recorded, instance)
+
+    instance.setup_experiment(start_time)
+    instance.enter_initialization_mode()
+    instance.exit_initialization_mode()
+    instance._get_computed_values().clear()
+
+    if fmi_type == "CoSimulation":
+        _simulate_cs(instance, recorder, start_time, stop_time, step_size)
+    else:
+        _simulate_me(instance, recorder, start_time, stop_time, step_size)
+
+    instance.terminate()
+
+    if output is not None:
+        recorder.to_csv(output)
+    return recorder.columns
+
+
+def simulate_command(output: Optional[FilePath] = None, **kwargs):
+    if output is None:
+        output = f"{Path(kwargs['script_file']).stem}_out.csv"
+    simulate(output=output, **kwargs)
+
+
+def create_command_parser(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "-f",
+        "--file",
+        dest="script_file",
+        help="Path to the Python script.",
+        required=True
+    )
+
+    parser.add_argument(
+        "--start-time",
+        dest="start_time",
+        type=float,
+        help="Simulation start time.",
+        default=None
+    )
+
+    parser.add_argument(
+        "--stop-time",
+        dest="stop_time",
+        type=float,
+        help="Simulation stop time.",
+        default=None
+    )
+
+    parser.add_argument(
+        "--step-size",
+        dest="step_size",
+        type=float,
+        help="Communication step size (co-simulation) or integration step size (model exchange).",
+        default=None
+    )
+
+    parser.add_argument(
+        "--fmi-type",
+        dest="fmi_type",
+        choices=FMI_TYPES,
+        help="FMI interface to simulate.",
+        default=None
+    )
+
+    parser.add_argument(
+        "--variables",
+        dest="variables",
+        nargs="+",
+        help="Variables to record (default the outputs).",
+        default=None
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        help="CSV file to write the results to (default <script name>_out.csv).",
+        default=None
+    )
+
+    parser.set_defaults(execute=simulate_command)
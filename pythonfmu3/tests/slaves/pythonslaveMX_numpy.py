@@ -0,0 +1,36 @@
+from pythonfmu3 import Fmi3Causality, ModelExchange, Fmi3Variability, Fmi3SlaveBase, Float64, Fmi3Initial
+
+import numpy as np
+
+
+class Oscillator(Fmi3SlaveBase, ModelExchange):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.description = "Harmonic oscillator returning NumPy arrays from the model exchange hooks"
+
+        self.time = 0.0
+        self.x = 1.0
+        self.v = 0.0
+        self.derx = 0.0
+        self.derv = 0.0
+
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("x", causality=Fmi3Causality.output, start=1, variability=Fmi3Variability.continuous, initial=Fmi3Initial.exact), has_event_indicator=True)
+        self.register_variable(Float64("derx", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=1))
+        self.register_variable(Float64("v", causality=Fmi3Causality.output, start=0, variability=Fmi3Variability.continuous, initial=Fmi3Initial.exact), has_event_indicator=True)
+        self.register_variable(Float64("derv", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=3))
+
+    def get_continuous_state_derivatives(self):
+        self.derx = self.v
+        self.derv = -self.x
+        return np.array([self.derx, self.derv])
+
+    def get_event_indicators(self):
+        # Non-contiguous float64 view
+        return np.array([[self.x, 0.0], [self.v + 0.5, 0.0]])[:, 0]
+
+    def get_nominals_of_continuous_states(self, size):
+        # Not float64, read through the sequence protocol
+        return np.full(size, 2.0, dtype=np.float32)
@@ -0,0 +1,35 @@
+from pythonfmu3 import Fmi3Causality, Fmi3DependencyKind, Fmi3Initial, Fmi3SlaveBase, Fmi3Variability, Float64, ModelExchange
+
+
+class Chain(Fmi3SlaveBase, ModelExchange):
+    """Chain of first order lags, declaring the sparsity of its Jacobian."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.time = 0.0
+        self.u = 1.0
+        self.x0 = 1.0
+        self.x1 = 0.0
+        self.derx0 = 0.0
+        self.derx1 = 0.0
+        self.y = 0.0
+
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        u = Float64("u", causality=Fmi3Causality.input, start=1, variability=Fmi3Variability.continuous)
+        x0 = Float64("x0", causality=Fmi3Causality.local, start=1, variability=Fmi3Variability.continuous, initial=Fmi3Initial.exact)
+        x1 = Float64("x1", causality=Fmi3Causality.local, start=0, variability=Fmi3Variability.continuous, initial=Fmi3Initial.exact)
+        for var in (u, x0, x1):
+            self.register_variable(var)
+        self.register_variable(Float64("derx0", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous,
+                                       derivative=x0.value_reference, dependencies=[x0, u]))
+        self.register_variable(Float64("derx1", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous,
+                                       derivative=x1.value_reference, dependencies=[x0, x1]))
+        self.register_variable(Float64("y", causality=Fmi3Causality.output, variability=Fmi3Variability.continuous,
+                                       dependencies=[x1], dependencies_kind=[Fmi3DependencyKind.constant]))
+
+    def get_continuous_state_derivatives(self):
+        self.derx0 = self.u - self.x0
+        self.derx1 = self.x0 - self.x1
+        self.y = 2 * self.x1
+        return [self.derx0, self.derx1]
@@ -0,0 +1,25 @@
+from pythonfmu3.fmi3slave import Fmi3Slave, Fmi3Causality, Fmi3Variability, Binary, Float64
+
+import numpy as np
+
+
+class PythonSlaveBinary(Fmi3Slave):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.time = 0.0
+        self.bytesIn = b""
+        self.bytesOut = b"\x00\x01\x02"
+        self.bufferOut = bytearray(b"buffer")
+        self.arrayOut = np.arange(4, dtype=np.uint8)
+
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Binary("bytesIn", causality=Fmi3Causality.input, variability=Fmi3Variability.discrete))
+        self.register_variable(Binary("bytesOut", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete))
+        self.register_variable(Binary("bufferOut", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete))
+        self.register_variable(Binary("arrayOut", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete))
+
+    def do_step(self, current_time, step_size):
+        self.bytesOut = bytes(reversed(self.bytesIn))
+        return True
@@ -0,0 +1,34 @@
+from pythonfmu3 import Clock, Fmi3Causality, Fmi3IntervalVariability, Fmi3SlaveBase, Fmi3Variability, Float64, Int32, ScheduledExecution
+
+
+class PythonSlaveClocked(Fmi3SlaveBase, ScheduledExecution):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.time = 0.0
+        self.fast = False
+        self.slow = False
+        self.fastTicks = 0
+        self.slowTicks = 0
+        self.lastActivation = 0.0
+
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        fast = Clock("fast", causality=Fmi3Causality.input, interval=0.01, priority=0)
+        slow = Clock("slow", causality=Fmi3Causality.input, interval_variability=Fmi3IntervalVariability.tunable, interval=0.1, priority=1)
+        self.register_variable(fast)
+        self.register_variable(slow)
+        self.register_variable(Int32("fastTicks", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete, clocks=[fast]))
+        self.register_variable(Int32("slowTicks", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete, clocks=[slow]))
+        self.register_variable(Float64("lastActivation", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete))
+
+        self.register_partition(fast, self.fast_partition)
+        self.register_partition(slow, self.slow_partition)
+
+    def fast_partition(self, activation_time):
+        self.fastTicks += 1
+        self.lastActivation = activation_time
+
+    def slow_partition(self, activation_time):
+        self.slowTicks += 1
+        self.lastActivation = activation_time
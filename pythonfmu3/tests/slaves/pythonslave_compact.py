@@ -0,0 +1,43 @@
+from pythonfmu3 import Dimension, Fmi3Causality, Fmi3Slave, Fmi3Variability, Float32, Float64, Int8, Int16, UInt8, UInt16, UInt32
+
+import numpy as np
+
+SIZE = 4
+
+TYPES = {
+    Float32: np.float32,
+    Int8: np.int8,
+    Int16: np.int16,
+    UInt8: np.uint8,
+    UInt16: np.uint16,
+    UInt32: np.uint32,
+}
+
+
+class PythonSlaveCompact(Fmi3Slave):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.time = 0.0
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+
+        for var_type, dtype in TYPES.items():
+            name = var_type.__name__.lower()
+            variability = Fmi3Variability.continuous if var_type is Float32 else Fmi3Variability.discrete
+            setattr(self, f"{name}_in", dtype(0))
+            setattr(self, f"{name}_out", dtype(0))
+            setattr(self, f"{name}_array_in", np.zeros(SIZE, dtype=dtype))
+            setattr(self, f"{name}_array_out", np.zeros(SIZE, dtype=dtype))
+            self.register_variable(var_type(f"{name}_in", causality=Fmi3Causality.input, variability=variability, start=0))
+            self.register_variable(var_type(f"{name}_out", causality=Fmi3Causality.output, variability=variability))
+            self.register_variable(var_type(f"{name}_array_in", causality=Fmi3Causality.input, variability=variability, dimensions=[Dimension(start=str(SIZE))]))
+            self.register_variable(var_type(f"{name}_array_out", causality=Fmi3Causality.output, variability=variability, dimensions=[Dimension(start=str(SIZE))]))
+
+    def do_step(self, current_time, step_size):
+        for var_type in TYPES:
+            name = var_type.__name__.lower()
+            setattr(self, f"{name}_out", getattr(self, f"{name}_in"))
+            # The arrays keep their dtype through the setters
+            setattr(self, f"{name}_array_out", getattr(self, f"{name}_array_in")[::-1].copy())
+        return True
@@ -0,0 +1,45 @@
+from pythonfmu3 import Fmi3Causality, Fmi3Slave, Fmi3StepResult, Fmi3UpdateDiscreteStatesResult, Fmi3Variability, Float64, Int32
+
+
+class PythonSlaveEvents(Fmi3Slave):
+    """Count the ticks of an internal periodic event."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.time = 0.0
+        self.period = 0.25
+        self.ticks = 0
+        self.next_event = self.period
+
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("period", causality=Fmi3Causality.parameter, variability=Fmi3Variability.fixed))
+        self.register_variable(Int32("ticks", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete))
+
+    def _tick(self):
+        self.ticks += 1
+        self.next_event += self.period
+
+    def do_step(self, current_time, step_size):
+        end = current_time + step_size
+        eps = 1e-9 * max(1.0, abs(end))
+        if self.early_return_allowed and self.next_event < end - eps:
+            # Stop at the event instead of stepping over it
+            self.time = self.next_event
+            if not self.event_mode_used:
+                self._tick()
+            return Fmi3StepResult(eventHandlingNeeded=self.event_mode_used, earlyReturn=True, lastSuccessfulTime=self.time)
+
+        self.time = end
+        event = False
+        while self.next_event <= end + eps:
+            if self.event_mode_used:
+                event = True
+                break
+            self._tick()
+        return Fmi3StepResult(eventHandlingNeeded=event)
+
+    def update_discrete_states(self):
+        if self.next_event <= self.time + 1e-9 * max(1.0, abs(self.time)):
+            self._tick()
+        return Fmi3UpdateDiscreteStatesResult()
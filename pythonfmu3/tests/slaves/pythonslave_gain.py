@@ -0,0 +1,26 @@
+from pythonfmu3 import Fmi3Causality, Fmi3Slave, Fmi3StepResult, Fmi3Variability, Float64, Int32
+
+
+class PythonSlaveGain(Fmi3Slave):
+    """Output the input plus one, counting the steps."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.u = 0.0
+        self.y = 0.0
+        self.steps = 0
+        self.stop_after = 0
+
+        self.register_variable(Float64("u", causality=Fmi3Causality.input, variability=Fmi3Variability.discrete, start=0.0))
+        self.register_variable(Float64("y", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete))
+        self.register_variable(Int32("steps", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete))
+        self.register_variable(Int32("stop_after", causality=Fmi3Causality.parameter, variability=Fmi3Variability.fixed, start=0))
+
+    def exit_initialization_mode(self):
+        self.y = self.u + 1.0
+
+    def do_step(self, current_time, step_size):
+        self.y = self.u + 1.0
+        self.steps += 1
+        return Fmi3StepResult(terminateSimulation=self.steps == self.stop_after)
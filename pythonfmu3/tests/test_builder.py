@@ -193,3 +193,28 @@ def test_terminals(tmp_path):
         names = files.namelist()
 
         assert "terminalsAndIcons/terminalsAndIcons.xml" in names
+
+
+def test_bundle_python(tmp_path):
+    script_file = Path(__file__).parent / "slaves/slavewithdep.py"
+    local_file = Path(__file__).parent / "slaves/localmodule.py"
+    data_file = Path(__file__).parent / "data/hello.txt"
+    fmu = FmuBuilder.build_FMU(
+        script_file, dest=tmp_path, project_files=[local_file, data_file], bundle_python=True
+    )
+
+    with zipfile.ZipFile(fmu) as files:
+        names = files.namelist()
+
+        assert "resources/python.zip" in names
+        assert "resources/hello.txt" in names
+        assert not any(name.startswith("resources/") and name.endswith(".py") for name in names)
+
+        with files.open("resources/slavemodule.txt") as myfile:
+            assert myfile.read().decode().splitlines() == ["slavewithdep", "PythonSlaveWithDep"]
+
+        with zipfile.ZipFile(files.open("resources/python.zip")) as bundle:
+            bundled = bundle.namelist()
+            assert "slavewithdep.py" in bundled
+            assert "localmodule.py" in bundled
+            assert "pythonfmu3/fmi3slave.py" in bundled
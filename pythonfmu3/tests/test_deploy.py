@@ -2,13 +2,24 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
+import zipfile
+
 import pytest
 
+from pythonfmu3 import deploy as deploy_module
 from pythonfmu3.builder import FmuBuilder
 from pythonfmu3.deploy import deploy
 
 PYTHON_SLAVE = Path(__file__).parent / "slaves/pythonslave.py"
 
+
+@pytest.fixture(autouse=True)
+def deploy_cache(tmp_path, monkeypatch):
+    cache = tmp_path / "deploy_cache"
+    monkeypatch.setattr(deploy_module, "DEPLOY_CACHE", cache)
+    return cache
+
+
 @pytest.mark.parametrize("test_manager", [None, "pip", "conda"])
 @pytest.mark.parametrize(
     "requirements, test_requirements, expected", [
@@ -46,3 +57,101 @@ scipy
 
             run.assert_called_once()
             assert (test_manager or expected) in " ".join(run.call_args[0][0])
+
+
+def fake_pip_wheel(cmd, **kwargs):
+    wheel_dir = Path(cmd[cmd.index("--wheel-dir") + 1])
+    wheel_dir.mkdir(parents=True, exist_ok=True)
+    (wheel_dir / "dummy-1.0-py3-none-any.whl").write_text("dummy wheel")
+
+
+def test_build_vendor_dependencies(tmp_path):
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("dummy==1.0\n")
+
+    with patch("subprocess.run", side_effect=fake_pip_wheel) as run:
+        fmu = FmuBuilder.build_FMU(
+            PYTHON_SLAVE, dest=tmp_path, project_files=[requirements_file], vendor_dependencies=True
+        )
+        run.assert_called_once()
+        assert "wheel" in run.call_args[0][0]
+
+    with zipfile.ZipFile(fmu) as files:
+        assert "resources/wheels/dummy-1.0-py3-none-any.whl" in files.namelist()
+
+
+def test_build_vendor_dependencies_without_requirements(tmp_path):
+    with patch("subprocess.run") as run:
+        with pytest.raises(ValueError):
+            FmuBuilder.build_FMU(PYTHON_SLAVE, dest=tmp_path, vendor_dependencies=True)
+        run.assert_not_called()
+
+
+def test_deploy_offline_and_cached(tmp_path):
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("dummy==1.0\n")
+
+    with patch("subprocess.run", side_effect=fake_pip_wheel):
+        fmu = FmuBuilder.build_FMU(
+            PYTHON_SLAVE, dest=tmp_path, project_files=[requirements_file], vendor_dependencies=True
+        )
+
+    with patch("subprocess.run") as run:
+        deploy(fmu)
+        run.assert_called_once()
+        cmd = run.call_args[0][0]
+        assert "--no-index" in cmd
+        wheel_dir = Path(cmd[cmd.index("--find-links") + 1])
+        assert wheel_dir.name == "wheels"
+
+        # Same requirement set is already deployed and installed
+        with patch("pythonfmu3.deploy.metadata.version", return_value="1.0"):
+            deploy(fmu)
+        run.assert_called_once()
+
+        deploy(fmu, force=True)
+        assert run.call_count == 2
+
+
+def test_deploy_cached_but_not_installed(tmp_path):
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("dummy==1.0\n")
+    fmu = FmuBuilder.build_FMU(PYTHON_SLAVE, dest=tmp_path, project_files=[requirements_file])
+
+    with patch("subprocess.run") as run:
+        deploy(fmu)
+        # Uninstalled, or replaced by another version, since the last deployment
+        deploy(fmu)
+        with patch("pythonfmu3.deploy.metadata.version", return_value="2.0"):
+            deploy(fmu)
+        assert run.call_count == 3
+
+        with patch("pythonfmu3.deploy.metadata.version", return_value="1.0"):
+            deploy(fmu)
+        assert run.call_count == 3
+
+
+def test_deploy_cache_not_writable(tmp_path, deploy_cache, caplog):
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("dummy==1.0\n")
+    fmu = FmuBuilder.build_FMU(PYTHON_SLAVE, dest=tmp_path, project_files=[requirements_file])
+
+    # The cache folder cannot be created over a file
+    deploy_cache.parent.mkdir(parents=True, exist_ok=True)
+    deploy_cache.write_text("")
+    with patch("subprocess.run") as run:
+        deploy(fmu)
+        run.assert_called_once()
+    assert "Unable to record the deployment" in caplog.text
+
+
+def test_deploy_cache_failure(tmp_path, deploy_cache):
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("dummy==1.0\n")
+    fmu = FmuBuilder.build_FMU(PYTHON_SLAVE, dest=tmp_path, project_files=[requirements_file])
+
+    with patch("subprocess.run", side_effect=RuntimeError("pip failed")):
+        with pytest.raises(RuntimeError):
+            deploy(fmu)
+
+    assert not deploy_cache.exists() or not any(deploy_cache.iterdir())
@@ -1,7 +1,12 @@
+from pathlib import Path
+
 import pytest
 
-from pythonfmu3 import Fmi3Slave, ModelExchange
+from pythonfmu3 import Binary, Boolean, Clock, Dimension, Fmi3Causality, Fmi3DependencyKind, Fmi3IntervalQualifier, Fmi3IntervalVariability, Fmi3Slave, Fmi3Variability, ModelExchange
+from pythonfmu3 import Float32, Float64, Int8, Int16, Int32, UInt8, UInt16, UInt32, UInt64
 from pythonfmu3 import __version__ as VERSION
+from pythonfmu3 import skip_if_inputs_unchanged
+from pythonfmu3.builder import instantiate_slave
 
 from .utils import FMI2PY, PY2FMI
 
@@ -47,7 +52,8 @@ def test_Fmi3Slave_generation_tool():
     False, 
     22, 
     2./3., 
-    "hello_world"
+    "hello_world",
+    b"\x00binary\xff",
 ])
 def test_Fmi3Slave_getters(fmi_type, value):
     
@@ -78,6 +84,7 @@ def test_Fmi3Slave_getters(fmi_type, value):
     22, 
     2./3., 
     "hello_world",
+    b"\x00binary\xff",
 ])
 def test_Fmi3Slave_setters(fmi_type, value):
 
@@ -105,6 +112,829 @@ def test_Fmi3Slave_setters(fmi_type, value):
             set_method([0], [value])
 
 
+@pytest.mark.parametrize("var_type,value", [
+    (Float32, 0.5),
+    (Int8, -128),
+    (Int16, -32768),
+    (UInt8, 255),
+    (UInt16, 65535),
+    (UInt32, 4294967295),
+])
+def test_Fmi3Slave_compact_types(var_type, value):
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.var = None
+            self.other = 0
+            self.register_variable(var_type("var"))
+            self.register_variable(Int32("other"))
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    type_name = var_type.__qualname__.lower()
+    getattr(slave, f"set_{type_name}")([0], [value])
+    assert getattr(slave, f"get_{type_name}")([0]) == [value]
+
+    with pytest.raises(TypeError):
+        getattr(slave, f"get_{type_name}")([1])
+    with pytest.raises(TypeError):
+        slave.get_int32([0])
+
+
+@pytest.mark.parametrize("var_type,dtype", [
+    (Float32, "float32"),
+    (Int8, "int8"),
+    (Int16, "int16"),
+    (UInt8, "uint8"),
+    (UInt16, "uint16"),
+    (UInt32, "uint32"),
+    (UInt64, "uint64"),
+])
+def test_Fmi3Slave_array_setter_keeps_dtype(var_type, dtype):
+    np = pytest.importorskip("numpy")
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.var = np.zeros((2, 2), dtype=dtype)
+            self.register_variable(var_type("var", dimensions=[Dimension(start="2"), Dimension(start="2")]))
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    type_name = var_type.__qualname__.lower()
+    getattr(slave, f"set_{type_name}")([0], [1, 2, 3, 4])
+    assert slave.var.dtype == np.dtype(dtype)
+    assert slave.var.shape == (2, 2)
+    assert getattr(slave, f"get_{type_name}")([0]) == [1, 2, 3, 4]
+
+
+class Gains:
+
+    def __init__(self):
+        self.k = 2.0
+
+
+class SchemaSlave(Fmi3Slave):
+
+    model_variables = (
+        Float64("time", causality=Fmi3Causality.independent),
+        Float64("u", causality=Fmi3Causality.input, start=1.0),
+        Float64("y", causality=Fmi3Causality.output),
+        Float64("gains.k", causality=Fmi3Causality.parameter, variability=Fmi3Variability.tunable),
+        Int32("n", causality=Fmi3Causality.structuralParameter, variability=Fmi3Variability.fixed, start=3),
+        Float64("x", causality=Fmi3Causality.output, dimensions=[Dimension(valueReference="4")]),
+    )
+    model_event_indicators = ("y",)
+
+    def __init__(self, **kwargs):
+        import numpy as np
+        super().__init__(**kwargs)
+        self.time = 0.0
+        self.u = 1.0
+        self.y = 0.0
+        self.gains = Gains()
+        self.n = 3
+        self.x = np.zeros(3)
+        self.register_variable(Float64("extra", getter=lambda: self.u * 10))
+
+    def do_step(self, t, dt):
+        self.y = self.gains.k * self.u
+        self.x[:] = self.y
+        return True
+
+
+def test_Fmi3Slave_class_variables():
+    pytest.importorskip("numpy")
+
+    first = SchemaSlave(instance_name="first")
+    second = SchemaSlave(instance_name="second")
+
+    # The variables are shared, the values are per instance
+    assert [v.name for v in first.vars.values()] == ["time", "u", "y", "gains.k", "n", "x", "extra"]
+    assert all(a is b for a, b in zip(list(first.vars.values())[:6], second.vars.values()))
+    assert first.vars[6] is not second.vars[6]
+    assert first.event_indicators == second.event_indicators == [2]
+
+    first.set_float64([1, 3], [4.0, 0.5])
+    first.do_step(0.0, 1.0)
+    second.do_step(0.0, 1.0)
+    assert first.get_float64([2, 3, 5, 6]) == [2.0, 0.5, 2.0, 2.0, 2.0, 40.0]
+    assert second.get_float64([2, 3, 5, 6]) == [2.0, 2.0, 2.0, 2.0, 2.0, 10.0]
+
+    first.set_float64([5], [1.0, 2.0, 3.0])
+    assert first.x.tolist() == [1.0, 2.0, 3.0]
+    assert second.x.tolist() == [2.0, 2.0, 2.0]
+    with pytest.raises(TypeError):
+        first.get_int32([1])
+
+    xml = first.to_xml()
+    variables = xml.find("ModelVariables")
+    assert [v.get("name") for v in variables] == ["time", "u", "y", "gains.k", "n", "x", "extra"]
+    assert variables[1].get("start") == "4"
+    # The start values of the instance are not written to the shared variables
+    assert SchemaSlave.model_variables[1].start == 1.0
+    assert second.to_xml().find("ModelVariables")[1].get("start") == "1"
+
+
+def test_Fmi3Slave_class_variables_reject_accessors():
+
+    class Slave(Fmi3Slave):
+        model_variables = (Float64("y", getter=lambda: 0.0),)
+
+        def do_step(self, t, dt):
+            return True
+
+    with pytest.raises(ValueError):
+        Slave(instance_name="slaveInstance")
+
+
+def test_Fmi3Slave_class_variables_reused_by_subclass():
+
+    class Base(Fmi3Slave):
+        model_variables = (
+            Float64("u", causality=Fmi3Causality.input, start=1.0),
+            Float64("y", causality=Fmi3Causality.output),
+        )
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.u = 1.0
+            self.y = 0.0
+
+        def do_step(self, t, dt):
+            return True
+
+    class Extended(Base):
+        model_variables = Base.model_variables + (Float64("z", causality=Fmi3Causality.output),)
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.z = 0.0
+
+    class Reordered(Base):
+        model_variables = tuple(reversed(Base.model_variables))
+
+    extended = Extended(instance_name="extended")
+    assert [(v.name, vr) for vr, v in extended.vars.items()] == [("u", 0), ("y", 1), ("z", 2)]
+    with pytest.raises(ValueError):
+        Reordered(instance_name="reordered")
+    # The schema of the base class is left unchanged
+    assert [(v.name, vr) for vr, v in Base(instance_name="base").vars.items()] == [("u", 0), ("y", 1)]
+
+
+def test_Fmi3Slave_class_clocks_per_instance():
+
+    class Slave(Fmi3Slave):
+        model_variables = (
+            Clock("tick", causality=Fmi3Causality.input, interval_variability=Fmi3IntervalVariability.tunable, interval=0.1),
+        )
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.tick = False
+
+        def do_step(self, t, dt):
+            return True
+
+    first = Slave(instance_name="first")
+    second = Slave(instance_name="second")
+    assert first.vars[0] is second.vars[0]
+
+    first.set_interval_decimal([0], [0.5])
+    first.set_shift_decimal([0], [0.05])
+    second.clock_state(second.vars[0]).interval = 0.2
+    assert first.get_interval_decimal([0]) == [(0.5, Fmi3IntervalQualifier.intervalUnchanged)]
+    assert second.get_interval_decimal([0]) == [(0.2, Fmi3IntervalQualifier.intervalChanged)]
+    assert first.get_shift_decimal([0]) == [0.05]
+    assert second.get_shift_decimal([0]) == [0.0]
+
+    # The declaration is left untouched
+    assert Slave(instance_name="third").get_interval_decimal([0]) == [(0.1, Fmi3IntervalQualifier.intervalUnchanged)]
+    assert first.to_xml().find("ModelVariables")[0].get("intervalDecimal") == "0.1"
+
+
+def test_Fmi3Slave_register_block():
+    np = pytest.importorskip("numpy")
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.u = 1.0
+            self.x = np.zeros(2)
+            self.T = np.arange(6, dtype=float).reshape(2, 3)
+            self.cell = np.zeros(2, dtype=[("T", "f8"), ("p", "f4")])
+            self.n = 2
+            self.register_variable(Float64("u", causality=Fmi3Causality.input))
+            self.register_block(Float64, "T", causality=Fmi3Causality.output)
+            self.register_variable(Float64("x", dimensions=[Dimension(start="2")]))
+            self.register_block(Float64, "cell", fields=["T", "p"], causality=Fmi3Causality.input)
+            self.register_variable(Int32("n", causality=Fmi3Causality.parameter))
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    assert [(b.value_reference, b.size) for b in slave.blocks] == [(1, 6), (8, 4)]
+    assert slave.get_float64([0, 1, 2, 6, 7, 8]) == [1.0, 0.0, 1.0, 5.0, 0.0, 0.0, 0.0]
+    assert slave.get_int32([12]) == [2]
+
+    # Runs of elements are mixed with scalar and array variables
+    slave.set_float64([9, 10, 7, 0, 11, 4], [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+    assert slave.cell["T"].tolist() == [0.0, 1.0]
+    assert slave.cell["p"].tolist() == [2.0, 6.0]
+    assert slave.x.tolist() == [3.0, 4.0]
+    assert slave.u == 5.0
+    assert slave.T[1, 0] == 7.0
+    assert slave.get_float64([11, 8, 10]) == [6.0, 0.0, 2.0]
+
+    with pytest.raises(TypeError):
+        slave.get_int32([1])
+    with pytest.raises(KeyError):
+        slave.get_float64([1, 13])
+
+    xml = slave.to_xml()
+    variables = xml.find("ModelVariables")
+    assert [v.get("name") for v in variables] == [
+        "u", "T[0,0]", "T[0,1]", "T[0,2]", "T[1,0]", "T[1,1]", "T[1,2]", "x", "cell[0].T", "cell[1].T", "cell[0].p", "cell[1].p", "n"
+    ]
+    assert [v.get("valueReference") for v in variables] == [str(vr) for vr in range(13)]
+    assert variables[9].get("start") == "1"
+    outputs = [o.get("valueReference") for o in xml.find("ModelStructure").findall("Output")]
+    assert outputs == ["1", "2", "3", "4", "5", "6"]
+
+    state = slave._fmu_state_from_bytes(slave._fmu_state_to_bytes(slave._get_fmu_state()))
+    slave.T[:] = 0.0
+    slave.cell["p"] = 0.0
+    slave._set_fmu_state(state)
+    assert slave.T[1].tolist() == [7.0, 4.0, 5.0]
+    assert slave.cell["p"].tolist() == [2.0, 6.0]
+
+
+def test_Fmi3Slave_array_setter_in_place():
+    np = pytest.importorskip("numpy")
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.state = np.zeros(4)
+            # Views held by the model on the registered arrays
+            self.u = self.state[:2]
+            self.gain = np.ones(2)
+            self.register_variable(Float64("u", dimensions=[Dimension(start="2")]))
+            self.register_variable(Float64("gain", dimensions=[Dimension(start="2")]))
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    gain = slave.gain
+    slave.set_float64([0, 1], [1.0, 2.0, 3.0, 4.0])
+    assert slave.gain is gain
+    assert slave.state.tolist() == [1.0, 2.0, 0.0, 0.0]
+    assert slave.get_float64([1, 0]) == [3.0, 4.0, 1.0, 2.0]
+
+    # Non contiguous arrays are read and written through their strides
+    slave.u = slave.state[::2]
+    slave.set_float64([0], [5.0, 6.0])
+    assert slave.state.tolist() == [5.0, 2.0, 6.0, 0.0]
+    assert slave.get_float64([0]) == [5.0, 6.0]
+
+
+def test_Fmi3Slave_get_buffer():
+    np = pytest.importorskip("numpy")
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.k = 2.0
+            self.x = np.arange(3.0)
+            self.n = np.arange(2, dtype=np.int32)
+            self.register_variable(Float64("k"))
+            self.register_variable(Float64("x", dimensions=[Dimension(start="3")]))
+            self.register_variable(Int32("n", dimensions=[Dimension(start="2")]))
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    # Scalars only are read as a list
+    assert slave._get_buffer("float64", [0, 0]) == [2.0, 2.0]
+
+    # A single array is read without copy
+    values = slave._get_buffer("float64", [1])
+    assert isinstance(values, np.ndarray) and np.shares_memory(values, slave.x)
+
+    values = slave._get_buffer("float64", [0, 1, 0])
+    assert values.dtype == np.float64 and values.tolist() == [2.0, 0.0, 1.0, 2.0, 2.0]
+    values = slave._get_buffer("int32", [2])
+    assert values.dtype == np.int32 and values.tolist() == [0, 1]
+    with pytest.raises(TypeError):
+        slave._get_buffer("float64", [1, 2])
+
+
+def test_Fmi3Slave_set_buffer():
+    np = pytest.importorskip("numpy")
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.k = 2.0
+            self.x = np.zeros(3)
+            self.n = np.zeros(2, dtype=np.int32)
+            self.register_variable(Float64("k", causality=Fmi3Causality.parameter, variability=Fmi3Variability.tunable))
+            self.register_variable(Float64("x", causality=Fmi3Causality.input, dimensions=[Dimension(start="3")]))
+            self.register_variable(Int32("n", dimensions=[Dimension(start="2")]))
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    x = slave.x
+    slave._set_buffer("float64", [0, 1, 0], memoryview(np.array([3.0, 1.0, 2.0, 3.0, 4.0])))
+    assert slave.k == 4.0 and x.tolist() == [1.0, 2.0, 3.0] and slave.x is x
+    assert slave.changed_inputs() == {"k", "x"}
+
+    slave._set_buffer("int32", [2], memoryview(np.array([5, 6], dtype=np.int32)))
+    assert slave.n.tolist() == [5, 6]
+    with pytest.raises(TypeError):
+        slave._set_buffer("float64", [1, 2], memoryview(np.zeros(5)))
+
+
+def test_Fmi3Slave_input_changes():
+    np = pytest.importorskip("numpy")
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.u = 1.0
+            self.v = np.zeros(2)
+            self.k = 0
+            self.y = 0.0
+            self.cell = np.zeros(3)
+            self.register_variable(Float64("u", causality=Fmi3Causality.input))
+            self.register_variable(Float64("v", causality=Fmi3Causality.input, dimensions=[Dimension(start="2")]))
+            self.register_variable(Int32("k", causality=Fmi3Causality.parameter, setter=lambda value: setattr(self, "k", value)))
+            self.register_variable(Float64("y", causality=Fmi3Causality.output))
+            self.register_block(Float64, "cell", causality=Fmi3Causality.input)
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    assert not slave.inputs_changed()
+
+    # Identical values are not changes, outputs are not tracked
+    slave.set_float64([0, 1, 3, 4, 5, 6], [1.0, 0.0, 0.0, 5.0, 0.0, 0.0, 0.0])
+    assert slave.changed_inputs() == set()
+
+    slave.set_float64([0, 1, 5], [2.0, 0.0, 1.0, 3.0])
+    assert slave.changed_inputs() == {"u", "v", "cell"}
+    assert slave.cell.tolist() == [0.0, 3.0, 0.0]
+
+    # Custom setters cannot tell if the value changed
+    slave.clear_changed_inputs()
+    slave.set_int32([2], [0])
+    assert slave.changed_inputs() == {"k"}
+
+
+def test_Fmi3Slave_skip_if_inputs_unchanged():
+
+    class Slave(Fmi3Slave):
+
+        time_invariant = True
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.u = 1.0
+            self.gain = 2.0
+            self.y = 0.0
+            self.steps = 0
+            self.register_variable(Float64("u", causality=Fmi3Causality.input))
+            self.register_variable(Float64("gain", causality=Fmi3Causality.parameter, variability=Fmi3Variability.tunable))
+            self.register_variable(Float64("y", causality=Fmi3Causality.output))
+
+        @skip_if_inputs_unchanged
+        def do_step(self, t, dt):
+            self.steps += 1
+            self.y = self.gain * self.u
+            return self.u >= 0
+
+    slave = Slave(instance_name="slaveInstance")
+    assert slave.do_step(0.0, 1.0)
+    slave.set_float64([0], [1.0])
+    assert slave.do_step(1.0, 1.0)
+    assert slave.steps == 1
+
+    slave.set_float64([1], [3.0])
+    slave.do_step(2.0, 1.0)
+    assert (slave.steps, slave.y) == (2, 3.0)
+    assert not slave.inputs_changed()
+
+    # Failed steps are not reused
+    slave.set_float64([0], [-1.0])
+    assert not slave.do_step(3.0, 1.0)
+    assert not slave.do_step(4.0, 1.0)
+    assert slave.steps == 4
+
+    slave.time_invariant = False
+    slave.set_float64([0], [1.0])
+    slave.do_step(5.0, 1.0)
+    slave.do_step(6.0, 1.0)
+    assert slave.steps == 6
+
+
+def test_Fmi3Slave_output_derivatives():
+
+    class Ramp(Fmi3Slave):
+
+        max_output_derivative_order = 1
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.slope = 2.0
+            self.y = 0.0
+            self.register_variable(Float64("y", causality=Fmi3Causality.output))
+
+        def do_step(self, t, dt):
+            self.y = self.slope * (t + dt)
+            return True
+
+        def get_output_derivatives(self, vrs, orders):
+            return [self.slope for _ in vrs]
+
+    class Slave(Fmi3Slave):
+
+        def do_step(self, t, dt):
+            return True
+
+    ramp = Ramp(instance_name="ramp")
+    assert ramp.to_xml().find("CoSimulation").get("maxOutputDerivativeOrder") == "1"
+    assert ramp.get_output_derivatives([0], [1]) == [2.0]
+
+    slave = Slave(instance_name="slaveInstance")
+    assert slave.to_xml().find("CoSimulation").get("maxOutputDerivativeOrder") is None
+    # fmi3GetOutputDerivatives falls back to the "not supported" error of the FMI wrapper
+    assert not hasattr(slave, "get_output_derivatives")
+
+
+def test_Fmi3Slave_configuration_mode():
+    np = pytest.importorskip("numpy")
+
+    class Grid(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.n = 3
+            self.T = np.arange(3.0)
+            self.q = np.ones((3, 1), dtype=np.float32)
+            self.work = np.zeros(3)
+            self.reconfigured = []
+            self.register_variable(UInt64("n", causality=Fmi3Causality.structuralParameter, variability=Fmi3Variability.tunable, start=3))
+            self.register_variable(Float64("T", causality=Fmi3Causality.output, dimensions=[Dimension(valueReference="0")]))
+            self.register_variable(Float32("q", causality=Fmi3Causality.input, dimensions=[Dimension(valueReference="0")]))
+
+        def reconfigure(self, parameters):
+            self.reconfigured.append(parameters)
+            self.work = np.zeros(self.n)
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Grid(instance_name="grid")
+    assert slave.get_float64([1]) == [0.0, 1.0, 2.0]
+
+    slave.enter_configuration_mode()
+    slave.set_uint64([0], [5])
+    slave.exit_configuration_mode()
+    assert slave.reconfigured == [{"n"}]
+    assert slave.work.shape == (5,)
+    # The overlapping values are kept, the arrays keep their dtype and trailing axes
+    assert slave.get_float64([1]) == [0.0, 1.0, 2.0, 0.0, 0.0]
+    assert (slave.q.shape, slave.q.dtype) == ((5, 1), np.float32)
+    slave.set_float32([2], [1.0] * 5)
+    assert slave.q.ravel().tolist() == [1.0] * 5
+
+    # Setting the same value does not reconfigure the model
+    slave.enter_configuration_mode()
+    slave.set_uint64([0], [5])
+    slave.exit_configuration_mode()
+    assert len(slave.reconfigured) == 1
+
+    slave.enter_configuration_mode()
+    slave.set_uint64([0], [2])
+    slave.exit_configuration_mode()
+    assert slave.get_float64([1]) == [0.0, 1.0]
+    assert slave.to_xml().find("ModelVariables")[1].find("Dimension").get("valueReference") == "0"
+
+
+def test_Fmi3Slave_computed_outputs():
+    np = pytest.importorskip("numpy")
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.u = 1.0
+            self.k = 1.0
+            self.calls = 0
+            self.register_variable(Float64("u", causality=Fmi3Causality.input))
+            self.register_variable(Float64("y", causality=Fmi3Causality.output), compute=self.square)
+            self.register_variable(Float64("ys", causality=Fmi3Causality.output, dimensions=[Dimension(start="3")]),
+                                   compute=lambda: np.arange(3) * self.u)
+            self.register_variable(Float64("k"))
+
+        def square(self):
+            self.calls += 1
+            return self.k * self.u ** 2
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    assert slave.calls == 0
+    assert slave.get_float64([1, 1]) == [1.0, 1.0]
+    assert slave.calls == 1
+
+    # Setting the same value keeps the cached outputs
+    slave.set_float64([0], [1.0])
+    slave.get_float64([1])
+    assert slave.calls == 1
+
+    slave.set_float64([0], [3.0])
+    assert slave.get_float64([1, 2]) == [9.0, 0.0, 3.0, 6.0]
+    assert slave.calls == 2
+
+    # Setting a local clears the cached outputs too
+    slave.set_float64([3], [2.0])
+    assert slave.get_float64([1]) == [18.0]
+    assert slave.calls == 3
+
+    # The cached outputs are cleared by the FMI wrapper after the calls advancing the model, not by these methods
+    slave.do_step(0.0, 1.0)
+    slave.get_float64([1])
+    assert slave.calls == 3
+    assert slave._get_computed_values() is slave._computed
+
+    with pytest.raises(TypeError):
+        slave.set_float64([1], [0.0])
+    assert "y" not in slave._get_fmu_state()
+
+
+def test_Fmi3Slave_computed_outputs_invalidated_by_reconfiguration():
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.n = 1
+            self.x = 1.0
+            self.register_variable(Int32("n", causality=Fmi3Causality.structuralParameter, variability=Fmi3Variability.tunable))
+            self.register_variable(Float64("y", causality=Fmi3Causality.output), compute=lambda: 2 * self.x)
+
+        def reconfigure(self, parameters):
+            self.x = 0.5
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    assert slave.get_float64([1]) == [2.0]
+    slave.enter_configuration_mode()
+    slave.set_int32([0], [2])
+    assert slave.get_float64([1]) == [2.0]
+    slave.exit_configuration_mode()
+    assert slave.get_float64([1]) == [1.0]
+
+
+def test_Fmi3Slave_select():
+    np = pytest.importorskip("numpy")
+
+    class Zone:
+
+        def __init__(self, T):
+            self.T = T
+            self.on = False
+
+    class Plant:
+
+        def __init__(self):
+            self.zone1 = Zone(20.0)
+            self.zone2 = Zone(21.0)
+            self.pump = Zone(5.0)
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.plant = Plant()
+            self.wall = np.zeros(3)
+            self.profile = np.arange(2.0)
+            for name in ("zone1", "zone2", "pump"):
+                self.register_variable(Float64(f"plant.{name}.T", causality=Fmi3Causality.input))
+            self.register_variable(Boolean("plant.zone1.on", causality=Fmi3Causality.input))
+            self.register_block(Float64, "wall", causality=Fmi3Causality.output)
+            self.register_variable(Float64("profile", causality=Fmi3Causality.output, dimensions=[Dimension(start="2")]))
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    zones = slave.select("plant.zone*.T")
+    assert zones.names == ["plant.zone1.T", "plant.zone2.T"]
+    assert zones.value_references == [0, 1]
+    assert zones.get() == [20.0, 21.0]
+    zones.set([18.0, 19.0])
+    assert (slave.plant.zone1.T, slave.plant.zone2.T, slave.plant.pump.T) == (18.0, 19.0, 5.0)
+
+    # Variables of several types and block elements registered after the first selection
+    mixed = slave.select("plant.zone1.*")
+    assert mixed.names == ["plant.zone1.T", "plant.zone1.on"]
+    mixed.set([17.0, True])
+    assert mixed.get() == [17.0, True]
+    assert slave.select("plant.**.T").names == ["plant.zone1.T", "plant.zone2.T", "plant.pump.T"]
+    assert slave.select("wall[?]").value_references == [4, 5, 6]
+    assert slave.select("wall[1]").value_references == [5]
+    assert slave.select("profile").get() == [[0.0, 1.0]]
+    with pytest.raises(ValueError):
+        slave.select("plant.boiler.*")
+
+    state = slave._get_fmu_state()
+    top_level = slave.select("*")
+    assert top_level.names == ["wall[0]", "wall[1]", "wall[2]", "profile"]
+    top_level.set([1.0, 1.0, 1.0, np.array([5.0, 6.0])])
+    assert slave.wall.tolist() == [1.0, 1.0, 1.0]
+    slave._set_fmu_state(state)
+    assert slave.profile.tolist() == [0.0, 1.0]
+    assert slave.wall.tolist() == [0.0, 0.0, 0.0]
+
+
+def test_Fmi3Slave_get_uint64_returns_ints():
+    np = pytest.importorskip("numpy")
+    import ctypes
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.counter = 2**64 - 1
+            self.legacy = ctypes.c_uint64(42)
+            self.ids = np.array([0, 1, 2**63], dtype=np.uint64)
+            self.register_variable(UInt64("counter"))
+            self.register_variable(UInt64("legacy"))
+            self.register_variable(UInt64("ids", dimensions=[Dimension(start="3")]))
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    values = slave.get_uint64([0, 1, 2])
+    assert values == [2**64 - 1, 42, 0, 1, 2**63]
+    assert all(type(v) is int for v in values)
+
+
+def test_Fmi3SlaveBase_dependencies():
+    script_file = Path(__file__).parent / "slaves/pythonslaveMX_sparse.py"
+    slave = instantiate_slave(script_file, script_file.stem)
+    vrs = {v.name: v.value_reference for v in slave.vars.values()}
+
+    structure = slave.to_xml().find("ModelStructure")
+    derivatives = {e.attrib["valueReference"]: e.attrib for e in structure.findall("ContinuousStateDerivative")}
+    assert derivatives[str(vrs["derx0"])]["dependencies"] == f"{vrs['x0']} {vrs['u']}"
+    assert "dependenciesKind" not in derivatives[str(vrs["derx0"])]
+    assert derivatives[str(vrs["derx1"])]["dependencies"] == f"{vrs['x0']} {vrs['x1']}"
+    output = structure.find("Output").attrib
+    assert output["dependencies"] == str(vrs["x1"])
+    assert output["dependenciesKind"] == "constant"
+    initial = {e.attrib["valueReference"]: e.attrib for e in structure.findall("InitialUnknown")}
+    assert initial[str(vrs["y"])]["dependencies"] == str(vrs["x1"])
+    assert initial[str(vrs["derx1"])]["dependencies"] == f"{vrs['x0']} {vrs['x1']}"
+
+    assert slave.get_variable_dependencies(vrs["derx0"]) == [
+        (0, vrs["x0"], 0, Fmi3DependencyKind.dependent),
+        (0, vrs["u"], 0, Fmi3DependencyKind.dependent),
+    ]
+    assert slave.get_variable_dependencies(vrs["y"]) == [(0, vrs["x1"], 0, Fmi3DependencyKind.constant)]
+
+
+def test_Fmi3SlaveBase_undeclared_dependencies():
+    script_file = Path(__file__).parent / "slaves/pythonslaveMX.py"
+    slave = instantiate_slave(script_file, script_file.stem)
+    vrs = {v.name: v.value_reference for v in slave.vars.values()}
+
+    structure = slave.to_xml().find("ModelStructure")
+    assert all("dependencies" not in e.attrib for e in structure)
+    # Depends on all the knowns, i.e. the continuous state
+    assert slave.get_variable_dependencies(vrs["derx"]) == [(0, vrs["x"], 0, Fmi3DependencyKind.dependent)]
+
+
+def test_Fmi3SlaveBase_model_partitions():
+    script_file = Path(__file__).parent / "slaves/pythonslave_clocked.py"
+    slave = instantiate_slave(script_file, script_file.stem)
+    vrs = {v.name: v.value_reference for v in slave.vars.values()}
+
+    assert set(slave._get_model_partitions()) == {vrs["fast"], vrs["slow"]}
+    for _ in range(10):
+        slave.activate_model_partition(vrs["fast"], 0.01)
+    slave.activate_model_partition(vrs["slow"], 0.1)
+    assert (slave.fastTicks, slave.slowTicks, slave.lastActivation) == (10, 1, 0.1)
+
+    with pytest.raises(ValueError):
+        slave.activate_model_partition(vrs["fastTicks"], 0.0)
+    with pytest.raises(ValueError):
+        slave.register_partition(slave.vars[vrs["fastTicks"]], lambda t: None)
+
+    assert slave.get_interval_decimal([vrs["slow"]]) == [(0.1, Fmi3IntervalQualifier.intervalUnchanged)]
+    slave.set_interval_decimal([vrs["slow"]], [0.2])
+    slave.set_shift_decimal([vrs["slow"]], [0.05])
+    assert slave.get_interval_decimal([vrs["slow"]]) == [(0.2, Fmi3IntervalQualifier.intervalUnchanged)]
+    assert slave.get_shift_decimal([vrs["fast"], vrs["slow"]]) == [0.0, 0.05]
+    with pytest.raises(TypeError):
+        slave.get_clock([vrs["time"]])
+
+    xml = slave.to_xml()
+    assert xml.find("ScheduledExecution").attrib["modelIdentifier"] == "PythonSlaveClocked"
+    assert xml.find("CoSimulation") is None
+
+
+def test_Fmi3SlaveBase_output_clock_reset_on_get():
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.alarm = False
+            self.register_variable(Clock("alarm", causality=Fmi3Causality.output, interval_variability=Fmi3IntervalVariability.triggered))
+
+        def do_step(self, t, dt):
+            self.alarm = True
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    assert slave.get_clock([0]) == [False]
+    slave.do_step(0.0, 0.1)
+    assert slave.get_clock([0]) == [True]
+    assert slave.get_clock([0]) == [False]
+
+
+def test_Fmi3Slave_cosimulation_event_options():
+    script_file = Path(__file__).parent / "slaves/pythonslave_events.py"
+    slave = instantiate_slave(script_file, script_file.stem)
+    assert not slave.event_mode_used and not slave.early_return_allowed
+
+    options = slave.to_xml().find("CoSimulation").attrib
+    assert options["canHandleVariableCommunicationStepSize"] == "true"
+    assert options["hasEventMode"] == "false"
+    assert options["mightReturnEarlyFromDoStep"] == "false"
+
+    options = slave.to_xml({"hasEventMode": True, "mightReturnEarlyFromDoStep": True}).find("CoSimulation").attrib
+    assert options["hasEventMode"] == "true"
+    assert options["mightReturnEarlyFromDoStep"] == "true"
+
+    slave = instantiate_slave(script_file, script_file.stem)
+    slave.early_return_allowed = True
+    result = slave.do_step(0.0, 1.0)
+    assert result.earlyReturn and result.lastSuccessfulTime == 0.25
+    assert not result.eventHandlingNeeded
+    assert slave.ticks == 1
+
+
+def test_Fmi3Slave_binary_fmu_state():
+
+    class Slave(Fmi3Slave):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.payload = bytearray(b"\x00\x01\x02")
+            self.register_variable(Binary("payload", causality=Fmi3Causality.parameter, variability=Fmi3Variability.tunable))
+
+        def do_step(self, t, dt):
+            return True
+
+    slave = Slave(instance_name="slaveInstance")
+    state = slave._get_fmu_state()
+    slave.payload[0] = 0xff
+    assert slave.get_binary([0]) == [bytearray(b"\xff\x01\x02")]
+
+    slave._set_fmu_state(Slave._fmu_state_from_bytes(Slave._fmu_state_to_bytes(state)))
+    assert slave.get_binary([0]) == [b"\x00\x01\x02"]
+
+    xml = slave.to_xml()
+    start = xml.find(".//Binary/Start")
+    assert start.attrib["value"] == "000102"
+
+
 def test_Fmi3Slave_log_categories():
     class Slave(Fmi3Slave):
         def do_step(self, t, dt):
@@ -0,0 +1,145 @@
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from pythonfmu3 import Fmi3Status
+from pythonfmu3.builder import FmuBuilder
+from pythonfmu3.importer import Fmi3CallError, InProcessFmu, is_python_fmu, load_fmu
+
+pytestmark = pytest.mark.skipif(
+    not FmuBuilder.has_binary(), reason="No binary available for the current platform."
+)
+
+SLAVES = Path(__file__).parent / "slaves"
+
+
+def build(tmp_path, script, **options):
+    return FmuBuilder.build_FMU(SLAVES / script, dest=tmp_path, needsExecutionTool="false", **options)
+
+
+def test_is_python_fmu(tmp_path):
+    fmu = build(tmp_path, "pythonslave.py")
+    assert is_python_fmu(fmu)
+
+    other = tmp_path / "other.fmu"
+    with zipfile.ZipFile(other, "w") as f:
+        f.writestr("modelDescription.xml", "")
+    assert not is_python_fmu(other)
+    assert not is_python_fmu(tmp_path / "missing.fmu")
+    with pytest.raises(ValueError):
+        InProcessFmu(other)
+
+
+@pytest.mark.parametrize("bundle_python", [False, True])
+def test_load_fmu_cosimulation(tmp_path, bundle_python):
+    fmu = load_fmu(build(tmp_path, "pythonslave.py", bundle_python=bundle_python))
+    assert type(fmu.instance).__name__ == "PythonSlave"
+    vrs = {v.name: v.value_reference for v in fmu.instance.vars.values()}
+
+    fmu.enterInitializationMode()
+    fmu.setInt32([vrs["intParam"]], [7])
+    fmu.exitInitializationMode()
+    assert fmu.getInt32([vrs["intParam"], vrs["intOut"]]) == [7, 23]
+    assert fmu.getString([vrs["stringVariable"]]) == ["Hello World!"]
+
+    t, dt = 0.0, 0.1
+    for _ in range(5):
+        assert fmu.doStep(t, dt) == (False, False, False, pytest.approx(t + dt))
+        t += dt
+    assert fmu.getFloat64([vrs["realOut"]]) == [pytest.approx(0.5)]
+
+    state = fmu.getFMUState()
+    fmu.doStep(t, dt)
+    fmu.setFMUState(fmu.deserializeFMUState(fmu.serializeFMUState(state)))
+    assert fmu.getFloat64([vrs["realOut"]]) == [pytest.approx(0.5)]
+
+    fmu.reset()
+    assert fmu.getInt32([vrs["intParam"]]) == [42]
+
+    fmu.terminate()
+    fmu.freeInstance()
+    assert not fmu.unzipdir.exists()
+
+
+SAME_NAME_MODEL = """
+from pythonfmu3 import Fmi3Causality, Fmi3Slave, Fmi3Variability, Float64
+
+
+class Model(Fmi3Slave):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.time = 0.0
+        self.gain = {gain}
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("gain", causality=Fmi3Causality.output))
+
+    def do_step(self, current_time, step_size):
+        return True
+"""
+
+
+@pytest.mark.parametrize("bundle_python", [False, True])
+def test_load_fmu_same_module_name(tmp_path, bundle_python):
+    fmus = []
+    for gain in (1.0, 2.0):
+        folder = tmp_path / str(gain)
+        folder.mkdir()
+        (folder / "model.py").write_text(SAME_NAME_MODEL.format(gain=gain))
+        fmus.append(FmuBuilder.build_FMU(folder / "model.py", dest=folder, needsExecutionTool="false", bundle_python=bundle_python))
+
+    path, modules = list(sys.path), set(sys.modules)
+    first, second = load_fmu(fmus[0]), load_fmu(fmus[1])
+    # The modules of the FMUs are loaded side by side, without touching the import path
+    assert sys.path == path and "model" not in sys.modules
+    assert first.slave_class is not second.slave_class
+    assert first.getFloat64([1]) == [1.0]
+    assert second.getFloat64([1]) == [2.0]
+    assert first.slave_class.__module__ in set(sys.modules) - modules
+
+    first.freeInstance()
+    second.freeInstance()
+
+
+def test_load_fmu_early_return(tmp_path):
+    fmu = load_fmu(build(tmp_path, "pythonslave_events.py"), earlyReturnAllowed=True)
+    assert fmu.doStep(0.0, 1.0) == (False, False, True, pytest.approx(0.25))
+
+    fmu = load_fmu(build(tmp_path, "pythonslave_events.py"), eventModeUsed=True)
+    event, terminate, early_return, _ = fmu.doStep(0.0, 1.0)
+    assert (event, terminate, early_return) == (True, False, False)
+    fmu.enterEventMode()
+    assert fmu.updateDiscreteStates()[0] is False
+
+
+def test_load_fmu_model_exchange(tmp_path):
+    fmu = load_fmu(build(tmp_path, "pythonslaveMX.py"))
+    fmu.enterInitializationMode()
+    fmu.exitInitializationMode()
+    fmu.enterContinuousTimeMode()
+
+    assert fmu.getNumberOfContinuousStates() == 1
+    assert fmu.getContinuousStates() == [1.0]
+    fmu.setContinuousStates([0.5])
+    fmu.setTime(0.1)
+    assert fmu.getContinuousStateDerivatives() == [-0.5]
+    assert fmu.getNominalsOfContinuousStates() == [1.0]
+    assert fmu.getNumberOfEventIndicators() == 0
+
+
+def test_load_fmu_logger_and_errors(tmp_path):
+    messages = []
+    fmu = load_fmu(build(tmp_path, "pythonslave.py"), logger=lambda *msg: messages.append(msg))
+
+    fmu.instance.log("Hello", Fmi3Status.warning, "logStatusWarning")
+    fmu.instance.log("Debug", debug=True)
+    fmu.doStep(0.0, 0.1)
+    assert messages == [(Fmi3Status.warning, "logStatusWarning", "Hello")]
+
+    # do_step returning False is reported as fmi3Discard
+    fmu.instance.do_step = lambda t, dt: False
+    with pytest.raises(Fmi3CallError) as error:
+        fmu.doStep(0.1, 0.1)
+    assert error.value.status == Fmi3Status.discard
@@ -1,3 +1,4 @@
+import json
 import math
 from pathlib import Path
 import ctypes
@@ -280,6 +281,36 @@ def test_integration_get(tmp_path):
     model.terminate()
     model.freeInstance()
 
+@pytest.mark.integration
+def test_integration_get_string_repeated(tmp_path):
+    script_file = Path(__file__).parent / "slaves/pythonslave.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    assert fmu.exists()
+
+    md = fmpy.read_model_description(fmu)
+    unzip_dir = fmpy.extract(fmu)
+
+    model = fmpy.fmi3.FMU3Slave(
+        guid=md.guid,
+        unzipDirectory=unzip_dir,
+        modelIdentifier=md.coSimulation.modelIdentifier,
+        instanceName='instance1')
+
+    model.instantiate()
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    # The encoded strings are cached per value reference until the value changes
+    vrs = [mapped(md)["stringParameter"].valueReference, mapped(md)["stringVariable"].valueReference]
+    assert model.getString(vrs) == ["dog", "Hello World!"]
+    assert model.getString(vrs) == ["dog", "Hello World!"]
+    model.setString(vrs[:1], ["cat \u00e9"])
+    assert model.getString(vrs) == ["cat \u00e9", "Hello World!"]
+
+    model.terminate()
+    model.freeInstance()
+
+
 @pytest.mark.integration
 def test_integration_get_array(tmp_path):
     script_file = Path(__file__).parent / "slaves/pythonslave_arraytypes.py"
@@ -327,6 +358,10 @@ def test_integration_get_array(tmp_path):
 
         assert len(model_values) == len(value)
         assert model_values == value
+
+    # Scalars and arrays read in one call
+    vrs = [variables["time"].valueReference, variables["float64_output"].valueReference, variables["time"].valueReference]
+    assert model.getFloat64(vrs, nValues=12) == [0.0, *to_test["float64_output"], 0.0]
         
     model.terminate()
     model.freeInstance()
@@ -506,6 +541,54 @@ def test_integration_has_local_dep(tmp_path):
     )
 
 
+@pytest.mark.integration
+def test_integration_bundle_python(tmp_path):
+
+    script_file = Path(__file__).parent / "slaves/slavewithdep.py"
+    local_file = Path(__file__).parent / "slaves/localmodule.py"
+
+    fmu = FmuBuilder.build_FMU(
+        script_file,
+        dest=tmp_path,
+        project_files=[local_file],
+        needsExecutionTool="false",
+        bundle_python=True
+    )
+    assert fmu.exists()
+
+    res = fmpy.simulate_fmu(str(fmu), stop_time=0.5)
+
+    assert res["realOut"][-1] == pytest.approx(
+        22.0 * 5.0 * math.exp(res["time"][-1] / 0.1), rel=1e-7
+    )
+
+
+@pytest.mark.integration
+def test_integration_output_derivatives_not_supported(tmp_path):
+    script_file = Path(__file__).parent / "slaves/pythonslave.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    md = fmpy.read_model_description(fmu)
+    assert not md.coSimulation.maxOutputDerivativeOrder
+
+    model = fmpy.fmi3.FMU3Slave(
+        guid=md.guid,
+        unzipDirectory=fmpy.extract(fmu),
+        modelIdentifier=md.coSimulation.modelIdentifier,
+        instanceName='instance1')
+    model.instantiate()
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    variables = mapped(md)
+    with pytest.raises(Exception):
+        model.getOutputDerivatives([variables["realOut"].valueReference], [1])
+    # An error, not a fatal one: the instance is still usable
+    model.doStep(0.0, 0.1)
+
+    model.terminate()
+    model.freeInstance()
+
+
 @pytest.mark.integration
 def test_integration_throw_py_error(tmp_path):
 
@@ -515,3 +598,520 @@ def test_integration_throw_py_error(tmp_path):
 
     with pytest.raises(Exception):
         fmpy.simulate_fmu(str(fmu), stop_time=1.0)
+
+
+@pytest.mark.integration
+def test_integration_profile(tmp_path, monkeypatch):
+    script_file = Path(__file__).parent / "slaves/pythonslave.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    assert fmu.exists()
+
+    profile_dir = tmp_path / "profile"
+    profile_dir.mkdir()
+    monkeypatch.setenv("PYTHONFMU3_PROFILE", str(profile_dir))
+    res = fmpy.simulate_fmu(str(fmu), stop_time=0.5, output_interval=0.1)
+
+    reports = list(profile_dir.glob("*.json"))
+    assert len(reports) == 1
+    report = json.loads(reports[0].read_text())
+    assert report["instanceName"] == reports[0].stem
+
+    do_step = report["functions"]["DoStep"]
+    assert do_step["calls"] == len(res) - 1
+    assert do_step["total"] >= do_step["python"] > 0.0
+    for key in ("gilWait", "marshalling", "logFlush"):
+        assert do_step[key] >= 0.0
+    assert report["functions"]["GetFloat64"]["calls"] > 0
+
+
+@pytest.mark.integration
+def test_integration_profile_log(tmp_path, monkeypatch):
+    script_file = Path(__file__).parent / "slaves/pythonslave.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    assert fmu.exists()
+
+    messages = []
+
+    def logger(*args):
+        messages.append(args[-1].decode("utf-8"))
+
+    monkeypatch.setenv("PYTHONFMU3_PROFILE", "log")
+    fmpy.simulate_fmu(str(fmu), stop_time=0.5, output_interval=0.1, logger=logger)
+
+    reports = [json.loads(m) for m in messages if m.startswith("{\"instanceName\"")]
+    assert len(reports) == 1
+    assert reports[0]["functions"]["DoStep"]["calls"] == 5
+
+
+@pytest.mark.integration
+def test_integration_binary(tmp_path):
+    script_file = Path(__file__).parent / "slaves/pythonslave_binary.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    assert fmu.exists()
+
+    md = fmpy.read_model_description(fmu)
+    unzip_dir = fmpy.extract(fmu)
+
+    model = fmpy.fmi3.FMU3Slave(
+        guid=md.guid,
+        unzipDirectory=unzip_dir,
+        modelIdentifier=md.coSimulation.modelIdentifier,
+        instanceName='instance1')
+
+    model.instantiate()
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    variables = mapped(md)
+    vrs = [variables[name].valueReference for name in ("bytesOut", "bufferOut", "arrayOut")]
+    assert model.getBinary(vrs) == [b"\x00\x01\x02", b"buffer", b"\x00\x01\x02\x03"]
+
+    payload = bytes(range(256)) * 1024
+    model.setBinary([variables["bytesIn"].valueReference], [payload])
+    model.doStep(0.0, 0.1)
+    assert model.getBinary([variables["bytesOut"].valueReference]) == [payload[::-1]]
+
+    model.terminate()
+    model.freeInstance()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("type_name,values", [
+    ("Float32", [0.5, -1.25, 2.0, 1e-3]),
+    ("Int8", [-128, -1, 0, 127]),
+    ("Int16", [-32768, -1, 0, 32767]),
+    ("UInt8", [0, 1, 128, 255]),
+    ("UInt16", [0, 1, 32768, 65535]),
+    ("UInt32", [0, 1, 2147483648, 4294967295]),
+])
+def test_integration_compact_types(tmp_path, type_name, values):
+    script_file = Path(__file__).parent / "slaves/pythonslave_compact.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    assert fmu.exists()
+
+    md = fmpy.read_model_description(fmu)
+    unzip_dir = fmpy.extract(fmu)
+
+    model = fmpy.fmi3.FMU3Slave(
+        guid=md.guid,
+        unzipDirectory=unzip_dir,
+        modelIdentifier=md.coSimulation.modelIdentifier,
+        instanceName='instance1')
+
+    model.instantiate()
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    variables = mapped(md)
+    name = type_name.lower()
+    getter = getattr(model, f"get{type_name}")
+    setter = getattr(model, f"set{type_name}")
+    assert variables[f"{name}_in"].type == type_name
+
+    setter([variables[f"{name}_in"].valueReference], values[-1:])
+    setter([variables[f"{name}_array_in"].valueReference], values)
+    model.doStep(0.0, 0.1)
+
+    if type_name == "Float32":
+        values = [pytest.approx(v, rel=1e-7) for v in values]
+    assert getter([variables[f"{name}_out"].valueReference]) == values[-1:]
+    assert getter([variables[f"{name}_array_out"].valueReference], len(values)) == values[::-1]
+
+    model.terminate()
+    model.freeInstance()
+
+
+@pytest.mark.integration
+def test_integration_scheduled_execution(tmp_path):
+    script_file = Path(__file__).parent / "slaves/pythonslave_clocked.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    assert fmu.exists()
+
+    md = fmpy.read_model_description(fmu)
+    assert md.scheduledExecution is not None
+    assert md.coSimulation is None
+    unzip_dir = fmpy.extract(fmu)
+
+    model = fmpy.fmi3.FMU3ScheduledExecution(
+        guid=md.guid,
+        unzipDirectory=unzip_dir,
+        modelIdentifier=md.scheduledExecution.modelIdentifier,
+        instanceName='instance1')
+
+    model.instantiate()
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    variables = mapped(md)
+    fast = variables["fast"].valueReference
+    slow = variables["slow"].valueReference
+
+    # The slow partition only runs on its own ticks
+    for tick in range(1, 21):
+        model.activateModelPartition(fast, tick * 0.01)
+        if tick % 10 == 0:
+            model.activateModelPartition(slow, tick * 0.01)
+
+    vrs = [variables["fastTicks"].valueReference, variables["slowTicks"].valueReference]
+    assert model.getInt32(vrs) == [20, 2]
+    assert model.getFloat64([variables["lastActivation"].valueReference]) == [pytest.approx(0.2)]
+
+    intervals = (ctypes.c_double * 2)()
+    qualifiers = (ctypes.c_int * 2)()
+    model.getIntervalDecimal((ctypes.c_uint32 * 2)(fast, slow), intervals, qualifiers)
+    assert list(intervals) == [0.01, 0.1]
+    assert list(qualifiers) == [1, 1]
+
+    model.terminate()
+    model.freeInstance()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("event_mode_used", [True, False])
+def test_integration_early_return(tmp_path, event_mode_used):
+    script_file = Path(__file__).parent / "slaves/pythonslave_events.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false", hasEventMode="true", mightReturnEarlyFromDoStep="true")
+    assert fmu.exists()
+
+    md = fmpy.read_model_description(fmu)
+    assert md.coSimulation.hasEventMode
+    assert md.coSimulation.mightReturnEarlyFromDoStep
+    unzip_dir = fmpy.extract(fmu)
+
+    model = fmpy.fmi3.FMU3Slave(
+        guid=md.guid,
+        unzipDirectory=unzip_dir,
+        modelIdentifier=md.coSimulation.modelIdentifier,
+        instanceName='instance1')
+
+    model.instantiate(eventModeUsed=event_mode_used, earlyReturnAllowed=True)
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    ticks = [mapped(md)["ticks"].valueReference]
+
+    # A single large nominal step is cut at each internal event
+    time = 0.0
+    returns = []
+    while time < 1.0:
+        event, terminate, early_return, time = model.doStep(time, 1.0 - time)
+        returns.append(time)
+        assert early_return == (time < 1.0)
+        assert event == event_mode_used
+        if event:
+            model.enterEventMode()
+            model.updateDiscreteStates()
+            model.enterStepMode()
+
+    assert returns == pytest.approx([0.25, 0.5, 0.75, 1.0])
+    assert model.getInt32(ticks) == [4]
+
+    model.terminate()
+    model.freeInstance()
+
+
+@pytest.mark.integration
+def test_integration_early_return_not_allowed(tmp_path):
+    script_file = Path(__file__).parent / "slaves/pythonslave_events.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    md = fmpy.read_model_description(fmu)
+    unzip_dir = fmpy.extract(fmu)
+
+    model = fmpy.fmi3.FMU3Slave(
+        guid=md.guid,
+        unzipDirectory=unzip_dir,
+        modelIdentifier=md.coSimulation.modelIdentifier,
+        instanceName='instance1')
+
+    model.instantiate()
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    assert model.doStep(0.0, 1.0) == (False, False, False, 1.0)
+    assert model.getInt32([mapped(md)["ticks"].valueReference]) == [4]
+
+    model.terminate()
+    model.freeInstance()
+
+
+@pytest.mark.integration
+def test_integration_MX_numpy_arrays(tmp_path):
+    script_file = Path(__file__).parent / "slaves/pythonslaveMX_numpy.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    assert fmu.exists()
+
+    md = fmpy.read_model_description(str(fmu))
+    unzipdir = fmpy.extract(str(fmu))
+    model = fmpy.fmi3.FMU3Model(guid=md.guid,
+                                unzipDirectory=unzipdir,
+                                modelIdentifier=md.modelExchange.modelIdentifier,
+                                instanceName="instance"
+                                )
+    model.instantiate()
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+    model.enterContinuousTimeMode()
+
+    model.setContinuousStates((ctypes.c_double * 2)(0.25, -1.5), 2)
+
+    derivatives = (ctypes.c_double * 2)()
+    model.getContinuousStateDerivatives(derivatives, 2)
+    assert list(derivatives) == [-1.5, -0.25]
+
+    indicators = (ctypes.c_double * 2)()
+    model.getEventIndicators(indicators, 2)
+    assert list(indicators) == [0.25, -1.0]
+
+    nominals = (ctypes.c_double * 2)()
+    model.getNominalsOfContinuousStates(nominals, 2)
+    assert list(nominals) == [2.0, 2.0]
+
+    model.terminate()
+    model.freeInstance()
+
+
+@pytest.mark.integration
+def test_integration_variable_dependencies(tmp_path):
+    script_file = Path(__file__).parent / "slaves/pythonslaveMX_sparse.py"
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path, needsExecutionTool="false")
+    assert fmu.exists()
+
+    md = fmpy.read_model_description(str(fmu))
+    vrs = {v.name: v.valueReference for v in md.modelVariables}
+    derivatives = {d.variable.name: [v.name for v in d.dependencies] for d in md.derivatives}
+    assert derivatives == {"derx0": ["x0", "u"], "derx1": ["x0", "x1"]}
+
+    unzipdir = fmpy.extract(str(fmu))
+    model = fmpy.fmi3.FMU3Model(guid=md.guid,
+                                unzipDirectory=unzipdir,
+                                modelIdentifier=md.modelExchange.modelIdentifier,
+                                instanceName="instance"
+                                )
+    model.instantiate()
+
+    # FMU3Model.getNumberOfVariableDependencies is broken in fmpy, call the FMI functions directly
+    n = ctypes.c_size_t()
+    model.fmi3GetNumberOfVariableDependencies(model.component, vrs["derx1"], ctypes.byref(n))
+    assert n.value == 2
+
+    model.fmi3GetNumberOfVariableDependencies(model.component, vrs["y"], ctypes.byref(n))
+    element_indices, independent_indices = (ctypes.c_size_t * 1)(), (ctypes.c_size_t * 1)()
+    independents, kinds = (ctypes.c_uint32 * 1)(), (ctypes.c_int * 1)()
+    model.fmi3GetVariableDependencies(model.component, vrs["y"], element_indices, independents, independent_indices, kinds, n.value)
+    assert list(independents) == [vrs["x1"]]
+    assert list(element_indices) == list(independent_indices) == [0]
+    assert list(kinds) == [1]  # fmi3Constant
+
+    model.freeInstance()
+
+
+SEQUENCE_DEPENDENCIES_MODEL = """
+from pythonfmu3 import Fmi3Causality, Fmi3SlaveBase, Fmi3Variability, Float64, ModelExchange
+
+
+class SequenceDependencies(Fmi3SlaveBase, ModelExchange):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.time = 0.0
+        self.x = 1.0
+        self.derx = 0.0
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("x", causality=Fmi3Causality.output, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("derx", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=1))
+
+    def get_continuous_state_derivatives(self):
+        self.derx = -self.x
+        return [self.derx]
+
+    def get_variable_dependencies(self, vr):
+        # A tuple of lists rather than a list of tuples
+        return ([0, 1, 0, 0],)
+"""
+
+
+@pytest.mark.integration
+def test_integration_variable_dependencies_sequences(tmp_path):
+    script_file = tmp_path / "sequence_dependencies.py"
+    script_file.write_text(SEQUENCE_DEPENDENCIES_MODEL)
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path / "fmu", needsExecutionTool="false")
+
+    md = fmpy.read_model_description(str(fmu))
+    model = fmpy.fmi3.FMU3Model(guid=md.guid,
+                                unzipDirectory=fmpy.extract(str(fmu)),
+                                modelIdentifier=md.modelExchange.modelIdentifier,
+                                instanceName="instance"
+                                )
+    model.instantiate()
+
+    n = ctypes.c_size_t()
+    model.fmi3GetNumberOfVariableDependencies(model.component, 2, ctypes.byref(n))
+    assert n.value == 1
+    element_indices, independent_indices = (ctypes.c_size_t * 1)(), (ctypes.c_size_t * 1)()
+    independents, kinds = (ctypes.c_uint32 * 1)(), (ctypes.c_int * 1)()
+    model.fmi3GetVariableDependencies(model.component, 2, element_indices, independents, independent_indices, kinds, n.value)
+    assert list(independents) == [1]
+    assert list(kinds) == [0]  # fmi3Dependent
+
+    model.freeInstance()
+
+
+DISCRETE_STATES_MODEL = """
+from types import SimpleNamespace
+
+from pythonfmu3 import Fmi3Causality, Fmi3SlaveBase, Fmi3UpdateDiscreteStatesResult, Fmi3Variability, Float64, ModelExchange
+
+
+class DiscreteStates(Fmi3SlaveBase, ModelExchange):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.time = 0.0
+        self.x = 1.0
+        self.derx = 0.0
+        self.updates = 0
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("x", causality=Fmi3Causality.output, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("derx", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=1))
+
+    def get_continuous_state_derivatives(self):
+        self.derx = -self.x
+        return [self.derx]
+
+    def update_discrete_states(self):
+        self.updates += 1
+        if self.updates == 1:
+            return Fmi3UpdateDiscreteStatesResult(
+                discreteStateNeedsUpdate=True, nominalsOfContinuousStatesChanged=True, nextEventTimeDefined=True, nextEventTime=0.5
+            )
+        # The flags missing from the result are false
+        return SimpleNamespace(terminateSimulation=False)
+"""
+
+
+@pytest.mark.integration
+def test_integration_update_discrete_states(tmp_path):
+    script_file = tmp_path / "discrete_states.py"
+    script_file.write_text(DISCRETE_STATES_MODEL)
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path / "fmu", needsExecutionTool="false")
+
+    md = fmpy.read_model_description(str(fmu))
+    model = fmpy.fmi3.FMU3Model(guid=md.guid,
+                                unzipDirectory=fmpy.extract(str(fmu)),
+                                modelIdentifier=md.modelExchange.modelIdentifier,
+                                instanceName="instance"
+                                )
+    model.instantiate()
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    assert model.updateDiscreteStates() == (True, False, True, False, True, 0.5)
+
+    flags = [ctypes.c_bool(True) for _ in range(5)]
+    next_event_time = ctypes.c_double(0.5)
+    model.fmi3UpdateDiscreteStates(model.component, *(ctypes.byref(flag) for flag in flags), ctypes.byref(next_event_time))
+    assert [flag.value for flag in flags] == [False] * 5
+
+    model.freeInstance()
+
+
+COMPUTED_OUTPUTS_MODEL = """
+from pythonfmu3 import Fmi3Causality, Fmi3Slave, Fmi3Variability, Float64
+
+
+class ComputedOutputs(Fmi3Slave):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.time = 0.0
+        self.x = 1.0
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("y", causality=Fmi3Causality.output), compute=lambda: 2 * self.x)
+
+    def do_step(self, current_time, step_size):
+        self.x += 1.0
+        return True
+
+    def enter_event_mode(self):
+        self.x = 10.0
+
+    def enter_step_mode(self):
+        self.x = 20.0
+"""
+
+COMPUTED_PARTITION_MODEL = """
+from pythonfmu3 import Clock, Fmi3Causality, Fmi3SlaveBase, Fmi3Variability, Float64, ScheduledExecution
+
+
+class ComputedPartition(Fmi3SlaveBase, ScheduledExecution):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.time = 0.0
+        self.tick = False
+        self.x = 1.0
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        tick = Clock("tick", causality=Fmi3Causality.input, interval=0.1)
+        self.register_variable(tick)
+        self.register_variable(Float64("y", causality=Fmi3Causality.output, clocks=[tick]), compute=lambda: 2 * self.x)
+        self.register_partition(tick, self.increment)
+
+    def increment(self, activation_time):
+        self.x += 1.0
+"""
+
+
+@pytest.mark.integration
+def test_integration_computed_outputs(tmp_path):
+    script_file = tmp_path / "computed_outputs.py"
+    script_file.write_text(COMPUTED_OUTPUTS_MODEL)
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path / "fmu", needsExecutionTool="false", hasEventMode="true")
+
+    md = fmpy.read_model_description(str(fmu))
+    model = fmpy.fmi3.FMU3Slave(guid=md.guid,
+                                unzipDirectory=fmpy.extract(str(fmu)),
+                                modelIdentifier=md.coSimulation.modelIdentifier,
+                                instanceName="instance"
+                                )
+    model.instantiate(eventModeUsed=True)
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    # The cached outputs are recomputed after each call advancing the model
+    y = [mapped(md)["y"].valueReference]
+    assert model.getFloat64(y) == [2.0]
+    model.doStep(0.0, 0.1)
+    assert model.getFloat64(y) == [4.0]
+    model.enterEventMode()
+    assert model.getFloat64(y) == [20.0]
+    model.enterStepMode()
+    assert model.getFloat64(y) == [40.0]
+
+    model.terminate()
+    model.freeInstance()
+
+
+@pytest.mark.integration
+def test_integration_computed_outputs_partition(tmp_path):
+    script_file = tmp_path / "computed_partition.py"
+    script_file.write_text(COMPUTED_PARTITION_MODEL)
+    fmu = FmuBuilder.build_FMU(script_file, dest=tmp_path / "fmu", needsExecutionTool="false")
+
+    md = fmpy.read_model_description(str(fmu))
+    model = fmpy.fmi3.FMU3ScheduledExecution(guid=md.guid,
+                                             unzipDirectory=fmpy.extract(str(fmu)),
+                                             modelIdentifier=md.scheduledExecution.modelIdentifier,
+                                             instanceName="instance"
+                                             )
+    model.instantiate()
+    model.enterInitializationMode()
+    model.exitInitializationMode()
+
+    variables = mapped(md)
+    y = [variables["y"].valueReference]
+    assert model.getFloat64(y) == [2.0]
+    model.activateModelPartition(variables["tick"].valueReference, 0.1)
+    assert model.getFloat64(y) == [4.0]
+
+    model.terminate()
+    model.freeInstance()
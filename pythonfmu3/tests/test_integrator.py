@@ -0,0 +1,233 @@
+import math
+import sys
+from typing import List
+
+import pytest
+
+from pythonfmu3 import Fmi3Causality, Fmi3Initial, Fmi3SlaveBase, Fmi3Status, Fmi3UpdateDiscreteStatesResult, Fmi3Variability, Float64, IntegratedCoSimulation, ModelExchange
+
+
+class Dahlquist(IntegratedCoSimulation, Fmi3SlaveBase, ModelExchange):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.time = 0.0
+        self.k = 1.0
+        self.x = 1.0
+        self.derx = 0.0
+
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("x", causality=Fmi3Causality.output, start=1, variability=Fmi3Variability.continuous, initial=Fmi3Initial.exact))
+        self.register_variable(Float64("derx", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=1))
+        self.register_variable(Float64("k", causality=Fmi3Causality.parameter, variability=Fmi3Variability.fixed))
+
+    def get_continuous_state_derivatives(self) -> List[float]:
+        self.derx = -self.k * self.x
+        return [self.derx]
+
+
+class BouncingBall(IntegratedCoSimulation, Fmi3SlaveBase, ModelExchange):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.time = 0.0
+        self.h = 1.0
+        self.v = 0.0
+        self.derh = 0.0
+        self.derv = 0.0
+        self.g = -9.81
+        self.e = 0.7
+        self.bounces = 0
+
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("h", causality=Fmi3Causality.output, start=1, variability=Fmi3Variability.continuous, initial=Fmi3Initial.exact), has_event_indicator=True)
+        self.register_variable(Float64("derh", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=1))
+        self.register_variable(Float64("v", causality=Fmi3Causality.output, start=0, variability=Fmi3Variability.continuous, initial=Fmi3Initial.exact))
+        self.register_variable(Float64("derv", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=3))
+
+    def get_continuous_state_derivatives(self) -> List[float]:
+        self.derh = self.v
+        self.derv = self.g
+        return [self.derh, self.derv]
+
+    def get_event_indicators(self) -> List[float]:
+        return [self.h]
+
+    def update_discrete_states(self):
+        result = Fmi3UpdateDiscreteStatesResult()
+        if self.h <= 0 and self.v < 0:
+            self.h = sys.float_info.min
+            self.v = -self.v * self.e
+            self.bounces += 1
+            result.valuesOfContinuousStatesChanged = True
+        return result
+
+
+class Pulse(IntegratedCoSimulation, Fmi3SlaveBase, ModelExchange):
+    """Integrate an input switched on and off by time events."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.time = 0.0
+        self.u = 0.0
+        self.x = 0.0
+        self.derx = 0.0
+
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("x", causality=Fmi3Causality.output, start=0, variability=Fmi3Variability.continuous, initial=Fmi3Initial.exact))
+        self.register_variable(Float64("derx", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=1))
+
+    def get_continuous_state_derivatives(self) -> List[float]:
+        self.derx = self.u
+        return [self.derx]
+
+    def update_discrete_states(self):
+        # u is 1 between t=0.3 and t=0.6
+        if self.time < 0.3 - 1e-12:
+            self.u = 0.0
+            return Fmi3UpdateDiscreteStatesResult(nextEventTimeDefined=True, nextEventTime=0.3)
+        elif self.time < 0.6 - 1e-12:
+            self.u = 1.0
+            return Fmi3UpdateDiscreteStatesResult(nextEventTimeDefined=True, nextEventTime=0.6)
+        self.u = 0.0
+        return Fmi3UpdateDiscreteStatesResult()
+
+
+@pytest.mark.parametrize("integrator", ["RK45", "BDF", "RK4"])
+def test_IntegratedCoSimulation_dahlquist(integrator):
+    if integrator != "RK4":
+        pytest.importorskip("scipy")
+
+    slave = Dahlquist(instance_name="dahlquist")
+    slave.integrator = integrator
+    slave.integrator_step = 0.01
+    time, step = 0.0, 0.1
+    for _ in range(10):
+        assert slave.do_step(time, step).status == Fmi3Status.ok
+        time += step
+
+    assert slave.time == pytest.approx(1.0)
+    assert slave.x == pytest.approx(math.exp(-1.0), rel=1e-4)
+    # Variables computed with the derivatives are refreshed at the end of the step
+    assert slave.derx == pytest.approx(-slave.x)
+
+
+def test_IntegratedCoSimulation_rk4_without_scipy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "scipy", None)
+    monkeypatch.setitem(sys.modules, "scipy.integrate", None)
+
+    slave = Dahlquist(instance_name="dahlquist")
+    slave.integrator_step = 0.01
+    slave.do_step(0.0, 1.0)
+
+    assert slave.integrator == "RK4"
+    assert slave.x == pytest.approx(math.exp(-1.0), rel=1e-8)
+    assert any(msg.status == Fmi3Status.warning for msg in slave.log_queue)
+
+
+@pytest.mark.parametrize("integrator", ["RK45", "RK4"])
+def test_IntegratedCoSimulation_state_event(integrator):
+    if integrator != "RK4":
+        pytest.importorskip("scipy")
+
+    slave = BouncingBall(instance_name="ball")
+    slave.integrator = integrator
+    slave.integrator_step = 0.01
+    slave.do_step(0.0, 0.5)
+
+    # The ball hits the ground once within the step and bounces back
+    t_bounce = math.sqrt(2.0 / 9.81)
+    v_bounce = 0.7 * 9.81 * t_bounce
+    assert slave.bounces == 1
+    assert slave.v == pytest.approx(v_bounce - 9.81 * (0.5 - t_bounce), rel=1e-5)
+    assert slave.h == pytest.approx(v_bounce * (0.5 - t_bounce) - 9.81 / 2 * (0.5 - t_bounce)**2, rel=1e-4)
+
+
+@pytest.mark.parametrize("integrator", ["RK45", "RK4"])
+def test_IntegratedCoSimulation_time_events(integrator):
+    if integrator != "RK4":
+        pytest.importorskip("scipy")
+
+    slave = Pulse(instance_name="pulse")
+    slave.integrator = integrator
+    slave.do_step(0.0, 1.0)
+
+    assert slave.u == 0.0
+    assert slave.x == pytest.approx(0.3)
+
+
+def test_IntegratedCoSimulation_time_events_rollback():
+
+    class LoggedPulse(Pulse):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.register_variable(Float64("u", causality=Fmi3Causality.local, variability=Fmi3Variability.discrete))
+
+    slave = LoggedPulse(instance_name="pulse")
+    slave.integrator = "RK4"
+    slave.do_step(0.0, 0.2)
+    state = slave._fmu_state_from_bytes(slave._fmu_state_to_bytes(slave._get_fmu_state()))
+    slave.do_step(0.2, 0.8)
+    assert slave.x == pytest.approx(0.3)
+
+    # The pending time event at t=0.3 is restored with the state
+    slave._set_fmu_state(state)
+    slave.do_step(0.2, 0.8)
+    assert slave.x == pytest.approx(0.3)
+
+
+def test_IntegratedCoSimulation_base_order():
+    with pytest.raises(TypeError):
+
+        class Slave(Fmi3SlaveBase, ModelExchange, IntegratedCoSimulation):
+
+            def get_continuous_state_derivatives(self):
+                return []
+
+
+def test_IntegratedCoSimulation_interfaces():
+    xml = Dahlquist(instance_name="dahlquist").to_xml()
+    assert xml.find("ModelExchange") is not None
+    assert xml.find("CoSimulation") is not None
+
+
+def test_IntegratedCoSimulation_output_derivatives():
+    slave = BouncingBall(instance_name="ball")
+    slave.integrator = "RK4"
+    slave.do_step(0.0, 0.1)
+
+    assert slave.get_output_derivatives([1, 3], [1, 1]) == [pytest.approx(slave.v), pytest.approx(-9.81)]
+    option = slave.to_xml().find("CoSimulation").get("maxOutputDerivativeOrder")
+    assert option == "1"
+    with pytest.raises(ValueError):
+        slave.get_output_derivatives([1], [2])
+    # derh is not a continuous state
+    with pytest.raises(ValueError):
+        slave.get_output_derivatives([2], [1])
+
+
+def test_IntegratedCoSimulation_no_output_derivatives():
+
+    class Decay(IntegratedCoSimulation, Fmi3SlaveBase, ModelExchange):
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.time = 0.0
+            self.x = 1.0
+            self.derx = 0.0
+            self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+            self.register_variable(Float64("x", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous))
+            self.register_variable(Float64("derx", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=1))
+
+        def get_continuous_state_derivatives(self):
+            self.derx = -self.x
+            return [self.derx]
+
+    # The only continuous state is not an output
+    slave = Decay(instance_name="decay")
+    assert slave.max_output_derivative_order == 0
+    assert slave.to_xml().find("CoSimulation").get("maxOutputDerivativeOrder") is None
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pytest
+
+from pythonfmu3.builder import instantiate_slave
+from pythonfmu3.master import CoSimulationMaster
+
+GAIN = Path(__file__).parent / "slaves/pythonslave_gain.py"
+
+
+def gain(name):
+    return instantiate_slave(GAIN, GAIN.stem, instance_name=name)
+
+
+def chain(names):
+    master = CoSimulationMaster()
+    slaves = {}
+    for name in names:
+        slaves[name] = gain(name)
+        master.add_slave(name, slaves[name])
+    return master, slaves
+
+
+def test_CoSimulationMaster_levels():
+    master, _ = chain("abcd")
+    # Added out of order: d <- c <- a, b independent
+    master.connect("c", "y", "d", "u")
+    master.connect("a", "y", "c", "u")
+    assert master.levels() == [["a", "b"], ["c"], ["d"]]
+
+    master.connect("d", "y", "a", "u")
+    assert master.levels() == [["b"], ["a", "c", "d"]]
+
+
+def test_CoSimulationMaster_chain():
+    master, slaves = chain("abc")
+    master.connect("b", "y", "c", "u")
+    master.connect("a", "y", "b", "u")
+
+    times = []
+    assert master.run(0.0, 1.0, 0.1, observer=times.append) == pytest.approx(1.0)
+    assert times == pytest.approx([0.1 * (i + 1) for i in range(10)])
+    # The outputs propagate along the chain within each communication step
+    assert [slaves[name].y for name in "abc"] == [1.0, 2.0, 3.0]
+    assert all(slave.steps == 10 for slave in slaves.values())
+
+
+def test_CoSimulationMaster_loop():
+    master, slaves = chain("ab")
+    master.connect("a", "y", "b", "u")
+    master.connect("b", "y", "a", "u")
+
+    master.run(0.0, 0.3, 0.1)
+    # Loop inputs are taken from the previous communication point:
+    # initialization gives y = (1, 1), then each step adds one
+    assert (slaves["a"].y, slaves["b"].y) == (4.0, 4.0)
+
+
+def test_CoSimulationMaster_terminate():
+    master, slaves = chain("ab")
+    master.set_start_value("b", "stop_after", 3)
+    assert master.run(0.0, 1.0, 0.1) == pytest.approx(0.3)
+    assert slaves["a"].steps == 3
+
+
+def test_CoSimulationMaster_invalid_connections():
+    master, _ = chain("ab")
+    with pytest.raises(ValueError):
+        master.connect("a", "y", "c", "u")
+    with pytest.raises(ValueError):
+        master.add_slave("a", gain("a"))
+
+    master.connect("a", "y", "b", "unknown")
+    with pytest.raises(ValueError):
+        master.run(0.0, 1.0, 0.1)
+
+    master, _ = chain("ab")
+    master.connect("a", "steps", "b", "u")
+    with pytest.raises(TypeError):
+        master.run(0.0, 1.0, 0.1)
+
+
+def test_CoSimulationMaster_process_slaves():
+    master = CoSimulationMaster()
+    master.add_process_slave("a", GAIN)
+    master.add_process_slave("b", GAIN)
+    local = gain("c")
+    master.add_slave("c", local)
+    master.set_start_value("a", "u", 10.0)
+    master.connect("a", "y", "b", "u")
+    master.connect("b", "y", "c", "u")
+
+    assert master.run(0.0, 0.5, 0.1) == pytest.approx(0.5)
+    assert (local.y, local.steps) == (13.0, 5)
@@ -0,0 +1,107 @@
+import csv
+import math
+from pathlib import Path
+
+import pytest
+
+from pythonfmu3.simulate import simulate
+
+SLAVES = Path(__file__).parent / "slaves"
+EXAMPLES = Path(__file__).parent.parent.parent / "examples"
+
+
+def test_simulate_cosimulation(tmp_path):
+    output = tmp_path / "results.csv"
+    res = simulate(SLAVES / "pythonslave.py", stop_time=0.5, step_size=0.1, output=output)
+
+    assert res["time"] == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4, 0.5])
+    assert res["realOut"][-1] == pytest.approx(res["time"][-1], rel=1e-7)
+    assert set(res) == {"time", "intOut", "realOut"}
+
+    with open(output, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["time", "intOut", "realOut"]
+    assert len(rows) == len(res["time"]) + 1
+
+
+def test_simulate_model_exchange():
+    step_size = 1e-3
+    res = simulate(SLAVES / "pythonslaveMX.py", stop_time=1.0, step_size=step_size)
+
+    assert res["time"][-1] == pytest.approx(1.0)
+    assert res["x"][-1] == pytest.approx((1.0 - step_size) ** 1000, rel=1e-9)
+    assert res["x"][-1] == pytest.approx(math.exp(-1.0), rel=1e-2)
+
+
+def test_simulate_model_exchange_events():
+    res = simulate(EXAMPLES / "bouncingBall_me.py", stop_time=1.0, step_size=1e-3, variables=["ball.h", "ball.v"])
+
+    # The ball bounces once around t = sqrt(2 / 9.81)
+    assert min(res["ball.h"]) > -0.02
+    assert max(res["ball.v"]) > 0.0
+    assert res["ball.h"][-1] > 0.0
+
+
+STALE_EVENT_MODEL = """
+from pythonfmu3 import Fmi3Causality, Fmi3SlaveBase, Fmi3UpdateDiscreteStatesResult, Fmi3Variability, Float64, ModelExchange
+
+
+class StaleEvent(Fmi3SlaveBase, ModelExchange):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.time = 0.0
+        self.x = 0.0
+        self.derx = 1.0
+        self.updates = 0.0
+        self.register_variable(Float64("time", causality=Fmi3Causality.independent, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("x", causality=Fmi3Causality.output, variability=Fmi3Variability.continuous))
+        self.register_variable(Float64("derx", causality=Fmi3Causality.local, variability=Fmi3Variability.continuous, derivative=1))
+        self.register_variable(Float64("updates", causality=Fmi3Causality.output, variability=Fmi3Variability.discrete))
+
+    def get_continuous_state_derivatives(self):
+        return [self.derx]
+
+    def update_discrete_states(self):
+        self.updates += 1
+        return Fmi3UpdateDiscreteStatesResult(nextEventTimeDefined=True, nextEventTime=self.next_event_time())
+
+    def next_event_time(self):
+        return {next_event_time}
+"""
+
+
+@pytest.mark.parametrize("next_event_time", ["0.0", "self.time"])
+def test_simulate_model_exchange_stale_next_event(tmp_path, next_event_time):
+    script_file = tmp_path / "stale_event.py"
+    script_file.write_text(STALE_EVENT_MODEL.format(next_event_time=next_event_time))
+
+    res = simulate(script_file, stop_time=1.0, step_size=0.1)
+    assert res["time"][-1] == pytest.approx(1.0)
+    assert res["x"][-1] == pytest.approx(1.0)
+    assert res["updates"][-1] == 1.0
+
+
+def test_simulate_model_exchange_too_many_events(tmp_path):
+    script_file = tmp_path / "stale_event.py"
+    script_file.write_text(STALE_EVENT_MODEL.format(next_event_time="self.time + 1e-9"))
+
+    with pytest.raises(RuntimeError):
+        simulate(script_file, stop_time=1.0, step_size=0.1)
+
+
+def test_simulate_array_outputs():
+    pytest.importorskip("numpy")
+    res = simulate(SLAVES / "pythonslave_arraytypes.py", stop_time=0.1, step_size=0.1, variables=["float64_output"])
+
+    assert [res[f"float64_output[{i}]"][-1] for i in range(10)] == [float(i) for i in range(1, 11)]
+
+
+def test_simulate_invalid_fmi_type():
+    with pytest.raises(ValueError):
+        simulate(SLAVES / "pythonslaveMX.py", fmi_type="CoSimulation")
+
+
+def test_simulate_unknown_variable():
+    with pytest.raises(ValueError):
+        simulate(SLAVES / "pythonslave.py", variables=["notAVariable"])
@@ -7,8 +7,8 @@ import ctypes
 from xml.etree import ElementTree
 
 from pythonfmu3 import Fmi3Slave
-from pythonfmu3.enums import Fmi3Causality, Fmi3Initial, Fmi3Variability
-from pythonfmu3.variables import flatten, Boolean, Int32, UInt64, Float64, ModelVariable, String, Dimension
+from pythonfmu3.enums import Fmi3Causality, Fmi3DependencyKind, Fmi3Initial, Fmi3IntervalQualifier, Fmi3IntervalVariability, Fmi3Variability
+from pythonfmu3.variables import flatten, Binary, Boolean, Clock, Int8, Int16, Int32, UInt8, UInt16, UInt32, UInt64, Float32, Float64, ModelVariable, String, Dimension
 
 from .utils import PY2FMI, UInt64ValType
 
@@ -47,6 +47,7 @@ def test_ModelVariable_constructor(causality, initial, variability, name, descri
     (UInt64, UInt64ValType(23)),
     (Float64, 2./3.),
     (String, "hello_world"),
+    (Binary, b"\x00binary\xff"),
 ])
 def test_ModelVariable_getter(fmi_type, value):
 
@@ -63,7 +64,7 @@ def test_ModelVariable_getter(fmi_type, value):
     fmi_type_name = fmi_type.__qualname__.lower()
 
     slave = Slave(instance_name="slaveInstance")
-    assert [getattr(val, "value", val) for val in getattr(slave, f"get_{fmi_type_name}")([0])] == [value]
+    assert getattr(slave, f"get_{fmi_type_name}")([0]) == [value]
 
 
 @pytest.mark.parametrize("fmi_type,value", [
@@ -71,7 +72,8 @@ def test_ModelVariable_getter(fmi_type, value):
     (Int32, 22),
     (UInt64, UInt64ValType(23)),
     (Float64, 2./3.),
-    (String, "hello_world")
+    (String, "hello_world"),
+    (Binary, b"\x00binary\xff"),
 ])
 def test_ModelVariable_setter(fmi_type, value):
 
@@ -96,7 +98,7 @@ def test_ModelVariable_setter(fmi_type, value):
 
     set_method = getattr(slave, f"set_{fmi_type_name}")
     set_method([0, ], [value, ])
-    assert [getattr(val, "value", val) for val in getattr(slave, f"get_{fmi_type_name}")([0])] == [value]
+    assert getattr(slave, f"get_{fmi_type_name}")([0]) == [value]
 
 @pytest.mark.requirements("numpy")  
 @pytest.mark.parametrize("fmi_type,value,dims", [
@@ -119,7 +121,7 @@ def test_ModelVariable_getter_array(fmi_type, value, dims):
     fmi_type_name = fmi_type.__qualname__.lower()
 
     slave = Slave(instance_name="slaveInstance")
-    assert [getattr(val, "value", val) for val in getattr(slave, f"get_{fmi_type_name}")([0])] == value
+    assert getattr(slave, f"get_{fmi_type_name}")([0]) == value
 
 
 @pytest.mark.requirements("numpy")  
@@ -152,7 +154,7 @@ def test_ModelVariable_setter_array(fmi_type, value, dims):
 
     set_method = getattr(slave, f"set_{fmi_type_name}")
     set_method([0, ], value)
-    assert [getattr(val, "value", val) for val in getattr(slave, f"get_{fmi_type_name}")([0])] == value
+    assert getattr(slave, f"get_{fmi_type_name}")([0]) == value
 
 @pytest.mark.parametrize("causality", list(Fmi3Causality) + [None])
 @pytest.mark.parametrize("initial", list(Fmi3Initial) + [None])
@@ -183,7 +185,13 @@ def test_ModelVariable_to_xml(causality, initial, variability, name, description
     (Int32, 23),
     (UInt64, UInt64ValType(23)),
     (Float64, 15.),
-    (String, "hello")])
+    (String, "hello"),
+    (Float32, 0.5),
+    (Int8, -3),
+    (Int16, 300),
+    (UInt8, 200),
+    (UInt16, 60000),
+    (UInt32, 4000000000)])
 @pytest.mark.parametrize("causality", list(Fmi3Causality) + [None])
 @pytest.mark.parametrize("initial", list(Fmi3Initial) + [None])
 @pytest.mark.parametrize("variability", list(Fmi3Variability) + [None])
@@ -277,6 +285,25 @@ def test_Real_to_xml(name, start):
         assert xml.attrib['start'] == f"{start:.16g}"
 
 
+@pytest.mark.parametrize("var_type,start,expected", [
+    (Float32, None, None),
+    (Float32, 0.1, "0.100000001"),
+    (Int8, -128, "-128"),
+    (Int16, 32767, "32767"),
+    (UInt8, 255, "255"),
+    (UInt16, 65535, "65535"),
+    (UInt32, 4294967295, "4294967295"),
+])
+def test_compact_types_to_xml(var_type, start, expected):
+    if var_type is Float32 and start is not None:
+        np = pytest.importorskip("numpy")
+        start = np.float32(start)
+    r = var_type("compact", start)
+    xml = r.to_xml()
+    assert xml.tag == var_type.__name__
+    assert xml.attrib.get('start') == expected
+
+
 @pytest.mark.parametrize("name,start", [
     ("string_name", None),
     ("string_another_name", "dummy"),
@@ -300,6 +327,86 @@ def test_String_to_xml(name, start):
         assert start_elements[0].attrib['value'] == str(start)
 
 
+@pytest.mark.parametrize("name,start,mime_type,max_size", [
+    ("binary_name", None, None, None),
+    ("binary_another_name", b"\x00\x01\xfe\xff", "image/png", 1024),
+    ("binary_bytearray", bytearray(b"dummy"), None, None),
+])
+def test_Binary_to_xml(name, start, mime_type, max_size):
+    r = Binary(name, start, mime_type=mime_type, max_size=max_size)
+    xml = r.to_xml()
+    assert xml.tag == "Binary"
+    assert xml.attrib.get("mimeType") == mime_type
+    assert xml.attrib.get("maxSize") == (None if max_size is None else str(max_size))
+    start_elements = xml.findall('.//Start')
+    if start is not None:
+        assert len(start_elements) == 1
+        assert bytes.fromhex(start_elements[0].attrib['value']) == bytes(start)
+    else:
+        assert len(start_elements) == 0
+
+
+def test_Clock_to_xml():
+    clock = Clock("tick", causality=Fmi3Causality.input, interval=0.1, priority=2, can_be_deactivated=False)
+    clock.value_reference = 3
+    xml = clock.to_xml()
+    assert xml.tag == "Clock"
+    assert xml.attrib["variability"] == "discrete"
+    assert xml.attrib["intervalVariability"] == "constant"
+    assert xml.attrib["intervalDecimal"] == "0.1"
+    assert xml.attrib["priority"] == "2"
+    assert xml.attrib["canBeDeactivated"] == "false"
+    assert "shiftDecimal" not in xml.attrib
+    assert "start" not in xml.attrib
+
+    counter = Int32("counter", clocks=[clock])
+    assert counter.to_xml().attrib["clocks"] == "3"
+
+
+def test_Clock_interval_qualifier():
+    clock = Clock("tick", interval_variability=Fmi3IntervalVariability.changing).new_state()
+    assert clock.pop_interval() == (0.0, Fmi3IntervalQualifier.intervalNotYetKnown)
+
+    clock.interval = 0.5
+    assert clock.pop_interval() == (0.5, Fmi3IntervalQualifier.intervalChanged)
+    assert clock.pop_interval() == (0.5, Fmi3IntervalQualifier.intervalUnchanged)
+
+    # Intervals set by the importer are not reported back as changed
+    clock.set_interval(0.25)
+    assert clock.pop_interval() == (0.25, Fmi3IntervalQualifier.intervalUnchanged)
+
+
+def test_ModelVariable_dependencies():
+    x = Float64("x")
+    der_x = Float64("der(x)", dependencies=[x], dependencies_kind=[Fmi3DependencyKind.fixed])
+    assert der_x.dependencies == [x]
+    assert der_x.dependencies_kind == [Fmi3DependencyKind.fixed]
+    # Dependencies belong to the ModelStructure, not to the variable element
+    assert "dependencies" not in der_x.to_xml().attrib
+
+    with pytest.raises(ValueError):
+        Float64("y", dependencies_kind=[Fmi3DependencyKind.fixed])
+    with pytest.raises(ValueError):
+        Float64("y", dependencies=[x], dependencies_kind=[])
+
+
+@pytest.mark.parametrize("var", [
+    Float64("x", start=1.0, derivative=1), Float32("x"), Int8("x"), Int16("x"), Int32("x"), UInt8("x"), UInt16("x"),
+    UInt32("x"), UInt64("x"), Boolean("x"), String("x", start="a"), Binary("x", start=b"a"), Clock("x"),
+])
+def test_ModelVariable_slots(var):
+    # Large interfaces hold one object per variable: no per-instance dictionary
+    assert not hasattr(var, "__dict__")
+    with pytest.raises(AttributeError):
+        var.unknown_attribute = 1
+
+
+def test_ModelVariable_to_xml_attribute_order():
+    var = Float64("x", causality=Fmi3Causality.output, start=1.0, derivative=2, unit="m", description="position")
+    var.value_reference = 4
+    assert list(var.to_xml().attrib) == ["name", "valueReference", "description", "causality", "start", "derivative", "unit"]
+
+
 @pytest.mark.requirements("numpy")  
 @pytest.mark.parametrize("name,start,dims", [
     ("array1", [1.,2.,3.,4.], [4]),
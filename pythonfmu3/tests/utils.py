@@ -1,4 +1,4 @@
-from pythonfmu3.variables import Boolean, Int32, UInt64, Float64, ModelVariable, String
+from pythonfmu3.variables import Binary, Boolean, Int32, UInt64, Float64, ModelVariable, String
 
 class UInt64ValType(int): pass
 
@@ -9,5 +9,6 @@ FMI2PY = dict((
     (Float64, float),
     (String, str),
     (UInt64, UInt64ValType),
+    (Binary, bytes),
 ))
 PY2FMI = dict([(v, k) for k, v in FMI2PY.items()])
@@ -2,13 +2,12 @@
 from abc import ABC
 from enum import Enum
 import importlib
-from typing import Any, Optional, List
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from xml.etree.ElementTree import Element, SubElement
 from collections.abc import Iterable
-from collections import ChainMap
 from functools import reduce  
 
-from .enums import Fmi3Causality, Fmi3Initial, Fmi3Variability
+from .enums import Fmi3Causality, Fmi3DependencyKind, Fmi3Initial, Fmi3IntervalQualifier, Fmi3IntervalVariability, Fmi3Variability
 
 MAX_LENGTH = 1000
 
@@ -34,7 +33,21 @@ class ModelVariable(ABC):
         description (str, optional): Variable description
         initial (:obj:`Fmi3Initial`, optional): Variable initial status
         variability (:obj:`Fmi3Variability`, optional): Variable variability
+        clocks (List[Clock], optional): Clocks the variable is assigned to
+        dependencies (List[ModelVariable], optional): Variables this unknown depends on, an empty list for none -
+            None if it may depend on all the knowns
+        dependencies_kind (List[Fmi3DependencyKind], optional): Kind of each of the dependencies
     """
+    # Interfaces generated from large libraries hold 100k+ variables: the attributes are stored
+    # in slots rather than per-variable dictionaries
+    __slots__ = (
+        "getter", "setter", "instance_getter", "instance_setter", "clocks", "dependencies", "dependencies_kind",
+        "local_name", "_name", "_value_reference", "_description", "_causality", "_variability", "_initial",
+        "_declared_type",
+    )
+    # Name of the XML element
+    _type: Optional[str] = None
+
     def __init__(
         self,
         name: str,
@@ -44,75 +57,81 @@ class ModelVariable(ABC):
         variability: Optional[Fmi3Variability] = None,
         declared_type: Optional[str] = None,
         getter: Any = None,
-        setter: Any = None
+        setter: Any = None,
+        clocks: Optional[List['ModelVariable']] = None,
+        dependencies: Optional[List['ModelVariable']] = None,
+        dependencies_kind: Optional[List[Fmi3DependencyKind]] = None
     ):
+        if dependencies_kind is not None and (dependencies is None or len(dependencies_kind) != len(dependencies)):
+            raise ValueError("dependencies_kind must have one entry per dependency")
         self.getter = getter
         self.setter = setter
-        self._type = None
+        # Accessors taking the model instance, bound once per class for variables declared in `model_variables`
+        self.instance_getter = None
+        self.instance_setter = None
+        self.clocks = clocks
+        self.dependencies = dependencies
+        self.dependencies_kind = dependencies_kind
         self.local_name = name.split(".")[-1]
         
         # demanagle names
         self.local_name = self.local_name.lstrip('_')
 
-
-        self.__attrs = {
-            "name": name,
-            "valueReference": None,
-            "description": description,
-            "causality": causality,
-            "variability": variability,
-            "initial": initial,
-            "declaredType": declared_type,
-            # 'canHandleMultipleSetPerTimeInstant': # Only for ME
-        }
-        self._extras = {}
+        self._name = name
+        self._value_reference = None
+        self._description = description
+        self._causality = causality
+        self._variability = variability
+        self._initial = initial
+        self._declared_type = declared_type
+        # 'canHandleMultipleSetPerTimeInstant': # Only for ME
 
     @property
     def causality(self) -> Optional[Fmi3Causality]:
         """:obj:`Fmi3Causality` or None: Variable causality - None if not set"""
-        return self.__attrs["causality"]
+        return self._causality
 
     @property
     def description(self) -> Optional[str]:
         """str or None: Variable description - None if not set"""
-        return self.__attrs["description"]
+        return self._description
 
     @property
     def initial(self) -> Optional[Fmi3Initial]:
         """:obj:`Fmi3Initial` or None: Variable initial status - None if not set"""
-        return self.__attrs["initial"]
+        return self._initial
 
     @property
     def name(self) -> str:
         """str: Variable name"""
-        return self.__attrs["name"]
+        return self._name
 
     @property
     def value_reference(self) -> int:
         """int: Variable reference index"""
-        return self.__attrs["valueReference"]
+        return self._value_reference
 
     @value_reference.setter
     def value_reference(self, value: int):
-        if self.__attrs["valueReference"] is not None:
+        if self._value_reference is not None:
             raise RuntimeError("Value reference already set.")
-        self.__attrs["valueReference"] = value
+        self._value_reference = value
 
     @property
     def declared_type(self) -> str:
         """str: declared type"""
-        return self.__attrs["declaredType"]
+        return self._declared_type
 
     @declared_type.setter
     def declared_type(self, value: str):
-        if self.__attrs["declaredType"] is not None:
+        if self._declared_type is not None:
             raise RuntimeError("Declared type already set.")
-        self.__attrs["declaredType"] = value
+        self._declared_type = value
     
     @property
     def variability(self) -> Optional[Fmi3Variability]:
         """:obj:`Fmi3Variability` or None: Variable variability - None if not set"""
-        return self.__attrs["variability"]
+        return self._variability
     
     @staticmethod
     def requires_start(v: 'ModelVariable') -> bool:
@@ -132,13 +151,31 @@ class ModelVariable(ABC):
     def to_xml(self) -> Element:
         """Convert the variable to XML node.
 
+        Variables with a start value accept a `start` argument written instead of their own start value.
+
         Returns
             xml.etree.ElementTree.Element: XML node
         """
+        return self._to_xml({})
+
+    def _to_xml(self, extras: Dict[str, str]) -> Element:
+        # XML node with the common attributes followed by the attributes of the variable type
+        attrs = {
+            "name": self._name,
+            "valueReference": self._value_reference,
+            "description": self._description,
+            "causality": self._causality,
+            "variability": self._variability,
+            "initial": self._initial,
+            "declaredType": self._declared_type,
+        }
+        attrs.update(extras)
         attrib = dict()
-        for key, value in ChainMap(self._extras, self.__attrs).items():
+        for key, value in attrs.items():
             if value is not None:
                 attrib[key] = str(value.name if isinstance(value, Enum) else value)
+        if self.clocks:
+            attrib["clocks"] = " ".join(str(clock.value_reference) for clock in self.clocks)
         return Element(self._type, attrib)
 
     def __repr__(self) -> str:
@@ -148,6 +185,8 @@ class ModelVariable(ABC):
                f"variability={self.variability})"
 
 class Start(object):
+    __slots__ = ("value",)
+
     def __init__(self, startValue):
         self.value = startValue
     
@@ -157,6 +196,8 @@ class Start(object):
         return Element("Start", attrib)
 
 class Dimension(object):
+    __slots__ = ("start", "value_reference")
+
     def __init__(self, start: str = "", valueReference: str = ""):
         if start and valueReference and any((start, valueReference)):
             raise RuntimeError("start and valueReference attributes are mutally exclusive for Dimension element")
@@ -164,12 +205,12 @@ class Dimension(object):
         self.start = start
         self.value_reference = valueReference
 
-    def size(self, vars : List[ModelVariable]):
+    def size(self, vars : List[ModelVariable], owner: Any = None):
         if self.start:
             return self.start
         else:
-            result = next((value for vr, value in vars.items() if vr == int(self.value_reference)), None)  
-            return result.getter()
+            result = vars[int(self.value_reference)]
+            return result.getter() if result.getter is not None else result.instance_getter(owner)
 
     def to_xml(self) -> Element:
         attrib = dict()
@@ -182,6 +223,9 @@ class Dimension(object):
         return ele
 
 class Arrayable(object):
+    # The `_dimensions` slot is declared by the variable classes
+    __slots__ = ()
+
     def __init__(self, dimensions : List[Dimension] = [], **kwargs):
         if dimensions:
             check_numpy()
@@ -203,24 +247,27 @@ class Arrayable(object):
     def dimensions_xml(self) -> List[Element]:
         return [dim.to_xml() for dim in self._dimensions]
 
-    def size(self, vars):
-        return reduce(lambda x, dim: x * int(dim.size(vars)), self._dimensions, 1)
+    def size(self, vars, owner: Any = None):
+        return reduce(lambda x, dim: x * int(dim.size(vars, owner)), self._dimensions, 1)
 
 class Float64(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start", "_derivative", "_unit")
+    _type = "Float64"
+
     def __init__(self, name: str, start: Optional[Any] = None, derivative: Optional[Any] = None, dimensions: List[Dimension] = [], unit: Optional[str] = None, **kwargs):
         ModelVariable.__init__(self, name, **kwargs)
         Arrayable.__init__(self, dimensions)
-        self.__attrs = {"start": start, "derivative": derivative}
-        self._type = "Float64"
+        self._start = start
+        self._derivative = derivative
         self._unit = unit
 
     @property
     def start(self) -> Optional[Any]:
-        return self.__attrs["start"]
+        return self._start
 
     @start.setter
     def start(self, value: float):
-        self.__attrs["start"] = value
+        self._start = value
     
     @property
     def unit(self) -> Optional[Any]:
@@ -232,11 +279,12 @@ class Float64(ModelVariable, Arrayable):
 
     @property
     def derivative(self):
-        return self.__attrs["derivative"]
+        return self._derivative
 
-    def to_xml(self) -> Element:
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
         attrib = dict()
-        for key, value in self.__attrs.items():
+        for key, value in (("start", start), ("derivative", self._derivative)):
             if value is not None:
                 # In order to not loose precision, a number of this type should be
                 # stored on an XML file with at least 16 significant digits
@@ -246,117 +294,303 @@ class Float64(ModelVariable, Arrayable):
         if self.unit:
             attrib["unit"] = self.unit
 
-        self._extras = attrib
-        parent = super().to_xml()
+        parent = self._to_xml(attrib)
 
         parent.extend(self.dimensions_xml())
 
         return parent
     
 
+class Float32(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start", "_unit")
+    _type = "Float32"
+
+    def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], unit: Optional[str] = None, **kwargs):
+        ModelVariable.__init__(self, name, **kwargs)
+        Arrayable.__init__(self, dimensions)
+        self._start = start
+        self._unit = unit
+
+    @property
+    def start(self) -> Optional[Any]:
+        return self._start
+
+    @start.setter
+    def start(self, value: float):
+        self._start = value
+
+    @property
+    def unit(self) -> Optional[Any]:
+        return self._unit
+
+    @unit.setter
+    def unit(self, value: str):
+        self._unit = value
+
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
+        attrib = dict()
+        if start is not None:
+            # A single precision number needs 9 significant digits to round-trip
+            attrib["start"] = self.get_start_str(start, lambda v: f"{v:.9g}")
+
+        if self.unit:
+            attrib["unit"] = self.unit
+
+        parent = self._to_xml(attrib)
+
+        parent.extend(self.dimensions_xml())
+
+        return parent
+
+
+class Int8(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start")
+    _type = "Int8"
+
+    def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
+        ModelVariable.__init__(self, name, **kwargs)
+        Arrayable.__init__(self, dimensions, **kwargs)
+        self._start = start
+
+    @property
+    def start(self) -> Optional[Any]:
+        return self._start
+
+    @start.setter
+    def start(self, value: int):
+        self._start = value
+
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
+        attrib = dict()
+        if start is not None:
+            attrib["start"] = self.get_start_str(start, lambda v: str(v))
+        parent = self._to_xml(attrib)
+
+        parent.extend(self.dimensions_xml())
+
+        return parent
+
+class Int16(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start")
+    _type = "Int16"
+
+    def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
+        ModelVariable.__init__(self, name, **kwargs)
+        Arrayable.__init__(self, dimensions, **kwargs)
+        self._start = start
+
+    @property
+    def start(self) -> Optional[Any]:
+        return self._start
+
+    @start.setter
+    def start(self, value: int):
+        self._start = value
+
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
+        attrib = dict()
+        if start is not None:
+            attrib["start"] = self.get_start_str(start, lambda v: str(v))
+        parent = self._to_xml(attrib)
+
+        parent.extend(self.dimensions_xml())
+
+        return parent
+
 class Int32(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start")
+    _type = "Int32"
+
     def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
         ModelVariable.__init__(self, name, **kwargs)
         Arrayable.__init__(self, dimensions, **kwargs)
-        self.__attrs = {"start": start}
-        self._type = "Int32";
+        self._start = start
 
     @property
     def start(self) -> Optional[Any]:
-        return self.__attrs["start"]
+        return self._start
 
     @start.setter
     def start(self, value: int):
-        self.__attrs["start"] = value
+        self._start = value
 
-    def to_xml(self) -> Element:
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
         attrib = dict()
-        for key, value in self.__attrs.items():
-            if value is not None:
-                attrib[key] = self.get_start_str(value, lambda v: str(v))
-        self._extras = attrib
-        parent = super().to_xml()
+        if start is not None:
+            attrib["start"] = self.get_start_str(start, lambda v: str(v))
+        parent = self._to_xml(attrib)
         
         parent.extend(self.dimensions_xml())
 
         return parent
         
 class Int64(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start")
+    _type = "Int64"
+
     def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
         ModelVariable.__init__(self, name, **kwargs)
         Arrayable.__init__(self, dimensions, **kwargs)
-        self.__attrs = {"start": start}
-        self._type = "Int64";
+        self._start = start
 
     @property
     def start(self) -> Optional[Any]:
-        return self.__attrs["start"]
+        return self._start
 
     @start.setter
     def start(self, value: int):
-        self.__attrs["start"] = value
+        self._start = value
 
-    def to_xml(self) -> Element:
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
         attrib = dict()
-        for key, value in self.__attrs.items():
-            if value is not None:
-                attrib[key] = self.get_start_str(value, lambda v: str(v))
-        self._extras = attrib
-        parent = super().to_xml()
+        if start is not None:
+            attrib["start"] = self.get_start_str(start, lambda v: str(v))
+        parent = self._to_xml(attrib)
+
+        parent.extend(self.dimensions_xml())
+
+        return parent
+
+class UInt8(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start")
+    _type = "UInt8"
+
+    def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
+        ModelVariable.__init__(self, name, **kwargs)
+        Arrayable.__init__(self, dimensions, **kwargs)
+        self._start = start
+
+    @property
+    def start(self) -> Optional[Any]:
+        return self._start
+
+    @start.setter
+    def start(self, value: int):
+        self._start = value
+
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
+        attrib = dict()
+        if start is not None:
+            attrib["start"] = self.get_start_str(start, lambda v: str(v))
+        parent = self._to_xml(attrib)
+
+        parent.extend(self.dimensions_xml())
+
+        return parent
+
+class UInt16(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start")
+    _type = "UInt16"
+
+    def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
+        ModelVariable.__init__(self, name, **kwargs)
+        Arrayable.__init__(self, dimensions, **kwargs)
+        self._start = start
+
+    @property
+    def start(self) -> Optional[Any]:
+        return self._start
+
+    @start.setter
+    def start(self, value: int):
+        self._start = value
+
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
+        attrib = dict()
+        if start is not None:
+            attrib["start"] = self.get_start_str(start, lambda v: str(v))
+        parent = self._to_xml(attrib)
+
+        parent.extend(self.dimensions_xml())
+
+        return parent
+
+class UInt32(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start")
+    _type = "UInt32"
+
+    def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
+        ModelVariable.__init__(self, name, **kwargs)
+        Arrayable.__init__(self, dimensions, **kwargs)
+        self._start = start
+
+    @property
+    def start(self) -> Optional[Any]:
+        return self._start
+
+    @start.setter
+    def start(self, value: int):
+        self._start = value
+
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
+        attrib = dict()
+        if start is not None:
+            attrib["start"] = self.get_start_str(start, lambda v: str(v))
+        parent = self._to_xml(attrib)
 
         parent.extend(self.dimensions_xml())
 
         return parent
 
 class UInt64(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start")
+    _type = "UInt64"
+
     def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
         ModelVariable.__init__(self, name, **kwargs)
         Arrayable.__init__(self, dimensions, **kwargs)
-        self.__attrs = {"start": start}
-        self._type = "UInt64";
+        self._start = start
 
     @property
     def start(self) -> Optional[Any]:
-        return self.__attrs["start"]
+        return self._start
 
     @start.setter
     def start(self, value: int):
-        self.__attrs["start"] = value
+        self._start = value
 
-    def to_xml(self) -> Element:
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
         attrib = dict()
-        for key, value in self.__attrs.items():
-            if value is not None:
-                attrib[key] = self.get_start_str(value, lambda v: str(v))
-        self._extras = attrib
-        parent = super().to_xml()
+        if start is not None:
+            attrib["start"] = self.get_start_str(start, lambda v: str(v))
+        parent = self._to_xml(attrib)
 
         parent.extend(self.dimensions_xml())
 
         return parent
     
 class Boolean(ModelVariable, Arrayable):
+    __slots__ = ("_dimensions", "_start")
+    _type = "Boolean"
+
     def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
         ModelVariable.__init__(self, name, **kwargs)
         Arrayable.__init__(self, dimensions, **kwargs)
-        self.__attrs = {"start": start}
-        self._type = "Boolean"
+        self._start = start
 
     @property
     def start(self) -> Optional[Any]:
-        return self.__attrs["start"]
+        return self._start
 
     @start.setter
     def start(self, value: float):
-        self.__attrs["start"] = value
+        self._start = value
 
-    def to_xml(self) -> Element:
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
         attrib = dict()
-        for key, value in self.__attrs.items():
-            if value is not None:
-                attrib[key] = self.get_start_str(value, lambda v: str(v).lower())
-        self._extras = attrib
-        parent = super().to_xml()
+        if start is not None:
+            attrib["start"] = self.get_start_str(start, lambda v: str(v).lower())
+        parent = self._to_xml(attrib)
         
         parent.extend(self.dimensions_xml())
 
@@ -364,61 +598,323 @@ class Boolean(ModelVariable, Arrayable):
 
 
 class String(ModelVariable):
+    __slots__ = ("_start",)
+    _type = "String"
+
     def __init__(self, name: str, start: Optional[Any] = None, dimensions: List[Dimension] = [], **kwargs):
         ModelVariable.__init__(self, name, **kwargs)
-        self.__attrs = dict()
-        self._type = "String"
-        self._start = Start(start)
+        self._start = start
 
     @property
     def start(self) -> Optional[Any]:
-        return self._start.value
+        return self._start
 
     @start.setter
     def start(self, value: float):
-        self._start.value = value
+        self._start = value
 
-    def to_xml(self) -> Element:
-        attrib = dict()
-        for key, value in self.__attrs.items():
-            if value is not None:
-                attrib[key] = str(value, lambda v: str(v))
-        self._extras = attrib
-        parent = super().to_xml()
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
+        parent = self._to_xml({})
         
-        if self.start is not None:
-            parent.append(self._start.to_xml())
+        if start is not None:
+            parent.append(Start(start).to_xml())
         
         return parent
     
+class Binary(ModelVariable):
+    """Binary variable, its value is any object exposing the buffer protocol.
+
+    `bytes` and `bytearray` values are passed to the importer without copy.
+
+    Args:
+        name (str): Variable name
+        start (bytes, optional): Start value
+        mime_type (str, optional): MIME type of the value (default application/octet-stream)
+        max_size (int, optional): Maximal size of the value in bytes
+    """
+    __slots__ = ("_start", "_mime_type", "_max_size")
+    _type = "Binary"
+
+    def __init__(self, name: str, start: Optional[Any] = None, mime_type: Optional[str] = None, max_size: Optional[int] = None, **kwargs):
+        ModelVariable.__init__(self, name, **kwargs)
+        self._start = start
+        self._mime_type = mime_type
+        self._max_size = max_size
+
+    @property
+    def start(self) -> Optional[Any]:
+        return self._start
+
+    @start.setter
+    def start(self, value: Any):
+        self._start = value
+
+    @property
+    def mime_type(self) -> Optional[str]:
+        return self._mime_type
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self._max_size
+
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
+        attrib = dict()
+        for key, value in (("mimeType", self._mime_type), ("maxSize", self._max_size)):
+            if value is not None:
+                attrib[key] = str(value)
+        parent = self._to_xml(attrib)
+
+        if start is not None:
+            # Binary start values are stored as hexadecimal strings
+            parent.append(Start(bytes(start).hex()).to_xml())
+
+        return parent
+
+
+class Clock(ModelVariable):
+    """Clock variable, its value is True while the clock is active.
+
+    Input clocks trigger the model partition registered with `Fmi3SlaveBase.register_partition`.
+
+    Args:
+        name (str): Variable name
+        interval_variability (:obj:`Fmi3IntervalVariability`): How the clock interval may change
+        interval (float, optional): Clock interval in seconds (`intervalDecimal`)
+        shift (float, optional): Delay of the first tick in seconds (`shiftDecimal`)
+        priority (int, optional): Priority of the clock, lower values have higher priorities
+        can_be_deactivated (bool, optional): Can the importer deactivate the clock
+    """
+    __slots__ = ("_can_be_deactivated", "_priority", "_interval_variability", "_interval_decimal", "_shift_decimal")
+    _type = "Clock"
+
+    def __init__(
+        self,
+        name: str,
+        interval_variability: Fmi3IntervalVariability = Fmi3IntervalVariability.constant,
+        interval: Optional[float] = None,
+        shift: Optional[float] = None,
+        priority: Optional[int] = None,
+        can_be_deactivated: Optional[bool] = None,
+        **kwargs
+    ):
+        kwargs.setdefault("variability", Fmi3Variability.discrete)
+        ModelVariable.__init__(self, name, **kwargs)
+        self._can_be_deactivated = can_be_deactivated
+        self._priority = priority
+        self._interval_variability = interval_variability
+        self._interval_decimal = interval
+        self._shift_decimal = shift
+
+    @property
+    def interval_variability(self) -> Fmi3IntervalVariability:
+        return self._interval_variability
+
+    @property
+    def interval(self) -> Optional[float]:
+        """float or None: Declared clock interval - None if not known before the simulation"""
+        return self._interval_decimal
+
+    def new_state(self) -> "ClockState":
+        """Return the runtime state of the clock for one model instance, see `Fmi3SlaveBase.clock_state`."""
+        return ClockState(self._interval_decimal, self._shift_decimal)
+
+    def to_xml(self) -> Element:
+        attrib = dict()
+        for key, value in (
+            ("canBeDeactivated", self._can_be_deactivated),
+            ("priority", self._priority),
+            ("intervalVariability", self._interval_variability),
+            ("intervalDecimal", self._interval_decimal),
+            ("shiftDecimal", self._shift_decimal),
+        ):
+            if value is not None:
+                if isinstance(value, Enum):
+                    attrib[key] = value.name
+                elif isinstance(value, bool):
+                    attrib[key] = str(value).lower()
+                elif isinstance(value, float):
+                    attrib[key] = f"{value:.16g}"
+                else:
+                    attrib[key] = str(value)
+        return self._to_xml(attrib)
+
+
+class ClockState(object):
+    """Interval and shift of a clock in one model instance.
+
+    Args:
+        interval (float, optional): Initial interval in seconds - None if not yet known
+        shift (float, optional): Delay of the first tick in seconds
+    """
+    __slots__ = ("_interval", "_interval_changed", "shift")
+
+    def __init__(self, interval: Optional[float] = None, shift: Optional[float] = None):
+        self._interval = interval
+        self._interval_changed = False
+        self.shift = shift if shift is not None else 0.0
+
+    @property
+    def interval(self) -> Optional[float]:
+        """float or None: Current clock interval - None if not yet known"""
+        return self._interval
+
+    @interval.setter
+    def interval(self, value: float):
+        # Set by the model, reported as changed on the next interval query
+        self._interval = value
+        self._interval_changed = True
+
+    def set_interval(self, value: float):
+        """Set the interval from the importer, it is not reported back as changed."""
+        self._interval = value
+        self._interval_changed = False
+
+    def pop_interval(self) -> Tuple[float, Fmi3IntervalQualifier]:
+        """Return the current interval and its qualifier, the interval is then considered unchanged."""
+        if self._interval is None:
+            return 0.0, Fmi3IntervalQualifier.intervalNotYetKnown
+        qualifier = Fmi3IntervalQualifier.intervalChanged if self._interval_changed else Fmi3IntervalQualifier.intervalUnchanged
+        self._interval_changed = False
+        return self._interval, qualifier
+
+
 class Enumeration(ModelVariable):
+    __slots__ = ("_start",)
+    _type = "Enumeration"
+
     def __init__(self, name: str, start: Optional[Any] = None, declared_type: Optional[Any] = None, **kwargs):
         super().__init__(name, **kwargs)
-        self.__attrs = {"start": start, "declaredType": declared_type}
-        self._type = "Enumeration"
+        self._start = start
+        self._declared_type = declared_type
 
     @property
     def start(self) -> Optional[Any]:
-        return self.__attrs["start"]
+        return self._start
 
     @start.setter
     def start(self, value: float):
-        self.__attrs["start"] = value
+        self._start = value
 
     @property
     def declared_type(self) -> Optional[Any]:
-        return self.__attrs["declaredType"]
+        return self._declared_type
 
     @declared_type.setter
     def declared_type(self, value: float):
-        self.__attrs["declaredType"] = value
+        self._declared_type = value
 
-    def to_xml(self) -> Element:
+    def to_xml(self, start: Optional[Any] = None) -> Element:
+        start = self._start if start is None else start
         attrib = dict()
-        for key, value in self.__attrs.items():
-            if value is not None:
-                attrib[key] = str(value)
-        self._extras = attrib
-        parent = super().to_xml()
+        if start is not None:
+            attrib["start"] = str(start)
+        parent = self._to_xml(attrib)
 
         return parent
+
+
+class VariableBlock(object):
+    """Elements of a NumPy array exposed as scalar variables with contiguous value references.
+
+    Blocks are created by `Fmi3SlaveBase.register_block`. No variable is stored per element: the element
+    values are read and written by indexing the array and the element variables are only created when
+    the model description is built. The elements of a structured array are numbered field by field.
+
+    Args:
+        name (str): Name of the array, the elements are named `name[i]` (`name[i,j]`...) or `name[i].field`
+        var_type (type): Variable class of the elements, e.g. Float64
+        value_reference (int): Value reference of the first element
+        getter (Callable[[], numpy.ndarray]): Returns the array
+        shape (Tuple[int, ...]): Shape of the array
+        fields (List[str], optional): Registered fields of a structured array
+        **attributes: Arguments of the element variables, e.g. causality
+    """
+    __slots__ = ("name", "var_type", "value_reference", "getter", "shape", "fields", "attributes", "_count")
+
+    def __init__(self, name: str, var_type: type, value_reference: int, getter: Any, shape: Tuple[int, ...], fields: Optional[List[str]] = None, **attributes):
+        self.name = name
+        self.var_type = var_type
+        self.value_reference = value_reference
+        self.getter = getter
+        self.shape = tuple(shape)
+        self.fields = fields
+        self.attributes = attributes
+        # Number of elements per field
+        self._count = reduce(lambda x, n: x * n, self.shape, 1)
+
+    @property
+    def size(self) -> int:
+        """int: Number of value references"""
+        return self._count * len(self.fields or [None])
+
+    def _arrays(self) -> List[Any]:
+        array = self.getter()
+        if self.fields is None:
+            return [array]
+        return [array[field] for field in self.fields]
+
+    def _element_name(self, index: Tuple[int, ...], field: Optional[str]) -> str:
+        name = f"{self.name}[{','.join(map(str, index))}]"
+        return name if field is None else f"{name}.{field}"
+
+    def get(self, index: Any) -> List[Any]:
+        """Values of the elements at the offsets `index` (a NumPy integer array) from the first value reference."""
+        arrays = self._arrays()
+        if len(arrays) == 1:
+            return arrays[0].flat[index].tolist()
+        import numpy as np
+        field, element = np.divmod(index, self._count)
+        if (field == field[0]).all():
+            return arrays[field[0]].flat[element].tolist()
+        values = [None] * len(index)
+        for f in np.unique(field).tolist():
+            positions = np.flatnonzero(field == f)
+            for position, value in zip(positions.tolist(), arrays[f].flat[element[positions]].tolist()):
+                values[position] = value
+        return values
+
+    def set(self, index: Any, values: List[Any]):
+        """Write the elements at the offsets `index` (a NumPy integer array) from the first value reference."""
+        arrays = self._arrays()
+        if len(arrays) == 1:
+            arrays[0].flat[index] = values
+            return
+        import numpy as np
+        values = np.asarray(values)
+        field, element = np.divmod(index, self._count)
+        for f in np.unique(field).tolist():
+            mask = field == f
+            arrays[f].flat[element[mask]] = values[mask]
+
+    def get_all(self) -> List[Any]:
+        """Values of all the elements, in value reference order."""
+        return [value for array in self._arrays() for value in array.ravel().tolist()]
+
+    def set_all(self, values: List[Any]):
+        for i, array in enumerate(self._arrays()):
+            array.flat[:] = values[i * self._count:(i + 1) * self._count]
+
+    def element_names(self) -> Iterator[str]:
+        """Names of the elements, in value reference order."""
+        import numpy as np
+        for field in self.fields or [None]:
+            for index in np.ndindex(*self.shape):
+                yield self._element_name(index, field)
+
+    def variables(self) -> Iterator[ModelVariable]:
+        """Create the element variables, with the current values as start values where required."""
+        import numpy as np
+        vr = self.value_reference
+        for field, array in zip(self.fields or [None], self._arrays()):
+            for index, value in zip(np.ndindex(*self.shape), array.ravel().tolist()):
+                var = self.var_type(self._element_name(index, field), **self.attributes)
+                var.value_reference = vr
+                if ModelVariable.requires_start(var):
+                    var.start = value
+                vr += 1
+                yield var
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name}, type={self.var_type.__name__}, size={self.size})"